@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+bench_char_codec.py
+char 배열 문자열 변환 비교 (목록 이름 15개 + 계획 설명 225개, 한글/영문 혼합 UTF-8)
+  per-char  : 기존 extract_string_from_char_array / set_string_to_char_array (문자 단위 +=, 원소 단위 대입)
+  codec     : aiep_char_codec.decode_chars / write_chars (배열 단위 bytes 변환)
+  rows      : decode_rows (2차원 배열 전체를 한 번에)
+  cached    : PlanModel.list_names + plan_texts (text_version 이 같으면 재사용 - 트리 새로고침)
+- per-char 변환은 UTF-8 바이트를 문자 단위로 chr() 하므로 한글이 깨짐 (변환 비용 비교용으로만 보존)
+
+Usage: python -m Benchmarks.bench_char_codec [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import sys
+import time
+from Communication.aiep_transport import TRANSPORT
+from Communication.aiep_char_codec import decode_chars, decode_rows, write_chars
+from Communication.aiep_plan_model import PlanModel, PLAN_LISTS, PLANS_PER_LIST
+from Benchmarks.bench_plan_model import make_full_plan_list
+
+
+# --- 기존 Show_M_MINE_DroppingPlan 헬퍼 (비교 기준) --------------------------------
+
+def legacy_extract_string(char_array):
+    result = ""
+    for c in char_array:
+        if c == 0 or c == '\0':
+            break
+        result += chr(c) if isinstance(c, int) else c
+    return result
+
+
+def legacy_set_string(char_array, string_value, max_length=50):
+    bytes_data = string_value.encode('utf-8')[:max_length-1]
+    for i in range(max_length):
+        if i < len(bytes_data):
+            char_array[i] = bytes_data[i]
+        else:
+            char_array[i] = 0
+
+# ---------------------------------------------------------------------------
+
+
+def make_sample():
+    sample = make_full_plan_list()
+    for list_index, plan_list in enumerate(sample.stMinePlanList):
+        write_chars(plan_list.chDescription, f"부설계획 목록 {list_index + 1} (동해 구역)")
+        for plan_index, plan in enumerate(plan_list.stPlan):
+            write_chars(plan.cAdditionalText, f"계획 {plan_index + 1}: 자항기뢰 부설 위치 확인")
+    return sample
+
+
+def char_arrays(sample):
+    arrays = []
+    for plan_list in sample.stMinePlanList:
+        arrays.append(plan_list.chDescription)
+        arrays.extend(plan.cAdditionalText for plan in plan_list.stPlan)
+    return arrays
+
+
+def median_us(func, iterations):
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    sample = make_sample()
+    arrays = char_arrays(sample)
+    texts = [decode_chars(a) for a in arrays]
+    model = PlanModel.from_message(sample)
+
+    assert texts[0] == "부설계획 목록 1 (동해 구역)"
+    assert model.list_names()[0] == texts[0] and model.plan_texts(0)[0] == texts[1]
+
+    def cached():
+        model.list_names()
+        for list_index in range(PLAN_LISTS):
+            model.plan_texts(list_index)
+
+    def uncached():
+        model.text_version += 1
+        cached()
+
+    decode = (
+        ("per-char", lambda: [legacy_extract_string(a) for a in arrays]),
+        ("codec", lambda: [decode_chars(a) for a in arrays]),
+        ("rows", lambda: (decode_rows(model.list_field("chDescription")),
+                          [decode_rows(model.list_plans(i)["cAdditionalText"]) for i in range(PLAN_LISTS)])),
+        ("cached", cached),
+    )
+    encode = (
+        ("per-char", lambda: [legacy_set_string(a, t) for a, t in zip(arrays, texts)]),
+        ("codec", lambda: [write_chars(a, t) for a, t in zip(arrays, texts)]),
+    )
+
+    count = PLAN_LISTS * (1 + PLANS_PER_LIST)
+    print(f"transport={TRANSPORT}, {count} char arrays per pass, {iterations} iterations (median)")
+    for kind, cases in (("decode", decode), ("encode", encode)):
+        results = [(name, median_us(func, iterations)) for name, func in cases]
+        base = results[0][1]
+        for name, elapsed in results:
+            print(f"  {kind} {name:9s}: {elapsed:8.1f} us ({base / elapsed:6.1f}x)")
+    print(f"  decode after edit (cache miss): {median_us(uncached, iterations):8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
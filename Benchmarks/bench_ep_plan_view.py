@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+bench_ep_plan_view.py
+튜브 6개 교전계획 창 동시 갱신 비교 - 3D (mplot3d) vs 2D 평면도 (창마다 Agg 캔버스 + EPScene)
+  current : 6개 튜브 모두 현재 위치만 이동 (blit)
+  static  : 6개 튜브 모두 궤적 변경 (전체 draw)
+  first   : 보기 전환 직후 첫 전시 (축 생성 + 전체 draw)
+- 한 tick = 6개 창을 차례로 갱신, 달성 가능한 갱신률 (Hz) = 1000 / tick ms
+- 각 창은 M_MINE 궤적 128점 + 경로점 8개 + PA 16개 (bench_ep_render 와 같은 데이터)
+
+Usage: python -m Benchmarks.bench_ep_plan_view [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import contextlib
+import copy
+import io
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+
+from Benchmarks.bench_ep_render import make_window, make_m_mine_result
+
+TUBE_COUNT = 6
+
+
+def median_ms(func, iterations, setup=None):
+    times = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def run_mode(view_mode, iterations):
+    windows = [make_window(view_mode=view_mode) for _ in range(TUBE_COUNT)]
+    samples = [make_m_mine_result() for _ in windows]
+    step = [0, 0]  # 정적/동적 변경 토글
+
+    def receive(change):
+        # 수신과 같이 창마다 새 샘플 (측정 밖에서 준비)
+        for i in range(len(samples)):
+            samples[i] = copy.deepcopy(samples[i])
+            change(samples[i])
+
+    def tick():
+        kinds = set()
+        for window, ep_data in zip(windows, samples):
+            window._plot_engagement_plan('M_MINE', ep_data)
+            kinds.add(window.scene.last_kind)
+        return kinds
+
+    def move_current(ep_data):
+        ep_data.MslPos.dLatitude = 35.005 + step[1] * 1e-3
+
+    def change_trajectory(ep_data):
+        ep_data.stTrajectories[64].fDepth = 20.0 + step[0]
+
+    def current():
+        step[1] ^= 1
+        receive(move_current)
+
+    def static():
+        step[0] ^= 1
+        receive(change_trajectory)
+
+    def first():
+        for window in windows:
+            window._create_axes()
+        return tick()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        receive(lambda ep_data: None)
+        tick()
+        current()
+        kinds = (tick(),)
+        static()
+        kinds += (tick(),)
+        assert kinds == ({"blit"}, {"full"}), kinds
+        cases = (
+            ("current", tick, current),
+            ("static", tick, static),
+            ("first", first, lambda: receive(lambda ep_data: None)),
+        )
+        return [(name, median_ms(func, iterations, setup)) for name, func, setup in cases]
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{TUBE_COUNT} tube windows, M_MINE 128 trajectory points + 16 PA each, Agg, "
+          f"{iterations} iterations (median per tick)")
+    results = {mode: run_mode(mode, iterations) for mode in ('3D', '2D')}
+    for (name, ms_3d), (_, ms_2d) in zip(results['3D'], results['2D']):
+        print(f"  {name:7s}: 3D {ms_3d:8.2f} ms ({1000.0 / ms_3d:6.1f} Hz) | "
+              f"2D {ms_2d:8.2f} ms ({1000.0 / ms_2d:6.1f} Hz) ({ms_3d / ms_2d:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+bench_ep_render.py
+교전계획 3D 플롯 갱신 비교 (M_MINE 궤적 128점 + 경로점 8개 + PA 16개, Agg 캔버스)
+  rebuild : ax.clear() 후 모든 line/scatter/범례/PA layer 를 새로 만들고 전체 draw (기존 갱신 방식)
+  full    : EPScene 유지, 정적 요소(궤적) 변경 -> artist 데이터만 교체 후 전체 draw
+  blit    : 현재 위치만 이동 -> 저장된 배경 위에 animated artist 만 다시 그림
+  skip    : 데이터 변화 없음 -> draw 생략 (궤적/PA 추출과 비교는 수행)
+  unchanged: _update_plot 에 같은 내용의 샘플 재수신 -> 내용 비교 (field_values) 후 플롯/정보 패널 모두 생략
+- EPPlotWindow 의 _plot_engagement_plan 을 그대로 사용 (Tk 창 없이 Figure + FigureCanvasAgg)
+- 변경은 수신과 같이 매번 새 샘플 (측정 전에 deepcopy 후 수정, 시간은 갱신만) - 궤적 배열은 샘플 객체 단위로 캐시됨
+- PA 원통 생성/전시 비교는 bench_pa_layer
+
+Usage: python -m Benchmarks.bench_ep_render [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import contextlib
+import copy
+import io
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from Communication.aiep_transport import TRANSPORT
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_types import (
+    AIEP_M_MINE_EP_RESULT, CMSHCI_AIEP_PA_INFO, NAVINF_SHIP_NAVIGATION_INFO,
+)
+from Windows.EngagementPlanViewer import EPPlotWindow
+from Windows.EPScene import EPScene
+
+
+def make_m_mine_result():
+    ep_data = AIEP_M_MINE_EP_RESULT()
+    ep_data.unCntTrajectory = len(ep_data.stTrajectories)
+    for i, traj in enumerate(ep_data.stTrajectories):
+        traj.dLatitude, traj.dLongitude, traj.fDepth = 35.0 + i * 1e-4, 129.0 + i * 1e-4, 20.0 + (i % 16)
+    ep_data.unCntWaypoint = len(ep_data.stWaypoints)
+    for i, wp in enumerate(ep_data.stWaypoints):
+        wp.dLatitude, wp.dLongitude, wp.fDepth, wp.bValid = 35.0 + i * 16e-4, 129.0 + i * 16e-4, 30.0, True
+    ep_data.stLaunchPos.dLatitude, ep_data.stLaunchPos.dLongitude = 35.0, 129.0
+    ep_data.stDropPos.dLatitude, ep_data.stDropPos.dLongitude = 35.0127, 129.0127
+    ep_data.bValidMslPos = True
+    ep_data.MslPos.dLatitude, ep_data.MslPos.dLongitude, ep_data.MslPos.fDepth = 35.005, 129.005, 25.0
+    return ep_data
+
+
+def make_pa_info(count=16):
+    pa_info = CMSHCI_AIEP_PA_INFO()
+    pa_info.nCountPA = count
+    for i, pa in enumerate(pa_info.stPaPoint[:count]):
+        pa.dLatitude, pa.dLongitude, pa.dRadius = 35.0 + (i % 4) * 4e-3, 129.0 + (i // 4) * 4e-3, 300.0
+    return pa_info
+
+
+def make_ownship():
+    ownship = NAVINF_SHIP_NAVIGATION_INFO()
+    ownship.stShipMovementInfo.dShipLatitude = 34.999
+    ownship.stShipMovementInfo.dShipLongitude = 128.999
+    return ownship
+
+
+class _Label:
+    """tk.Label stand-in for the info panel"""
+
+    def config(self, text):
+        self.text = text
+
+
+def make_window(pa_count=16, view_mode='3D'):
+    """EPPlotWindow without Tk: Agg figure/canvas + EPScene (tube 1, M_MINE 할당)"""
+    window = object.__new__(EPPlotWindow)
+    window.tube_num = 1
+    window.main_gui = SimpleNamespace(pa_info_data=make_pa_info(pa_count), ownship_info_data=make_ownship(),
+                                      tube_load_info_data={1: 2})
+    window.is_running = True
+    window.winfo_exists = lambda: True
+    window._plot_key = window._plot_refs = window._plot_content = None
+    window.unchanged_updates = 0
+    window.info_labels = {key: _Label() for key in
+                          ("wpn_type", "next_wp", "time_to_wp", "total_time", "remaining_time", "msl_valid", "redraw")}
+    window.view_mode = view_mode
+    window.view_azim, window.view_elev = -60, 30
+    window.scene = None
+    window.fig = Figure(figsize=(10, 6))
+    window.canvas = FigureCanvasAgg(window.fig)
+    window._create_axes()
+    return window
+
+
+def rebuild(window, ep_data):
+    """기존 갱신: ax.clear() 후 전부 새로 생성 (새 scene 으로 재현)"""
+    window.ax.clear()
+    window.scene.disconnect()
+    window.scene = EPScene(window.canvas, window.ax)
+    window._plot_engagement_plan('M_MINE', ep_data)
+
+
+def median_ms(func, iterations, setup=None):
+    times = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    samples = [make_m_mine_result()]
+    window = make_window()
+    step = [0, 0]  # 정적/동적 변경 토글
+
+    def plot():
+        window._plot_engagement_plan('M_MINE', samples[0])
+        return window.scene.last_kind
+
+    def static_change():
+        step[0] ^= 1
+        samples[0] = copy.deepcopy(samples[0])
+        samples[0].stTrajectories[64].fDepth = 20.0 + step[0]
+
+    def dynamic_change():
+        step[1] ^= 1
+        samples[0] = copy.deepcopy(samples[0])
+        samples[0].MslPos.dLatitude = 35.005 + step[1] * 1e-3
+
+    # 구현 확인 (현재 위치 이동은 축 범위 안에서만 blit)
+    with contextlib.redirect_stdout(io.StringIO()):
+        plot()
+        static_change()
+        kinds = (plot(),)
+        dynamic_change()
+        kinds += (plot(), plot())
+    assert kinds == ("full", "blit", "skip"), kinds
+
+    received = []
+
+    def receive_same():
+        received[:] = [copy.deepcopy(samples[0])]
+
+    def republish():
+        MySubscriber.store.put('AIEP_M_MINE_EP_RESULT', 1, received[0])
+        window._update_plot()
+
+    cases = (
+        ("rebuild", lambda: rebuild(window, samples[0]), None),
+        ("full", plot, static_change),
+        ("blit", plot, dynamic_change),
+        ("skip", plot, None),
+        ("unchanged", republish, receive_same),
+    )
+
+    print(f"transport={TRANSPORT}, M_MINE 128 trajectory points + 16 PA, Agg, {iterations} iterations (median)")
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        plot()
+        for name, func, setup in cases:
+            results.append((name, median_ms(func, iterations, setup)))
+    base = results[0][1]
+    for name, elapsed in results:
+        print(f"  {name:9s}: {elapsed:8.2f} ms ({base / elapsed:7.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+bench_loopback.py
+loopback transport 종단간 벤치마크 (RTI 설치 없이 실행)
+- writer.write() -> loopback DataReader -> WaitSet/StatusCondition -> MySubscriber.process_data -> StateStore
+- 토픽별: write 비용(us/sample), 수신 스레드 처리량(samples/s), write -> StateStore 반영 지연(median/p99)
+- 메시지 크기별 비교: PA_INFO (소형), M_MINE_EP_RESULT (128 trajectory), ALL_PLAN_LIST (15x15 plan)
+
+Usage: python -m Benchmarks.bench_loopback [samples]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import sys
+import threading
+import time
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_transport import dds, TRANSPORT
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_types import CMSHCI_AIEP_PA_INFO, AIEP_M_MINE_EP_RESULT, AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST
+
+DOMAIN_ID = 0
+TUBES = 6
+LATENCY_ROUNDS = 200
+
+
+def make_pa_info(i):
+    sample = CMSHCI_AIEP_PA_INFO()
+    sample.nCountPA = 4
+    for pa in sample.stPaPoint[:4]:
+        pa.dLatitude, pa.dLongitude, pa.dRadius = 35.0 + i * 1e-6, 128.0, 1000.0
+    return sample
+
+
+def make_ep_result(i):
+    sample = AIEP_M_MINE_EP_RESULT()
+    sample.enTubeNum = i % TUBES + 1
+    sample.unCntTrajectory = len(sample.stTrajectories)
+    for j, point in enumerate(sample.stTrajectories):
+        point.dLatitude, point.dLongitude, point.fDepth = 35.0 + j * 1e-4, 128.0 + i * 1e-6, 50.0
+    return sample
+
+
+def make_plan_list(i):
+    sample = AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST()
+    sample.usPlanListCnt = len(sample.stMinePlanList)
+    for list_index, plan_list in enumerate(sample.stMinePlanList):
+        plan_list.sListID = list_index + 1
+        for plan in plan_list.stPlan:
+            plan.sListID = list_index + 1
+            plan.stDropPos.dLatitude = 35.0 + i * 1e-6
+    return sample
+
+
+class SubscriberLoop:
+    """run_subscriber 와 같은 WaitSet/StatusCondition 구성, 종료 가능한 수신 스레드"""
+
+    def __init__(self):
+        self.taken = {topic_name: 0 for topic_name in MySubscriber.readers}
+        self._stopped = False
+        self._waitset = dds.WaitSet()
+        for topic_name, reader in MySubscriber.readers.items():
+            condition = dds.StatusCondition(reader)
+            condition.enabled_statuses = dds.StatusMask.DATA_AVAILABLE
+            condition.set_handler(self._make_handler(topic_name, reader))
+            self._waitset += condition
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _make_handler(self, topic_name, reader):
+        def handler(_):
+            self.taken[topic_name] += MySubscriber.process_data(reader, topic_name)
+        return handler
+
+    def _run(self):
+        while not self._stopped:
+            self._waitset.dispatch(dds.Duration.from_milliseconds(100))
+
+    def stop(self):
+        self._stopped = True
+        self._thread.join()
+
+
+def bench_topic(loop, writer, make_sample, samples):
+    """(write us/sample, 처리량 samples/s, 지연 median us, 지연 p99 us) 반환"""
+    topic_name = writer.topic_name
+    messages = [make_sample(i) for i in range(samples)]
+
+    # 처리량: 최대 속도로 write, 수신 스레드가 모두 take 할 때까지
+    loop.taken[topic_name] = 0
+    start = time.perf_counter()
+    for message in messages:
+        writer.write(message)
+    write_elapsed = time.perf_counter() - start
+    while loop.taken[topic_name] < samples:
+        time.sleep(0.0005)
+    total_elapsed = time.perf_counter() - start
+
+    # 지연: 한 건씩 write 후 StateStore 변경 통지까지
+    changes = MySubscriber.store.subscribe_changes()
+    latencies = []
+    for i in range(LATENCY_ROUNDS):
+        message = messages[i % samples]
+        start = time.perf_counter()
+        writer.write(message)
+        while changes.get()[0] != topic_name:
+            pass
+        latencies.append((time.perf_counter() - start) * 1e6)
+
+    latencies.sort()
+    return (write_elapsed * 1e6 / samples, samples / total_elapsed,
+            statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1])
+
+
+def make_writer(message_class):
+    # 시뮬레이터가 publish 하지 않는 AIEP 결과 토픽은 AIEP 쪽 writer 를 직접 생성
+    topic = ParticipantManager.get_topic(message_class.__name__, message_class, dds.TopicQos())
+    return dds.DataWriter(MYPublisher.participant.implicit_publisher, topic)
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    configure_logging("CRITICAL")
+
+    MYPublisher.initialize_participant(DOMAIN_ID)
+    MySubscriber.initialize_participant(DOMAIN_ID)
+    loop = SubscriberLoop()
+
+    scenarios = [
+        ("CMSHCI_AIEP_PA_INFO", MYPublisher.get_writer("CMSHCI_AIEP_PA_INFO"), make_pa_info),
+        ("AIEP_M_MINE_EP_RESULT", make_writer(AIEP_M_MINE_EP_RESULT), make_ep_result),
+        ("AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST", make_writer(AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST), make_plan_list),
+    ]
+
+    print(f"transport={TRANSPORT}, {samples} samples per topic, {LATENCY_ROUNDS} latency rounds")
+    for name, writer, make_sample in scenarios:
+        count = max(1, samples // 10) if name == "AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST" else samples
+        write_us, rate, median_us, p99_us = bench_topic(loop, writer, make_sample, count)
+        print(f"  {name:33s}: write {write_us:8.1f} us/sample, {rate:9.0f} samples/s, "
+              f"latency median {median_us:7.1f} us, p99 {p99_us:7.1f} us")
+
+    loop.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+bench_message_pool.py
+반복 송신 시 메시지 객체 생성 비교: 매번 새 객체 (기존) vs MYPublisher.acquire_message + publish_async(release=True)
+- 메시지별 (WPN_CTRL_CMD, WPN_GEO_WAYPOINTS, EDITED_PLAN_LIST): 값 설정 + publish_async 의 초당 송신 수,
+  publish worker 가 실제 write 한 초당 수 (합치기/거부 제외), 송신 1건당 새로 만든 객체 수, 실행 중 GC 수집 횟수
+- BURST 건씩 보내고 worker 가 큐를 비울 때까지 대기 (큐 가득 참으로 인한 거부 없이 비교)
+- pool 반납은 worker 완료 통지에서 수행 (반납 전에 다음 송신이 오면 새 객체 생성 -> objects/send 에 반영)
+- 수신 reader 없음 (write 직렬화 비용 제외, 송신 버튼/스크립트의 생성/채우기 비용만 비교)
+
+Usage: python -m Benchmarks.bench_message_pool [sends]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import dataclasses
+import gc
+import sys
+import time
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_transport import TRANSPORT
+from Communication.aiep_msg_publisher import MYPublisher
+
+DOMAIN_ID = 0
+TIMEOUT = 60.0
+BURST = 8  # MessagePool 타입별 보관 수와 같게
+
+
+def fill_ctrl_cmd(msg, i):
+    msg.eTubeNum, msg.eWpnKind, msg.eWpnCtrlCmd = i % 6 + 1, 1, 2
+
+
+def fill_geo_waypoints(msg, i):
+    msg.eTubeNum = i % 6 + 1
+    msg.stGeoWaypoints.unCntWaypoints = 8
+    for wp in msg.stGeoWaypoints.stGeoPos[:8]:
+        wp.dLatitude, wp.dLongitude, wp.bValid = 35.0 + i * 1e-6, 128.0, True
+
+
+def fill_plan_list(msg, i):
+    msg.usPlanListCnt = 3
+    for plan_list in msg.stMinePlanList[:3]:
+        for plan in plan_list.stPlan[:5]:
+            plan.stDropPos.dLatitude = 35.0 + i * 1e-6
+
+
+def count_objects(sample):
+    """sample 을 만들 때 생성되는 구조체 / 배열 객체 수"""
+    count = 1
+    for f in dataclasses.fields(sample):
+        value = getattr(sample, f.name)
+        if dataclasses.is_dataclass(value):
+            count += count_objects(value)
+        elif isinstance(value, list):
+            count += 1 + sum(count_objects(v) for v in value if dataclasses.is_dataclass(v))
+    return count
+
+
+class GcCounter:
+    def __init__(self):
+        self.collections = 0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.collections += 1
+
+
+def run(send, sends):
+    """(초당 송신 수, 초당 write 수, GC 수집 횟수): worker 가 큐를 비울 때까지 포함"""
+    worker = MYPublisher.get_worker()
+    sent, dropped = worker.sent, worker.dropped
+    counter = GcCounter()
+    gc.collect()
+    gc.callbacks.append(counter)
+    start = time.perf_counter()
+    for i in range(sends):
+        send(i)
+        if i % BURST == BURST - 1:
+            worker.wait_idle(TIMEOUT)
+    worker.wait_idle(TIMEOUT)
+    elapsed = time.perf_counter() - start
+    gc.callbacks.remove(counter)
+    assert worker.dropped == dropped, "publish queue full"
+    return sends / elapsed, (worker.sent - sent) / elapsed, counter.collections
+
+
+def main():
+    sends = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    configure_logging("CRITICAL")
+    MYPublisher.initialize_participant(DOMAIN_ID, create_writers=True)
+
+    print(f"transport={TRANSPORT}, {sends} sends per case")
+    for name, fill in (("CMSHCI_AIEP_WPN_CTRL_CMD", fill_ctrl_cmd),
+                       ("CMSHCI_AIEP_WPN_GEO_WAYPOINTS", fill_geo_waypoints),
+                       ("CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST", fill_plan_list)):
+        message_class = MYPublisher.message_types[name]
+        objects = count_objects(message_class())
+        count = sends if objects < 1000 else max(1, sends // 20)
+
+        def send_new(i):
+            msg = message_class()
+            fill(msg, i)
+            MYPublisher.publish_async(name, msg)
+
+        def send_pooled(i):
+            msg = MYPublisher.acquire_message(name)
+            fill(msg, i)
+            MYPublisher.publish_async(name, msg, release=True)
+
+        new_rate, new_writes, new_gcs = run(send_new, count)
+        created = MYPublisher.pool.created
+        pooled_rate, pooled_writes, pooled_gcs = run(send_pooled, count)
+        pooled_objects = (MYPublisher.pool.created - created) * objects / count
+
+        print(f"  {name:36s}: new {new_rate:8.0f} sends/s, {new_writes:8.0f} writes/s, {objects:5d} objects/send, "
+              f"{new_gcs:4d} GCs | pool {pooled_rate:8.0f} sends/s, {pooled_writes:8.0f} writes/s, "
+              f"{pooled_objects:7.2f} objects/send, {pooled_gcs:4d} GCs ({pooled_rate / new_rate:.1f}x)")
+
+    MYPublisher.worker.stop(TIMEOUT)
+
+
+if __name__ == "__main__":
+    main()
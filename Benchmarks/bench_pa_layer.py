@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+bench_pa_layer.py
+금지 구역(PA) 원통 전시 비교 (PA 16개, 3D 축 + Agg 캔버스)
+  per-artist : 기존 _plot_prohibited_areas - PA 마다 ax.plot 32개 + plot_surface (아래에 그대로 보존)
+  merged     : build_pa_layer - PA 별 형상 캐시 + Line3DCollection 1개 + Poly3DCollection 1개
+- build : artist 생성 시간 (merged 는 형상 캐시 적중 / 미적중 모두 측정)
+- draw  : 전체 canvas.draw() 시간 (PA 만 있는 축)
+
+Usage: python -m Benchmarks.bench_pa_layer [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import contextlib
+import io
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from Windows.EngagementPlanViewer import build_pa_layer, _pa_geometry_cache
+from Benchmarks.bench_ep_render import make_pa_info
+
+
+# --- 기존 EPPlotWindow._plot_prohibited_areas 원통 생성 (비교 기준) -------------------
+
+def legacy_build(ax, areas):
+    artists = []
+    for i, (center_lon, center_lat, radius_m) in enumerate(areas):
+        radius_deg_lat = radius_m / 111000.0
+        radius_deg_lon = radius_m / (111000.0 * np.cos(np.radians(center_lat)))
+        num_circle_points = 50
+        theta = np.linspace(0, 2*np.pi, num_circle_points)
+        depth_levels = np.linspace(-60, 0, 20)
+        for angle in np.linspace(0, 2*np.pi, 12):
+            edge_lon = center_lon + radius_deg_lon * np.cos(angle)
+            edge_lat = center_lat + radius_deg_lat * np.sin(angle)
+            artists += ax.plot([edge_lon, edge_lon], [edge_lat, edge_lat], [-60, 0],
+                               'r-', linewidth=1, alpha=0.6)
+        for j, depth in enumerate(depth_levels):
+            circle_lons = center_lon + radius_deg_lon * np.cos(theta)
+            circle_lats = center_lat + radius_deg_lat * np.sin(theta)
+            circle_depths = np.full(num_circle_points, depth)
+            if j == 0:
+                artists += ax.plot(circle_lons, circle_lats, circle_depths, 'r-', linewidth=2, alpha=0.9,
+                                   label='Prohibited Area' if i == 0 else '')
+            elif j == len(depth_levels) - 1:
+                artists += ax.plot(circle_lons, circle_lats, circle_depths, 'r-', linewidth=2, alpha=0.9)
+            else:
+                artists += ax.plot(circle_lons, circle_lats, circle_depths, 'r--', linewidth=0.5, alpha=0.4)
+        z_mesh = np.linspace(-60, 0, 10)
+        Theta_mesh, Z_mesh = np.meshgrid(theta, z_mesh)
+        X_mesh = center_lon + radius_deg_lon * np.cos(Theta_mesh)
+        Y_mesh = center_lat + radius_deg_lat * np.sin(Theta_mesh)
+        artists.append(ax.plot_surface(X_mesh, Y_mesh, Z_mesh, alpha=0.15, color='red',
+                                       linewidth=0, antialiased=True))
+    return artists
+
+# ---------------------------------------------------------------------------
+
+
+def make_axes():
+    fig = Figure(figsize=(10, 6))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlim(128.99, 129.03)
+    ax.set_ylim(34.99, 35.03)
+    ax.set_zlim(-70, 10)
+    return canvas, ax
+
+
+def median_ms(func, iterations, setup=None):
+    times = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    pa_info = make_pa_info(16)
+    areas = tuple((pa.dLongitude, pa.dLatitude, pa.dRadius) for pa in pa_info.stPaPoint[:pa_info.nCountPA])
+
+    canvas, ax = make_axes()
+    layer = []
+
+    def rebuild(build):
+        for artist in layer:
+            artist.remove()
+        layer[:] = build(ax, areas)
+
+    print(f"Agg canvas, {len(areas)} PA, {iterations} iterations (median)")
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy_build_ms = median_ms(lambda: rebuild(legacy_build), iterations)
+        legacy_count = len(layer)
+        legacy_draw_ms = median_ms(canvas.draw, iterations)
+
+        miss_ms = median_ms(lambda: rebuild(build_pa_layer), iterations, setup=_pa_geometry_cache.clear)
+        hit_ms = median_ms(lambda: rebuild(build_pa_layer), iterations)
+        merged_count = len(layer)
+        merged_draw_ms = median_ms(canvas.draw, iterations)
+
+    print(f"  artists   : per-artist {legacy_count:5d} | merged {merged_count:5d}")
+    print(f"  build     : per-artist {legacy_build_ms:8.2f} ms | merged {miss_ms:8.2f} ms (cache miss), "
+          f"{hit_ms:8.2f} ms (cache hit) ({legacy_build_ms / hit_ms:.1f}x)")
+    print(f"  draw      : per-artist {legacy_draw_ms:8.2f} ms | merged {merged_draw_ms:8.2f} ms "
+          f"({legacy_draw_ms / merged_draw_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+bench_participant_startup.py
+DDS 기동 비용 비교: publisher/subscriber 별 participant vs 공유 participant
+- separate: 변경 전 구조 (QoS 파일 2회 파싱, DomainParticipant 2개, topic 각자 생성)
+- shared: ParticipantManager (QoS 파일 1회, DomainParticipant 1개, topic 공유)
+- 각 모드를 별도 프로세스에서 실행하고 기동 시간, RSS 증가량, 스레드 증가 수 (DDS 내부 스레드 포함) 측정
+- 의미 있는 수치는 AIEP_TRANSPORT=rti 에서만 나옴: loopback participant 는 스레드/discovery 가 없어
+  두 모드가 같게 (측정 오차 수준으로) 나오며, QoS 파일 1회 파싱 외의 이득은 보여주지 못함
+
+Usage: python -m Benchmarks.bench_participant_startup [domain_id] [repeat]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import subprocess
+import sys
+import time
+
+MODES = ("separate", "shared")
+
+
+def read_proc_status():
+    """(VmRSS KiB, Threads) from /proc/self/status (Linux)."""
+    values = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "Threads"):
+                values[key] = int(value.split()[0])
+    return values["VmRSS"], values["Threads"]
+
+
+def start_separate(domain_id):
+    """변경 전 initialize_participant 흐름을 그대로 재현 (publisher, subscriber 각각)"""
+    import xml.etree.ElementTree as ET
+    from Communication.aiep_transport import dds
+    from Communication.aiep_msg_publisher import MYPublisher
+    from Communication.aiep_msg_subscriber import MySubscriber
+
+    entities = []
+    sides = [(MYPublisher.message_classes, dds.DataWriter, "implicit_publisher"),
+             (list(MySubscriber.handlers), dds.DataReader, "implicit_subscriber")]
+    for message_classes, entity_type, implicit in sides:
+        qos_mapping = {}
+        try:
+            provider = dds.QosProvider("file://MY_QOS_PROFILES.xml")
+            for profile in ET.parse("MY_QOS_PROFILES.xml").getroot().findall('.//qos_profile'):
+                if profile.get('name') and profile.get('base_name'):
+                    qos_mapping[profile.get('name')] = profile.get('base_name')
+            participant = dds.DomainParticipant(
+                domain_id, qos=provider.participant_qos_from_profile("k1pqos::ParticipantQos"))
+        except Exception:
+            participant = dds.DomainParticipant(domain_id)
+
+        topics = {}
+        for message_class in message_classes:
+            name = message_class.__name__
+            if name not in topics:
+                topics[name] = dds.Topic(participant, name, message_class)
+            entities.append(entity_type(getattr(participant, implicit), topics[name]))
+        entities.append(participant)
+    return entities
+
+
+def start_shared(domain_id):
+    from Communication.aiep_msg_publisher import MYPublisher
+    from Communication.aiep_msg_subscriber import MySubscriber
+
+    MYPublisher.initialize_participant(domain_id)
+    MySubscriber.initialize_participant(domain_id)
+    # writer 는 지연 생성 -> separate 와 같은 엔티티 수로 비교하기 위해 모두 생성
+    MYPublisher.create_all_topics_and_writers()
+
+
+def measure(mode, domain_id):
+    """한 프로세스에서 mode 기동 -> (기동 ms, RSS 증가 KiB, 스레드 증가 수)"""
+    from Communication.aiep_logger import configure_logging
+    import Communication.aiep_msg_subscriber  # noqa: F401 (import 비용은 측정에서 제외)
+    configure_logging("CRITICAL")
+
+    rss_before, threads_before = read_proc_status()
+    start = time.perf_counter()
+    keep_alive = start_separate(domain_id) if mode == "separate" else start_shared(domain_id)
+    elapsed = time.perf_counter() - start
+    rss_after, threads_after = read_proc_status()
+    del keep_alive
+    return elapsed * 1000, rss_after - rss_before, threads_after - threads_before
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(*measure(sys.argv[2], int(sys.argv[3])))
+        return
+
+    domain_id = sys.argv[1] if len(sys.argv) > 1 else "83"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"transport={os.environ['AIEP_TRANSPORT']}, domain {domain_id}, {repeat} runs per mode (median)")
+    for mode in MODES:
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, "-m", "Benchmarks.bench_participant_startup",
+                                     "--child", mode, domain_id],
+                                    capture_output=True, text=True, check=True).stdout
+            runs.append([float(value) for value in output.split()])
+        startup_ms, rss_kib, threads = (statistics.median(column) for column in zip(*runs))
+        print(f"  {mode:8s}: startup {startup_ms:8.1f} ms, RSS +{rss_kib / 1024:6.1f} MiB, threads +{threads:.0f}")
+    if os.environ["AIEP_TRANSPORT"] == "loopback":
+        print("  (loopback participant 는 스레드/discovery 가 없음 - 절감량은 AIEP_TRANSPORT=rti 에서 측정)")
+
+
+if __name__ == "__main__":
+    main()
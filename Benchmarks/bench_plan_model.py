@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+bench_plan_model.py
+부설계획 편집 연산 비교: 메시지 객체 직접 편집 (기존 창) vs PlanModel 배열 (aiep_plan_model)
+- open   : 창 열기 시 복사 (legacy per-attribute 복사 vs from_message)
+  new sample: 새로 받은 샘플 (모든 객체의 필드 읽기), reopen: 같은 샘플로 다시 열기 (보관한 배열 복사)
+- read floor: 모든 구조체 객체의 필드 값을 한 번씩 읽기만 하는 시간 (새 샘플 복사의 하한)
+- scan   : 목록 창 갱신 (15개 목록의 빈 슬롯 판별 + 계획 수) - 편집할 때마다 반복
+- reorder: sListID 재정렬
+- insert/delete: 목록 삽입 후 삭제 (슬롯 참조 이동 + 슬롯 reset vs 배열 slice 이동)
+- wp delete: 자함 변침점 첫 항목 삭제 (40개 당기기)
+- send   : EDITED_PLAN_LIST 생성 (기존 _save_and_send 의 생성 + 속성 복사 vs to_message)
+  all lists: 모든 목록이 바뀐 뒤 (전체 생성), 1 edit: 계획 하나만 바꾼 뒤 (바뀐 목록만 생성)
+- 모든 슬롯을 채운 최대 크기 데이터 (make_full_plan_list)
+- DISPLAY 가 있으면 실제 DroppingPlanListWindow 를 열고 닫는 시간도 측정
+
+Usage: python -m Benchmarks.bench_plan_model [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import copy
+import statistics
+import sys
+import time
+from Communication.aiep_transport import TRANSPORT
+from Communication.aiep_plan_model import PlanModel, PLAN_LISTS
+from Communication.aiep_types import AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
+
+
+def make_full_plan_list():
+    sample = AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST()
+    sample.usPlanListCnt = len(sample.stMinePlanList)
+    for list_index, plan_list in enumerate(sample.stMinePlanList):
+        plan_list.chDescription[:] = list(f"List {list_index + 1:02d} ".encode().ljust(49, b"x")) + [0]
+        plan_list.sListID = list_index + 1
+        plan_list.usOwnshipWaypointCnt = len(plan_list.stOwnshipWaypoint)
+        for plan_index, plan in enumerate(plan_list.stPlan):
+            plan.sListID = list_index + 1
+            plan.usDroppingPlanNumber = plan_index + 1
+            plan.cAdditionalText[:] = list(b"note".ljust(49, b"y")) + [0]
+            plan.usWaypointCnt = len(plan.stWaypoint)
+            plan.stDropPos.dLatitude = 35.0 + plan_index * 1e-3
+            for wp_index, wp in enumerate(plan.stWaypoint):
+                wp.dLatitude, wp.dLongitude, wp.bValid = 35.0 + wp_index * 1e-4, 128.0, True
+        for wp_index, wp in enumerate(plan_list.stOwnshipWaypoint):
+            wp.dLatitude, wp.dLongitude, wp.usListID = 35.0 + wp_index * 1e-4, 128.0, list_index + 1
+    return sample
+
+
+# --- 기존 창의 복사/편집 코드 (비교 기준) -------------------------------------------
+
+def legacy_deep_copy(source):
+    copied = AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST()
+    copied.usPlanListCnt = source.usPlanListCnt
+    for i in range(15):
+        src_list = source.stMinePlanList[i]
+        dst_list = copied.stMinePlanList[i]
+        for j in range(50):
+            dst_list.chDescription[j] = src_list.chDescription[j]
+        dst_list.sListID = src_list.sListID
+        dst_list.usOwnshipWaypointCnt = src_list.usOwnshipWaypointCnt
+        for j in range(15):
+            legacy_copy_plan_info(src_list.stPlan[j], dst_list.stPlan[j])
+        for j in range(40):
+            legacy_copy_ownship_waypoint(src_list.stOwnshipWaypoint[j], dst_list.stOwnshipWaypoint[j])
+    return copied
+
+
+def legacy_copy_plan_info(src, dst):
+    dst.sListID = src.sListID
+    dst.usDroppingPlanNumber = src.usDroppingPlanNumber
+    dst.ePlanState = src.ePlanState
+    dst.usWeaponID = src.usWeaponID
+    for i in range(50):
+        dst.cAdditionalText[i] = src.cAdditionalText[i]
+    legacy_copy_waypoint(src.stDropPos, dst.stDropPos)
+    legacy_copy_waypoint(src.stLaunchPos, dst.stLaunchPos)
+    dst.usWaypointCnt = src.usWaypointCnt
+    for i in range(8):
+        legacy_copy_waypoint(src.stWaypoint[i], dst.stWaypoint[i])
+
+
+def legacy_copy_waypoint(src, dst):
+    dst.dLatitude = src.dLatitude
+    dst.dLongitude = src.dLongitude
+    dst.fDepth = src.fDepth
+    dst.fSpeed = src.fSpeed
+    dst.bValid = src.bValid
+
+
+def legacy_copy_ownship_waypoint(src, dst):
+    dst.dLatitude = src.dLatitude
+    dst.dLongitude = src.dLongitude
+    dst.fDepth = src.fDepth
+    dst.fSpeed = src.fSpeed
+    dst.fHeading = src.fHeading
+    dst.bLaunchPoint = src.bLaunchPoint
+    dst.usListID = src.usListID
+
+
+def legacy_extract_string(char_array):
+    result = ""
+    for c in char_array:
+        if c == 0 or c == '\0':
+            break
+        result += chr(c) if isinstance(c, int) else c
+    return result
+
+
+def legacy_is_plan_list_empty(plan_list):
+    if legacy_extract_string(plan_list.chDescription).strip():
+        return False
+    if plan_list.sListID == 0:
+        return True
+    return not any(plan_list.stPlan[i].sListID != 0 for i in range(15))
+
+
+def legacy_scan(plan_data):
+    rows = []
+    for plan_list in plan_data.stMinePlanList:
+        if legacy_is_plan_list_empty(plan_list):
+            rows.append(None)
+        else:
+            count = sum(1 for p in plan_list.stPlan if not (p.sListID == 0 and p.usDroppingPlanNumber == 0))
+            rows.append((legacy_extract_string(plan_list.chDescription), plan_list.sListID, count))
+    return rows
+
+
+def legacy_reorder(plan_data):
+    current_id = 1
+    for plan_list in plan_data.stMinePlanList:
+        if legacy_is_plan_list_empty(plan_list):
+            plan_list.sListID = 0
+        else:
+            plan_list.sListID = current_id
+            current_id += 1
+    plan_data.usPlanListCnt = current_id - 1
+
+
+def legacy_clear_waypoint(wp):
+    wp.dLatitude = 0.0
+    wp.dLongitude = 0.0
+    wp.fDepth = 0.0
+    wp.fSpeed = 0.0
+    wp.bValid = 0
+
+
+def legacy_clear_plan_list(plan_list):
+    for i in range(50):
+        plan_list.chDescription[i] = 0
+    plan_list.sListID = 0
+    plan_list.usOwnshipWaypointCnt = 0
+    for plan_info in plan_list.stPlan:
+        plan_info.sListID = 0
+        plan_info.usDroppingPlanNumber = 0
+        plan_info.ePlanState = 0
+        plan_info.usWeaponID = 0
+        for i in range(50):
+            plan_info.cAdditionalText[i] = 0
+        legacy_clear_waypoint(plan_info.stDropPos)
+        legacy_clear_waypoint(plan_info.stLaunchPos)
+        plan_info.usWaypointCnt = 0
+        for wp in plan_info.stWaypoint:
+            legacy_clear_waypoint(wp)
+    for wp in plan_list.stOwnshipWaypoint:
+        wp.dLatitude = 0.0
+        wp.dLongitude = 0.0
+        wp.fDepth = 0.0
+        wp.fSpeed = 0.0
+        wp.fHeading = 0.0
+        wp.bLaunchPoint = 0
+        wp.usListID = 0
+
+
+def legacy_insert_delete(plan_data, index):
+    slots = plan_data.stMinePlanList
+    new_list = slots[-1]
+    slots[index:] = [new_list] + slots[index:-1]
+    legacy_clear_plan_list(new_list)
+    legacy_reorder(plan_data)
+
+    removed = slots[index]
+    slots[index:] = slots[index + 1:] + [removed]
+    legacy_clear_plan_list(removed)
+    legacy_reorder(plan_data)
+
+
+def legacy_delete_ownship_waypoint(plan_list, wp_index):
+    for i in range(wp_index, 39):
+        src = plan_list.stOwnshipWaypoint[i + 1]
+        dst = plan_list.stOwnshipWaypoint[i]
+        dst.dLatitude = src.dLatitude
+        dst.dLongitude = src.dLongitude
+        dst.fDepth = src.fDepth
+        dst.fSpeed = src.fSpeed
+        dst.fHeading = src.fHeading
+        dst.bLaunchPoint = src.bLaunchPoint
+        dst.usListID = src.usListID
+    last_wp = plan_list.stOwnshipWaypoint[39]
+    last_wp.dLatitude = last_wp.dLongitude = last_wp.fDepth = last_wp.fSpeed = last_wp.fHeading = 0.0
+    last_wp.bLaunchPoint = False
+    last_wp.usListID = 0
+    plan_list.usOwnshipWaypointCnt -= 1
+
+
+def legacy_send(plan_data):
+    # 기존 _save_and_send: 새 메시지 생성 후 목록 15개를 속성 단위로 복사
+    edited_msg = CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST()
+    edited_msg.usPlanListCnt = plan_data.usPlanListCnt
+    for i in range(15):
+        src = plan_data.stMinePlanList[i]
+        dst = edited_msg.stMinePlanList[i]
+        for j in range(50):
+            dst.chDescription[j] = src.chDescription[j]
+        dst.sListID = src.sListID
+        dst.usOwnshipWaypointCnt = src.usOwnshipWaypointCnt
+        for j in range(15):
+            legacy_copy_plan_info(src.stPlan[j], dst.stPlan[j])
+        for j in range(40):
+            legacy_copy_ownship_waypoint(src.stOwnshipWaypoint[j], dst.stOwnshipWaypoint[j])
+    return edited_msg
+
+# ---------------------------------------------------------------------------
+
+
+def model_scan(model):
+    empty = model.list_empty_mask()
+    counts = model.valid_plan_counts().tolist()
+    list_ids = model.list_field("sListID").tolist()
+    return [None if empty[i] else (model.list_name(i), list_ids[i], counts[i]) for i in range(len(empty))]
+
+
+def model_insert_delete(model, index):
+    model.insert_list(index, "")
+    model.reorder_list_ids()
+    model.delete_list(index)
+    model.reorder_list_ids()
+
+
+def model_delete_ownship_waypoint(model, wp_index):
+    model.delete_ownship_waypoint(0, wp_index)
+    model.list_slot(0)["usOwnshipWaypointCnt"] += 1
+
+
+def legacy_wp_delete(plan_data):
+    legacy_delete_ownship_waypoint(plan_data.stMinePlanList[0], 0)
+    plan_data.stMinePlanList[0].usOwnshipWaypointCnt += 1
+
+
+def edit_lists(model, count):
+    # 앞의 count 개 목록에서 계획 하나씩 수정 (to_message 가 해당 목록을 새로 생성하도록)
+    for list_index in range(count):
+        model.plan(list_index, 0)["usWeaponID"] += 1
+
+
+def read_every_object(source):
+    """복사 하한: 모든 구조체 객체의 필드 값을 한 번씩 읽기"""
+    for plan_list in source.stMinePlanList:
+        tuple(vars(plan_list).values())
+        for plan in plan_list.stPlan:
+            tuple(vars(plan).values())
+            for wp in plan.stWaypoint:
+                tuple(vars(wp).values())
+        for wp in plan_list.stOwnshipWaypoint:
+            tuple(vars(wp).values())
+
+
+def median_us(func, iterations, setup=None):
+    times = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def bench_window(source, iterations):
+    """실제 창 열기/닫기 (DISPLAY 필요)"""
+    import tkinter as tk
+    from Communication.aiep_msg_publisher import MYPublisher
+    from Windows.Show_M_MINE_DroppingPlan import DroppingPlanListWindow
+
+    root = tk.Tk()
+    root.withdraw()
+
+    def open_window():
+        window = DroppingPlanListWindow(root, MYPublisher, source)
+        window.update_idletasks()
+        window.destroy()
+
+    result = median_us(open_window, iterations)
+    root.destroy()
+    return result
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = make_full_plan_list()
+    plan_data = legacy_deep_copy(source)
+    model = PlanModel.from_message(source)
+
+    assert model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST).stMinePlanList == source.stMinePlanList
+    edit_lists(model, PLAN_LISTS)
+    assert PlanModel.from_message(model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)).list_plans(0)[0] == model.plan(0, 0)
+    assert model_scan(model) == legacy_scan(plan_data)
+
+    def send():
+        return model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+
+    received = [source]
+
+    def receive():
+        # 새 샘플 수신 (from_message 의 보관 배열을 쓰지 않도록)
+        received[0] = copy.deepcopy(source)
+
+    cases = (
+        # (이름, 기존, PlanModel, 기존 setup, PlanModel setup)
+        ("open new sample", lambda: legacy_deep_copy(received[0]), lambda: PlanModel.from_message(received[0]),
+         receive, receive),
+        ("read floor", lambda: legacy_deep_copy(received[0]), lambda: read_every_object(received[0]), receive, receive),
+        ("reopen", lambda: legacy_deep_copy(source), lambda: PlanModel.from_message(source), None, None),
+        ("scan", lambda: legacy_scan(plan_data), lambda: model_scan(model), None, None),
+        ("reorder", lambda: legacy_reorder(plan_data), lambda: model.reorder_list_ids(), None, None),
+        ("insert/delete", lambda: legacy_insert_delete(plan_data, 0), lambda: model_insert_delete(model, 0), None, None),
+        ("wp delete", lambda: legacy_wp_delete(plan_data), lambda: model_delete_ownship_waypoint(model, 0), None, None),
+        ("send all lists", lambda: legacy_send(plan_data), send, None, lambda: edit_lists(model, PLAN_LISTS)),
+        ("send 1 edit", lambda: legacy_send(plan_data), send, None, lambda: edit_lists(model, 1)),
+    )
+
+    print(f"transport={TRANSPORT}, all 15 plan list slots full, {iterations} iterations (median)")
+    for name, legacy, array, legacy_setup, setup in cases:
+        legacy_us = median_us(legacy, iterations, legacy_setup)
+        array_us = median_us(array, iterations, setup)
+        print(f"  {name:15s}: objects {legacy_us:8.1f} us | PlanModel {array_us:8.1f} us ({legacy_us / array_us:.1f}x)")
+
+    if os.environ.get("DISPLAY"):
+        print(f"  open DroppingPlanListWindow: {bench_window(source, max(1, iterations // 20)) / 1000:7.2f} ms")
+    else:
+        print("  (no DISPLAY: window open time not measured)")
+
+
+if __name__ == "__main__":
+    main()
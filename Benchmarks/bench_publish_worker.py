@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+bench_publish_worker.py
+GUI 송신 버튼의 Tk 스레드 점유 시간 비교: MYPublisher.publish (직접 write) vs publish_async (PublishWorker)
+- 송신 1건: 호출 스레드가 반환될 때까지의 시간 (median / max)
+- 연속 송신 (버튼 연타): EDITED_PLAN_LIST 를 burst 로 보낼 때 호출 스레드 합계 시간, 실제 write 수 (합치기 효과)
+- 수신 reader 를 붙여 write 시 직렬화 비용이 발생하도록 함
+
+Usage: python -m Benchmarks.bench_publish_worker [sends]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import sys
+import time
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_transport import dds, TRANSPORT
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_types import CMSHCI_AIEP_PA_INFO, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
+
+DOMAIN_ID = 0
+BURST = 20
+
+
+def make_plan_list():
+    sample = CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST()
+    sample.usPlanListCnt = len(sample.stMinePlanList)
+    for list_index, plan_list in enumerate(sample.stMinePlanList):
+        plan_list.sListID = list_index + 1
+        for plan in plan_list.stPlan:
+            plan.sListID = list_index + 1
+    return sample
+
+
+def make_reader(message_name):
+    topic = ParticipantManager.topics[message_name]
+    return dds.DataReader(MYPublisher.participant.implicit_subscriber, topic)
+
+
+def caller_times(send, make_sample, sends):
+    """호출 스레드 점유 시간 (us) 목록"""
+    times = []
+    for _ in range(sends):
+        sample = make_sample()
+        start = time.perf_counter()
+        send(sample)
+        times.append((time.perf_counter() - start) * 1e6)
+    return times
+
+
+def main():
+    sends = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    configure_logging("CRITICAL")
+
+    MYPublisher.initialize_participant(DOMAIN_ID, create_writers=True)
+    worker = MYPublisher.get_worker()
+    readers = {name: make_reader(name) for name in ("CMSHCI_AIEP_PA_INFO", "CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST")}
+
+    print(f"transport={TRANSPORT}, {sends} sends per case (caller thread time)")
+    for name, make_sample in (("CMSHCI_AIEP_PA_INFO", CMSHCI_AIEP_PA_INFO),
+                              ("CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST", make_plan_list)):
+        sync = caller_times(lambda sample: MYPublisher.publish(name, sample), make_sample, sends)
+
+        # 한 건씩: 다음 송신 전에 worker 완료를 기다림 (합치기 제외)
+        async_times = []
+        for _ in range(sends):
+            sample = make_sample()
+            start = time.perf_counter()
+            MYPublisher.publish_async(name, sample)
+            async_times.append((time.perf_counter() - start) * 1e6)
+            worker.wait_idle()
+        readers[name].take()
+
+        print(f"  {name:36s}: publish median {statistics.median(sync):8.1f} us (max {max(sync):8.1f}), "
+              f"publish_async median {statistics.median(async_times):6.1f} us (max {max(async_times):6.1f})")
+
+    # 버튼 연타: BURST 건 연속 송신
+    name = "CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST"
+    samples = [make_plan_list() for _ in range(BURST)]
+    reader = readers[name]
+
+    start = time.perf_counter()
+    for sample in samples:
+        MYPublisher.publish(name, sample)
+    sync_ms = (time.perf_counter() - start) * 1000
+    sync_written = len(reader.take())
+
+    start = time.perf_counter()
+    for sample in samples:
+        MYPublisher.publish_async(name, sample)
+    async_ms = (time.perf_counter() - start) * 1000
+    worker.wait_idle()
+    idle_ms = (time.perf_counter() - start) * 1000
+    async_written = len(reader.take())
+
+    print(f"  burst of {BURST} EDITED_PLAN_LIST: publish {sync_ms:7.1f} ms on caller, {sync_written} written; "
+          f"publish_async {async_ms:5.2f} ms on caller, {async_written} written "
+          f"({worker.superseded} superseded, idle after {idle_ms:.1f} ms)")
+    worker.stop()
+
+
+if __name__ == "__main__":
+    main()
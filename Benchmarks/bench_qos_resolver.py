@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+bench_qos_resolver.py
+QoS resolve 비용 비교: topic 마다 *_qos_from_profile vs QosResolver (base profile 별 캐시)
+- MYPublisher 송신 13 topic + MySubscriber 수신 10 topic, base profile 3개를 쓰는 임시 MY_QOS_PROFILES.xml 생성
+- participant 생성 + topic + writer/reader 생성까지의 bring-up 시간 (median) 과 from_profile 호출 수 비교
+  per-topic     : 파일 1회 파싱, topic 마다 topic/writer(reader) QoS 를 provider 에서 resolve (변경 전)
+  resolver cold : QosResolver.load() 직후 (캐시 비어 있음)
+  resolver warm : 캐시가 채워진 상태 (재기동, lazy writer 생성 등)
+
+Usage: python -m Benchmarks.bench_qos_resolver [iterations]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_transport import dds, TRANSPORT
+from Communication.aiep_qos import QosResolver
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_msg_subscriber import MySubscriber
+
+DOMAIN_ID = 0
+BASE_PROFILES = ["k1pqos::ReliableQos", "k1pqos::BestEffortQos", "k1pqos::LargeDataQos"]
+
+WRITER_CLASSES = list(MYPublisher.message_types.values())
+READER_CLASSES = list(MySubscriber.handlers)
+
+
+def write_qos_file(path):
+    profiles = ['<qos_profile name="ParticipantQos"><domain_participant_qos/></qos_profile>']
+    profiles += [f'<qos_profile name="{base.split("::")[1]}"><datawriter_qos/><datareader_qos/></qos_profile>'
+                 for base in BASE_PROFILES]
+    for i, message_class in enumerate(WRITER_CLASSES + READER_CLASSES):
+        profiles.append(f'<qos_profile name="{message_class.__name__}" '
+                        f'base_name="{BASE_PROFILES[i % len(BASE_PROFILES)]}"/>')
+    with open(path, "w") as f:
+        f.write('<dds><qos_library name="k1pqos">' + "".join(profiles) + '</qos_library></dds>')
+
+
+class CountingProvider:
+    """provider 의 *_qos_from_profile 호출 횟수를 세는 wrapper"""
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.calls = 0
+
+    def __getattr__(self, name):
+        method = getattr(self.provider, name)
+
+        def counted(profile):
+            self.calls += 1
+            return method(profile)
+        return counted
+
+
+def bring_up(get_qos):
+    """participant + topics + 13 writers + 10 readers 생성"""
+    participant = dds.DomainParticipant(DOMAIN_ID, qos=get_qos("participant", None))
+    topics = {}  # 송수신 양쪽에서 쓰는 topic 은 하나만 생성 (ParticipantManager 와 동일)
+    for message_classes, kind, entity_type, implicit in [
+            (WRITER_CLASSES, "datawriter", dds.DataWriter, participant.implicit_publisher),
+            (READER_CLASSES, "datareader", dds.DataReader, participant.implicit_subscriber)]:
+        for message_class in message_classes:
+            name = message_class.__name__
+            topic = topics.get(name)
+            if topic is None:
+                topic = topics[name] = dds.Topic(participant, name, message_class, qos=get_qos("topic", name))
+            entity_type(implicit, topic, qos=get_qos(kind, name))
+    return participant
+
+
+def run_per_topic(path):
+    provider = CountingProvider(dds.QosProvider(f"file://{path}"))
+    mapping = {p.get('name'): p.get('base_name') for p in ET.parse(path).getroot().findall('.//qos_profile')
+               if p.get('base_name')}
+
+    def get_qos(kind, name):
+        if kind == "participant":
+            return provider.participant_qos_from_profile("k1pqos::ParticipantQos")
+        return getattr(provider, f"{kind}_qos_from_profile")(mapping[name])
+
+    return bring_up(get_qos), provider.calls
+
+
+def run_resolver(path, cold):
+    if cold:
+        QosResolver.load(path)
+    calls_before = QosResolver.resolve_calls
+
+    def get_qos(kind, name):
+        if kind == "participant":
+            return QosResolver.participant_qos("k1pqos::ParticipantQos")
+        return getattr(QosResolver, f"{kind}_qos")(name)
+
+    return bring_up(get_qos), QosResolver.resolve_calls - calls_before
+
+
+def measure(iterations, scenario):
+    times, calls = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        participant, calls = scenario()
+        times.append((time.perf_counter() - start) * 1000)
+        if hasattr(participant, "close"):
+            participant.close()
+    return statistics.median(times), calls
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    configure_logging("CRITICAL")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "MY_QOS_PROFILES.xml")
+        write_qos_file(path)
+
+        results = [
+            ("per-topic", measure(iterations, lambda: run_per_topic(path))),
+            ("resolver cold", measure(iterations, lambda: run_resolver(path, cold=True))),
+            ("resolver warm", measure(iterations, lambda: run_resolver(path, cold=False))),
+        ]
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            QosResolver.reload_if_changed()
+        reload_check_us = (time.perf_counter() - start) * 1000
+
+    print(f"transport={TRANSPORT}, {len(WRITER_CLASSES)} writer + {len(READER_CLASSES)} reader topics, "
+          f"{len(BASE_PROFILES)} base profiles, {iterations} iterations (median)")
+    for name, (bring_up_ms, calls) in results:
+        print(f"  {name:14s}: bring-up {bring_up_ms:7.2f} ms, {calls:3d} from_profile calls")
+    print(f"  reload_if_changed (unchanged file): {reload_check_us:.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
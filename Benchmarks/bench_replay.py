@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+bench_replay.py
+캡처 파일을 최대 속도로 재생하여 수신 처리 경로의 초당 샘플 수 측정
+- no GUI     : 캡처 읽기 -> MySubscriber.process_data -> decode -> StateStore 까지 (중계 송신 없음)
+- end-to-end : 위 경로 + ChangeNotifier.drain() -> 튜브 6개 EPPlotWindow 갱신 (Tk 없이 Agg 캔버스, 3D / 2D)
+  샘플마다 drain (Tk 에서는 50 ms 마다 합쳐서 통지하므로 최악의 경우)
+- CAPTURE_PATH 를 주지 않으면 M_MINE 교전계획 결과 (튜브 6개, 현재 위치 이동 + 가끔 궤적 변경) 를 임시 캡처로 만들어 사용
+
+Usage: python -m Benchmarks.bench_replay [CAPTURE_PATH] [samples per tube]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import contextlib
+import copy
+import io
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import matplotlib
+matplotlib.use("Agg")
+
+from Communication.aiep_capture import CaptureWriter
+from Communication.aiep_change_notifier import ChangeNotifier
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_replay import ReplayDriver
+from Benchmarks.bench_ep_render import make_window, make_m_mine_result, make_pa_info, make_ownship
+
+TUBE_COUNT = 6
+TRAJECTORY_CHANGE_EVERY = 10  # 이 샘플 수마다 궤적 변경 (나머지는 현재 위치만 이동)
+
+
+def write_session(directory, samples_per_tube):
+    """튜브별 M_MINE 교전계획 결과를 번갈아 수신한 세션 캡처"""
+    writer = CaptureWriter(directory)
+    samples = []
+    for tube in range(1, TUBE_COUNT + 1):
+        ep_data = make_m_mine_result()
+        ep_data.enTubeNum = tube
+        samples.append(ep_data)
+    for step in range(samples_per_tube):
+        for tube, ep_data in enumerate(samples):
+            ep_data = samples[tube] = copy.deepcopy(ep_data)
+            ep_data.MslPos.dLatitude = 35.005 + (step % 8) * 1e-3
+            if step % TRAJECTORY_CHANGE_EVERY == 0:
+                ep_data.stTrajectories[64].fDepth = 20.0 + (step // TRAJECTORY_CHANGE_EVERY) % 2
+            writer.record("AIEP_M_MINE_EP_RESULT", ep_data, timestamp=step * 0.1)
+    writer.close()
+
+
+def replay_with_viewer(path, view_mode):
+    """튜브 6개 창을 notifier 에 연결하고 drain 하며 재생"""
+    MySubscriber.store.clear()
+    notifier = ChangeNotifier(None, MySubscriber.store)
+    main_gui = SimpleNamespace(notifier=notifier, pa_info_data=make_pa_info(), ownship_info_data=make_ownship(),
+                               tube_load_info_data={tube: 2 for tube in range(1, TUBE_COUNT + 1)})
+    windows = []
+    for tube in range(1, TUBE_COUNT + 1):
+        window = make_window(view_mode=view_mode)
+        window.tube_num = tube
+        window.main_gui = main_gui
+        window._start_plot_update()
+        windows.append(window)
+
+    driver = ReplayDriver(path, 0, pump=notifier.drain)
+    with contextlib.redirect_stdout(io.StringIO()):
+        driver.run()
+    full = sum(window.scene.stats["full"][0] for window in windows)
+    blit = sum(window.scene.stats["blit"][0] for window in windows)
+    return driver, full, blit
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    samples_per_tube = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    # 수신 로그는 생략하고 결과만 출력
+    configure_logging("WARNING")
+
+    with tempfile.TemporaryDirectory() as directory:
+        if path is None:
+            write_session(directory, samples_per_tube)
+            path = directory
+
+        MySubscriber.store.clear()
+        driver = ReplayDriver(path, 0)
+        rate = driver.run()
+        print(f"{driver.samples_replayed} samples, max speed")
+        print(f"  no GUI            : {rate:9.0f} samples/s (read + deserialize + decode + store; "
+              f"decode + store {driver.decode_rate:.0f} samples/s)")
+        for topic_name, skipped in MySubscriber.skipped_samples.items():
+            if MySubscriber.take_calls.get(topic_name):
+                print(f"    {topic_name}: {MySubscriber.take_calls[topic_name]} takes, {skipped} skipped")
+
+        for view_mode in ('3D', '2D'):
+            driver, full, blit = replay_with_viewer(path, view_mode)
+            print(f"  end-to-end ({view_mode})   : {driver.samples_replayed / driver.elapsed:9.1f} samples/s "
+                  f"({TUBE_COUNT} EP windows; decode + store {driver.decode_rate:.0f} samples/s, "
+                  f"GUI {driver.pump_elapsed:.2f} s: {full} full draws, {blit} blits)")
+
+
+if __name__ == "__main__":
+    main()
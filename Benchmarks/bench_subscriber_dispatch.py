@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+bench_subscriber_dispatch.py
+Subscriber 수신 처리 벤치마크: 공유 condition handler vs reader별 handler
+- 6 tubes x 10 Hz AIEP_M_MINE_EP_RESULT 도착을 모사
+- take_data() 호출 횟수와 샘플당 CPU 시간을 비교
+- consumer가 밀리는 경우 tube별 최신 샘플만 decode(coalescing) 하는 효과 비교
+
+Usage: python -m Benchmarks.bench_subscriber_dispatch [seconds]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import contextlib
+import sys
+import time
+from types import SimpleNamespace
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_types import AIEP_M_MINE_EP_RESULT
+
+TUBES = 6
+RATE_HZ = 10
+
+TOPIC_NAMES = [message_class.__name__ for message_class in MySubscriber.handlers]
+
+
+VALID_INFO = SimpleNamespace(valid=True)
+
+
+class FakeReader:
+    """take_data()/take()만 흉내내는 reader (호출 횟수 기록)"""
+
+    def __init__(self, topic_name):
+        self.topic_name = topic_name
+        self.pending = []
+        self.take_calls = 0
+
+    def take_data(self):
+        self.take_calls += 1
+        samples, self.pending = self.pending, []
+        return samples
+
+    def take(self):
+        return [(sample, VALID_INFO) for sample in self.take_data()]
+
+
+def make_samples():
+    samples = []
+    for tube_num in range(1, TUBES + 1):
+        sample = AIEP_M_MINE_EP_RESULT()
+        sample.enTubeNum = tube_num
+        samples.append(sample)
+    return samples
+
+
+def reset_subscriber():
+    MySubscriber.store.clear()
+    for topic_name in TOPIC_NAMES:
+        MySubscriber.take_calls[topic_name] = 0
+        MySubscriber.cpu_time[topic_name] = 0.0
+        MySubscriber.skipped_samples[topic_name] = 0
+
+
+def run(seconds, per_reader, wake_every=1, coalesce=True):
+    """seconds 동안의 도착을 wake_every 샘플마다 한 번씩 처리하고
+    (take 횟수, 샘플당 CPU us, 생략된 샘플 수) 반환"""
+    reset_subscriber()
+    MySubscriber.coalesce_samples = coalesce
+    readers = {name: FakeReader(name) for name in TOPIC_NAMES}
+    ep_reader = readers['AIEP_M_MINE_EP_RESULT']
+    samples = make_samples()
+    arrivals = seconds * RATE_HZ
+    queued = 0
+
+    start = time.process_time()
+    for _ in range(arrivals):
+        for sample in samples:
+            ep_reader.pending.append(sample)
+            queued += 1
+            if queued % wake_every:
+                continue
+            if per_reader:
+                MySubscriber.process_data(ep_reader, ep_reader.topic_name)
+            else:
+                # 기존 방식: 어느 condition이 깨어나든 모든 reader를 drain
+                for topic_name, reader in readers.items():
+                    MySubscriber.process_data(reader, topic_name)
+    elapsed = time.process_time() - start
+
+    take_calls = sum(reader.take_calls for reader in readers.values())
+    skipped = sum(MySubscriber.skipped_samples.values())
+    return take_calls, elapsed * 1e6 / (arrivals * TUBES), skipped
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    lag = 5 * TUBES  # consumer가 0.5초(5주기)마다 한 번만 깨어나는 경우
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        results = [
+            ("shared handler", run(seconds, per_reader=False)),
+            ("per-reader handler", run(seconds, per_reader=True)),
+            ("per-reader, lagging", run(seconds, per_reader=True, wake_every=lag, coalesce=False)),
+            ("per-reader, lagging, coalesced", run(seconds, per_reader=True, wake_every=lag)),
+        ]
+
+    print(f"{TUBES} tubes x {RATE_HZ} Hz, {seconds} s simulated")
+    for name, (take_calls, us_per_sample, skipped) in results:
+        print(f"  {name:31s}: {take_calls:7d} takes, {us_per_sample:6.1f} us/sample, {skipped:6d} skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+bench_tube_load_batch.py
+6개 발사관 TEWA_WA_TUBE_LOAD_INFO 송신 비교
+  per-tube loop : 발사관마다 메시지 생성 + MYPublisher.publish (write + flush 6회, 기존 send_all_tube_loads)
+  publish_batch : 6개 메시지를 write 후 flush 1회 (batching writer, 한 batch 로 전달)
+- 송신 시작부터 수신 reader 가 6건 모두 받을 때까지의 시간 (median / p99)
+
+Usage: python -m Benchmarks.bench_tube_load_batch [rounds]
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import statistics
+import sys
+import time
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_transport import dds, TRANSPORT
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_types import TEWA_WA_TUBE_LOAD_INFO
+
+DOMAIN_ID = 0
+TUBES = 6
+MESSAGE_NAME = "TEWA_WA_TUBE_LOAD_INFO"
+
+
+def make_message(tube_num):
+    msg = TEWA_WA_TUBE_LOAD_INFO()
+    msg.eTubeNum = tube_num
+    msg.eWpnKind = tube_num % 3
+    return msg
+
+
+def send_per_tube():
+    for tube_num in range(1, TUBES + 1):
+        MYPublisher.publish(MESSAGE_NAME, make_message(tube_num))
+
+
+def send_batch():
+    MYPublisher.publish_batch(MESSAGE_NAME, [make_message(tube_num) for tube_num in range(1, TUBES + 1)])
+
+
+def bench(send, reader, rounds):
+    """송신 + 6건 수신 완료까지 시간 (us) 목록"""
+    times = []
+    for _ in range(rounds):
+        received = 0
+        start = time.perf_counter()
+        send()
+        while received < TUBES:
+            received += len(reader.take())
+        times.append((time.perf_counter() - start) * 1e6)
+    times.sort()
+    return times
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    configure_logging("CRITICAL")
+
+    MYPublisher.initialize_participant(DOMAIN_ID)
+    writer = MYPublisher.get_writer(MESSAGE_NAME)
+    reader = dds.DataReader(MYPublisher.participant.implicit_subscriber, ParticipantManager.topics[MESSAGE_NAME])
+
+    print(f"transport={TRANSPORT}, {rounds} rounds of {TUBES} tubes "
+          f"(writer batch enable={writer.qos.batch.enable}, max_samples={writer.qos.batch.max_samples})")
+    results = {}
+    for name, send in (("per-tube loop", send_per_tube), ("publish_batch", send_batch)):
+        times = bench(send, reader, rounds)
+        results[name] = statistics.median(times)
+        print(f"  {name:14s}: median {results[name]:7.1f} us, p99 {times[int(len(times) * 0.99) - 1]:7.1f} us")
+    print(f"  speedup: {results['per-tube loop'] / results['publish_batch']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+run_all.py
+오프라인 벤치마크 일괄 실행 (loopback transport, RTI 설치 불필요)
+- 각 벤치마크를 별도 프로세스로 실행 (transport/클래스 상태 공유 방지)
+- AIEP_TRANSPORT 를 지정하지 않으면 loopback 사용
+
+Usage: python -m Benchmarks.run_all
+"""
+
+import os
+import subprocess
+import sys
+
+BENCHMARKS = [
+    ("Benchmarks.bench_subscriber_dispatch", ["10"]),
+    ("Benchmarks.bench_loopback", []),
+    ("Benchmarks.bench_participant_startup", []),
+    ("Benchmarks.bench_qos_resolver", []),
+    ("Benchmarks.bench_publish_worker", []),
+    ("Benchmarks.bench_message_pool", ["1000"]),
+    ("Benchmarks.bench_tube_load_batch", []),
+    ("Benchmarks.bench_plan_model", []),
+    ("Benchmarks.bench_char_codec", []),
+    ("Benchmarks.bench_ep_render", []),
+    ("Benchmarks.bench_pa_layer", []),
+    ("Benchmarks.bench_ep_plan_view", []),
+    ("Benchmarks.bench_replay", []),
+]
+
+
+def main():
+    env = dict(os.environ)
+    env.setdefault("AIEP_TRANSPORT", "loopback")
+
+    failed = []
+    for module, args in BENCHMARKS:
+        print(f"=== {module} ===", flush=True)
+        if subprocess.run([sys.executable, "-m", module, *args], env=env).returncode != 0:
+            failed.append(module)
+        print(flush=True)
+
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
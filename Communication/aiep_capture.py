@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_capture.py
+수신 DDS 샘플 append-only 바이너리 캡처
+- 수신 경로에서는 (수신 시각, topic, sample) 을 큐에 넣기만 함
+- 직렬화, 압축, 파일 쓰기는 백그라운드 스레드에서 블록 단위로 수행
+- 일정 크기마다 새 chunk 파일로 교체 (장시간 세션 대비)
+
+파일 형식 (little endian)
+  file   := MAGIC block*
+  block  := <II raw_len, comp_len> zlib(record*)
+  record := <dHI timestamp, topic_len, payload_len> topic(utf-8) payload
+  payload 는 transport 직렬화 (rti: CDR, loopback: pickle) - 같은 transport 로 재생
+"""
+
+import glob
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from Communication.aiep_transport import serialize_sample, deserialize_sample
+from Communication.aiep_logger import get_logger
+
+log = get_logger("capture")
+
+MAGIC = b"AIEPCAP1"
+FILE_EXTENSION = ".aiepcap"
+BLOCK_HEADER = struct.Struct("<II")
+RECORD_HEADER = struct.Struct("<dHI")
+
+DEFAULT_CHUNK_BYTES = 256 * 1024 * 1024   # chunk 파일 최대 크기
+DEFAULT_BLOCK_BYTES = 256 * 1024          # 압축 블록 크기 (압축 전)
+FLUSH_INTERVAL = 1.0                      # 블록이 덜 찼어도 이 시간(s)마다 기록
+
+
+class CaptureWriter:
+    """Append received samples to chunked, block-compressed capture files from a background thread."""
+
+    def __init__(self, directory, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                 block_bytes=DEFAULT_BLOCK_BYTES, compress_level=1):
+        self.directory = directory
+        self.chunk_bytes = chunk_bytes
+        self.block_bytes = block_bytes
+        self.compress_level = compress_level
+        self.prefix = time.strftime("capture_%Y%m%d_%H%M%S")
+
+        self.records_written = 0
+        self.bytes_written = 0
+        self._chunk_index = 0
+        self._file = None
+        self._queue = queue.SimpleQueue()
+
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="CaptureWriter", daemon=True)
+        self._thread.start()
+
+    def record(self, topic, sample, timestamp=None):
+        """Queue one received sample (called on the receive path; no I/O here)."""
+        self._queue.put((time.time() if timestamp is None else timestamp, topic, sample))
+
+    def close(self):
+        """Flush pending records and close the current chunk."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        block = bytearray()
+        last_flush = time.monotonic()
+
+        while True:
+            try:
+                item = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                item = False
+
+            if item is None:
+                break
+            if item:
+                timestamp, topic, sample = item
+                try:
+                    topic_bytes = topic.encode("utf-8")
+                    payload = serialize_sample(sample)
+                except Exception as e:
+                    log.warning("Capture serialize failed for %s: %s", topic, e, extra={'topic': f'capture/{topic}'})
+                    continue
+                block += RECORD_HEADER.pack(timestamp, len(topic_bytes), len(payload))
+                block += topic_bytes
+                block += payload
+                self.records_written += 1
+
+            if block and (len(block) >= self.block_bytes or time.monotonic() - last_flush >= FLUSH_INTERVAL):
+                self._write_block(block)
+                block = bytearray()
+                last_flush = time.monotonic()
+
+        if block:
+            self._write_block(block)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        log.info("Capture closed: %d records, %d bytes", self.records_written, self.bytes_written)
+
+    def _write_block(self, block):
+        if self._file is None or self._file.tell() >= self.chunk_bytes:
+            self._open_next_chunk()
+
+        compressed = zlib.compress(bytes(block), self.compress_level)
+        self._file.write(BLOCK_HEADER.pack(len(block), len(compressed)))
+        self._file.write(compressed)
+        self._file.flush()
+        self.bytes_written += BLOCK_HEADER.size + len(compressed)
+
+    def _open_next_chunk(self):
+        if self._file is not None:
+            self._file.close()
+        self._chunk_index += 1
+        path = os.path.join(self.directory, f"{self.prefix}_{self._chunk_index:04d}{FILE_EXTENSION}")
+        # 큰 버퍼로 열어 블록 단위 bulk write
+        self._file = open(path, "wb", buffering=1024 * 1024)
+        self._file.write(MAGIC)
+        log.info("Capture chunk opened: %s", path)
+
+
+def capture_files(path):
+    """Return the chunk files of a capture: a single file, or every chunk in a directory, in order."""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, f"*{FILE_EXTENSION}")))
+    return [path]
+
+
+def iter_records(path):
+    """Yield (timestamp, topic, payload) for every record in a capture file or directory."""
+    for file_path in capture_files(path):
+        with open(file_path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not an AIEP capture file: {file_path}")
+
+            while True:
+                header = f.read(BLOCK_HEADER.size)
+                if len(header) < BLOCK_HEADER.size:
+                    break  # 마지막 블록까지 읽음 (또는 기록 중 잘린 블록)
+                raw_len, comp_len = BLOCK_HEADER.unpack(header)
+                compressed = f.read(comp_len)
+                if len(compressed) < comp_len:
+                    break
+                block = zlib.decompress(compressed)
+
+                offset = 0
+                while offset < raw_len:
+                    timestamp, topic_len, payload_len = RECORD_HEADER.unpack_from(block, offset)
+                    offset += RECORD_HEADER.size
+                    topic = block[offset:offset + topic_len].decode("utf-8")
+                    offset += topic_len
+                    payload = block[offset:offset + payload_len]
+                    offset += payload_len
+                    yield timestamp, topic, payload
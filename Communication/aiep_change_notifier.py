@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_change_notifier.py
+수신 데이터 변경 통지를 Tk 스레드로 전달
+- subscriber 스레드는 StateStore 변경 큐에 (topic, key) 만 넣음
+- Tk 스레드는 짧은 주기 타이머로 큐를 비우고, 그 사이 쌓인 변경을 합쳐 한 번만 통지
+- 관심 topic / (topic, key) 가 바뀐 창만 callback 호출
+- root 없이 만들면 타이머 없이 호출자가 drain() (headless replay 벤치마크 등)
+"""
+
+import itertools
+import queue
+from Communication.aiep_logger import get_logger
+
+log = get_logger("notifier")
+
+COALESCE_INTERVAL_MS = 50
+
+
+class ChangeNotifier:
+    """Drain store change notifications on the Tk thread and fan them out to interested listeners."""
+
+    def __init__(self, root, store, interval_ms=COALESCE_INTERVAL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._changes = store.subscribe_changes()
+        self._listeners = {}  # token -> (callback, topics, topic_keys)
+        self._tokens = itertools.count(1)
+
+        if root is not None:
+            self.root.after(self.interval_ms, self._poll)
+
+    def subscribe(self, callback, interests):
+        """Call callback(changed) on the Tk thread when an interest changes.
+
+        interests: topic 이름(모든 key) 또는 (topic, key) 튜플의 목록
+        changed: 이번 주기에 변경된 (topic, key) 중 관심 대상만 모은 set
+        """
+        topics = frozenset(i for i in interests if isinstance(i, str))
+        topic_keys = frozenset(i for i in interests if not isinstance(i, str))
+        token = next(self._tokens)
+        self._listeners[token] = (callback, topics, topic_keys)
+        return token
+
+    def unsubscribe(self, token):
+        self._listeners.pop(token, None)
+
+    def post(self, topic, key=None):
+        """Notify a local (non-DDS) change, e.g. data set from a simulator window."""
+        self._changes.put((topic, key))
+
+    def drain(self):
+        """Collect all pending changes and notify each interested listener once; return the change count."""
+        changed = set()
+        try:
+            while True:
+                changed.add(self._changes.get_nowait())
+        except queue.Empty:
+            pass
+
+        if changed:
+            for token, (callback, topics, topic_keys) in list(self._listeners.items()):
+                relevant = {c for c in changed if c[0] in topics or c in topic_keys}
+                if not relevant or token not in self._listeners:
+                    continue
+                try:
+                    callback(relevant)
+                except Exception as e:
+                    log.exception("Change listener failed: %s", e)
+        return len(changed)
+
+    def _poll(self):
+        self.drain()
+        self.root.after(self.interval_ms, self._poll)
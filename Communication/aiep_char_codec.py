@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_char_codec.py
+IDL 고정 길이 char 배열 <-> 문자열 변환 (UTF-8, 배열 단위 일괄 처리)
+- 문자 단위 루프 없이 bytes 로 한 번에 변환, 첫 NUL 에서 종료
+- 인코딩은 마지막 한 칸을 NUL 로 남기고 UTF-8 문자 경계에서 자름 (한글이 잘려 깨지지 않도록)
+- decode_rows: 2차원 uint8 배열 (행 = char 배열) 전체를 한 번에 문자열 list 로
+- DecodeCache: (배열 이름, version) 단위로 decode_rows 결과 재사용 (version 이 바뀔 때만 다시 변환)
+"""
+
+import numpy as np
+
+
+def char_codes(chars):
+    """DDS char 배열 (int 또는 1글자 str 원소) -> bytes"""
+    if len(chars) and not isinstance(chars[0], int):
+        return bytes(c if isinstance(c, int) else ord(c) for c in chars)
+    return bytes(chars)
+
+
+def encode_chars(text, length):
+    """text 를 length 바이트 (NUL 종료, NUL 로 채움) 로 인코딩, 넘치면 UTF-8 문자 경계에서 자름"""
+    data = text.encode("utf-8")
+    if len(data) >= length:
+        # 잘린 마지막 문자의 남은 바이트는 버림
+        data = data[:length - 1].decode("utf-8", errors="ignore").encode("utf-8")
+    return data.ljust(length, b"\0")
+
+
+def decode_chars(codes):
+    """char 배열 (uint8 배열, bytes 또는 DDS char 배열) -> 문자열 (첫 NUL 까지)"""
+    data = codes.tobytes() if isinstance(codes, np.ndarray) else char_codes(codes)
+    return data.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+
+
+def write_chars(codes, text):
+    """uint8 배열 또는 DDS char 배열 codes 에 text 를 기록 (배열 길이 그대로)"""
+    data = encode_chars(text, len(codes))
+    if isinstance(codes, np.ndarray):
+        codes[:] = np.frombuffer(data, dtype=np.uint8)
+    else:
+        codes[:] = data
+
+
+def decode_rows(codes):
+    """uint8 배열 (..., length) 의 각 행을 문자열로 (행 순서대로 평탄화한 list)"""
+    width = codes.shape[-1]
+    rows = np.ascontiguousarray(codes).reshape(-1, width).view(f"S{width}").ravel().tolist()
+    return [row.split(b"\0", 1)[0].decode("utf-8", errors="replace") for row in rows]
+
+
+class DecodeCache:
+    """decode_rows results per name, reused until the caller's version changes."""
+
+    def __init__(self):
+        self._rows = {}  # name -> (version, [str])
+
+    def rows(self, name, version, codes):
+        """name 의 version 결과가 있으면 그대로, 없으면 codes 를 decode_rows 로 변환해 저장"""
+        cached = self._rows.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = decode_rows(codes)
+        self._rows[name] = (version, rows)
+        return rows
+
+    def clear(self):
+        self._rows.clear()
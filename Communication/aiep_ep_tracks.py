@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_ep_tracks.py
+교전계획 결과 (M_MINE / ALM_ASM / WGT / AAM) -> 전시용 NumPy 배열 변환
+- 궤적/경로점/위치마다 EPTrack (lon, lat, depth, valid): 필드별로 구조체 배열을 한 번에 연속 배열로 옮기고 (np.fromiter) 유효 mask 는 배열 연산
+- depth 는 3D 전시 z 값 (수중 무장은 -fDepth, 유도탄/대공은 고도 그대로)
+- 유효 조건은 기존 전시와 동일: 개수 필드 이내 + 위경도 (0, 0) 제외, M_MINE 경로점은 bValid, 현재 위치는 유효 플래그
+- ep_tracks: 샘플 객체 단위 캐시 (store 값은 수신 후 수정하지 않으므로 같은 객체면 같은 배열)
+"""
+
+from operator import attrgetter
+from typing import NamedTuple
+import numpy as np
+
+AAM_TRAJECTORY_POINTS = 128
+WGT_TRAJECTORY_POINTS = 128
+
+TRACK_CACHE_SIZE = 32
+
+
+class EPTrack(NamedTuple):
+    """One plotted EP element as parallel arrays (full length) plus its valid mask."""
+    lon: np.ndarray
+    lat: np.ndarray
+    depth: np.ndarray
+    valid: np.ndarray
+
+    def points(self):
+        """(lon, lat, depth) of the valid points only"""
+        valid = self.valid
+        return self.lon[valid], self.lat[valid], self.depth[valid]
+
+    @property
+    def count(self):
+        return int(np.count_nonzero(self.valid))
+
+
+# (lon, lat, depth) 필드
+WAYPOINT_FIELDS = ("dLongitude", "dLatitude", "fDepth")
+AAM_FIELDS = ("dblLongitude", "dblLatitude", "fAltitude")
+
+_getters = {}  # field name -> attrgetter
+
+
+def _column(points, name, dtype=float):
+    getter = _getters.get(name)
+    if getter is None:
+        getter = _getters[name] = attrgetter(name)
+    return np.fromiter(map(getter, points), dtype=dtype, count=len(points))
+
+
+def _track(points, fields, count=None, depth_sign=1.0, flag=None):
+    """구조체 배열 -> EPTrack (필드별 배열 변환, 유효 mask 는 벡터 연산)
+
+    flag 를 지정하면 (예: 'bValid') 위경도 대신 그 필드로 유효 판별
+    """
+    lon_name, lat_name, depth_name = fields
+    lon = _column(points, lon_name)
+    lat = _column(points, lat_name)
+    depth = _column(points, depth_name)
+    if depth_sign != 1.0:
+        depth *= depth_sign
+    if flag is not None:
+        valid = _column(points, flag, dtype=bool)
+    else:
+        valid = (lon != 0) | (lat != 0)
+    if count is not None:
+        valid[max(count, 0):] = False
+    return EPTrack(lon, lat, depth, valid)
+
+
+def _position(lon, lat, depth, valid):
+    """단일 위치 -> 길이 1 EPTrack"""
+    return EPTrack(np.array([lon], dtype=float), np.array([lat], dtype=float),
+                   np.array([depth], dtype=float), np.array([bool(valid)]))
+
+
+def _waypoint_position(wp, depth_sign=1.0, valid=None):
+    """ST_WEAPON_WAYPOINT 위치 (valid 미지정 시 위경도 (0, 0) 제외)"""
+    if valid is None:
+        valid = wp.dLatitude != 0 or wp.dLongitude != 0
+    return _position(wp.dLongitude, wp.dLatitude, depth_sign * wp.fDepth, valid)
+
+
+def m_mine_tracks(ep_data):
+    return {
+        "trajectory": _track(ep_data.stTrajectories, WAYPOINT_FIELDS, ep_data.unCntTrajectory, -1.0),
+        "waypoints": _track(ep_data.stWaypoints, WAYPOINT_FIELDS, ep_data.unCntWaypoint, -1.0, flag="bValid"),
+        "launch": _waypoint_position(ep_data.stLaunchPos, -1.0),
+        "drop": _waypoint_position(ep_data.stDropPos, -1.0),
+        "current": _waypoint_position(ep_data.MslPos, -1.0, ep_data.bValidMslPos),
+    }
+
+
+def alm_asm_tracks(ep_data):
+    # 유도탄은 fDepth 필드가 고도
+    return {
+        "trajectory": _track(ep_data.stTrajectories, WAYPOINT_FIELDS, ep_data.unCntTrajectory),
+        "waypoints": _track(ep_data.stWaypoints, WAYPOINT_FIELDS, ep_data.unCntWaypoint),
+        "turning_points": _track(ep_data.stTurningpoints, WAYPOINT_FIELDS, ep_data.unCntTurningpoints),
+        "current": _waypoint_position(ep_data.MslPos, 1.0, ep_data.bValidMslPos),
+    }
+
+
+def wgt_tracks(ep_data):
+    return {
+        "trajectory": _track(ep_data.stTrajectories_WGT[:WGT_TRAJECTORY_POINTS], WAYPOINT_FIELDS,
+                             depth_sign=-1.0),
+        "hit_point": _position(ep_data.dHit_Longitude, ep_data.dHit_Latitude, 0.0, ep_data.bHitPointFound),
+        "current": _waypoint_position(ep_data.stTorpedoCurrentPosition, -1.0,
+                                      ep_data.bValidTorpedoCurrentPosition),
+    }
+
+
+def aam_tracks(ep_data):
+    msl_pos = ep_data.MslPos
+    return {
+        "early": _track(ep_data.Early_Traj[:AAM_TRAJECTORY_POINTS], AAM_FIELDS),
+        "short": _track(ep_data.Short_Traj[:AAM_TRAJECTORY_POINTS], AAM_FIELDS),
+        "late": _track(ep_data.Late_Traj[:AAM_TRAJECTORY_POINTS], AAM_FIELDS),
+        "target": _track(ep_data.Target_Traj[:AAM_TRAJECTORY_POINTS], AAM_FIELDS),
+        "current": _position(msl_pos.dLongitude, msl_pos.dLatitude, msl_pos.fAltitude, ep_data.bValidMslPos),
+    }
+
+
+TRACK_CONVERTERS = {
+    'M_MINE': m_mine_tracks,
+    'ALM_ASM': alm_asm_tracks,
+    'WGT': wgt_tracks,
+    'AAM': aam_tracks,
+}
+
+_track_cache = {}  # id(ep_data) -> (ep_data, wpn_type, tracks) - 객체 참조 유지 (id 재사용 방지)
+
+
+def ep_tracks(wpn_type, ep_data):
+    """{element name: EPTrack} for ep_data, converted once per sample object"""
+    cached = _track_cache.get(id(ep_data))
+    if cached is not None and cached[0] is ep_data and cached[1] == wpn_type:
+        return cached[2]
+
+    converter = TRACK_CONVERTERS.get(wpn_type)
+    tracks = converter(ep_data) if converter else {}
+
+    if len(_track_cache) >= TRACK_CACHE_SIZE:
+        _track_cache.pop(next(iter(_track_cache)))
+    _track_cache[id(ep_data)] = (ep_data, wpn_type, tracks)
+    return tracks
+
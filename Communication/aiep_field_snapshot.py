@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_field_snapshot.py
+메시지 필드 값 스냅샷 (필드 단위 접근을 타입별 단일 함수로 생성)
+- field_values(src): 모든 필드 값을 선언 순서대로 펼친 tuple (내용 비교용 스냅샷 - 같은 내용 재수신 판별)
+- 함수는 타입별로 처음 한 번 생성: 중첩 구조체는 원소 함수 호출, 구조체 배열은 원소 결과를 이어 붙임
+"""
+
+import dataclasses
+import threading
+
+_flatteners = {}  # class -> field_values 함수
+_lock = threading.Lock()
+
+
+def _is_struct(value):
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+def _field_kinds(template):
+    """[(field name, template value, kind)] - kind: struct / struct_array / array / scalar"""
+    kinds = []
+    for f in dataclasses.fields(template):
+        value = getattr(template, f.name)
+        if _is_struct(value):
+            kind = "struct"
+        elif hasattr(value, "__len__") and not isinstance(value, (str, bytes)):
+            kind = "struct_array" if len(value) and _is_struct(value[0]) else "array"
+        else:
+            kind = "scalar"
+        kinds.append((f.name, value, kind))
+    return kinds
+
+
+def _compile_field_values(src_class):
+    # 타입마다 tuple 을 만드는 함수 하나, 구조체 배열은 원소 함수 결과를 이어 붙임
+    namespace = {}
+    generated = {}
+
+    def build(struct_class):
+        if struct_class in generated:
+            return generated[struct_class]
+        func = f"values_{len(generated)}"
+        generated[struct_class] = func
+
+        items = []
+        for name, value, kind in _field_kinds(struct_class()):
+            if kind == "struct":
+                items.append(f"*{build(type(value))}(s.{name})")
+            elif kind == "struct_array":
+                items.append(f"*[v for e in s.{name} for v in {build(type(value[0]))}(e)]")
+            elif kind == "array":
+                items.append(f"*s.{name}")
+            else:
+                items.append(f"s.{name}")
+        exec(f"def {func}(s):\n    return ({', '.join(items)},)", namespace)
+        return func
+
+    return namespace[build(src_class)]
+
+
+def field_values(src):
+    """Return every field value of src, flattened in declaration order (content snapshot for comparison)."""
+    flattener = _flatteners.get(type(src))
+    if flattener is None:
+        with _lock:
+            flattener = _flatteners[type(src)] = _compile_field_values(type(src))
+    return flattener(src)
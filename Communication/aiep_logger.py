@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_logger.py
+Communication 모듈 공용 로깅
+- 호출 스레드에서는 QueueHandler 로 레코드만 큐에 넣고, 실제 출력은 백그라운드 스레드(QueueListener)가 수행
+- topic 별 rate limit: 같은 topic 의 INFO 이하 레코드는 주기당 1건만 통과, 생략 건수는 다음 출력에 표시
+- 로그 레벨은 configure_logging(level) 로 지정 (M_MINE_Plan_Simulator.py --log-level)
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+LOGGER_NAME = "aiep"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(name)s] %(message)s"
+DEFAULT_RATE_LIMIT_INTERVAL = 1.0  # seconds
+
+_listener = None
+
+
+class TopicRateLimitFilter(logging.Filter):
+    """Pass at most one record per topic per interval; report how many were suppressed.
+
+    topic 은 logger.info(..., extra={'topic': name}) 로 지정한다.
+    topic 이 없거나 WARNING 이상인 레코드는 제한하지 않는다.
+    """
+
+    def __init__(self, interval=DEFAULT_RATE_LIMIT_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        self._last_emit = {}   # topic -> monotonic time of last passed record
+        self._suppressed = {}  # topic -> suppressed count since last passed record
+
+    def filter(self, record):
+        topic = getattr(record, "topic", None)
+        if topic is None or record.levelno >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        if now - self._last_emit.get(topic, float("-inf")) < self.interval:
+            self._suppressed[topic] = self._suppressed.get(topic, 0) + 1
+            return False
+
+        self._last_emit[topic] = now
+        suppressed = self._suppressed.pop(topic, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} suppressed)"
+        return True
+
+
+def configure_logging(level="INFO", rate_limit_interval=DEFAULT_RATE_LIMIT_INTERVAL, stream=None):
+    """Route the 'aiep' logger through a background writer thread."""
+    global _listener
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    if _listener is not None:
+        _listener.stop()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(TopicRateLimitFilter(rate_limit_interval))
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, output)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush pending records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name):
+    """Return a child logger of 'aiep' (e.g. get_logger('subscriber'))."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+atexit.register(shutdown_logging)
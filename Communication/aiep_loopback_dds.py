@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_loopback_dds.py
+in-process loopback transport (rti.connextdds 의 시뮬레이터 사용 범위만 구현)
+- 같은 프로세스, 같은 domain_id, 같은 topic 이름의 DataReader 에 write() 샘플을 전달
+- 샘플은 write 시 한 번 직렬화(pickle)하고 reader 마다 복원 -> reader 별 독립 사본 (DDS 와 동일)
+- DataReader: take() / take_data() / read_data(), history 는 KEEP_ALL
+- StatusCondition(DATA_AVAILABLE) + WaitSet.dispatch(timeout): 미처리 샘플이 있는 reader 의 handler 호출
+- QosProvider: XML 프로파일 이름만 확인, QoS 값 자체는 적용하지 않음
+- DataWriterQos.batch.enable 이면 write() 는 모아 두었다가 max_samples 또는 flush() 시 한 번에 전달
+"""
+
+import os
+import pickle
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+
+_domains = {}  # domain_id -> {topic_name: [DataReader]}
+_domains_lock = threading.Lock()
+
+
+def serialize_sample(sample):
+    """Serialize a sample for the loopback wire (pickle)."""
+    return pickle.dumps(sample, pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_sample(sample_type, payload):
+    """Rebuild a sample from loopback bytes; sample_type is checked, not used to decode."""
+    sample = pickle.loads(payload)
+    if type(sample) is not sample_type:
+        raise TypeError(f"Expected {sample_type.__name__}, got {type(sample).__name__}")
+    return sample
+
+
+class Duration:
+    def __init__(self, sec=0, nanosec=0):
+        self.sec = sec
+        self.nanosec = nanosec
+
+    @staticmethod
+    def from_seconds(seconds):
+        sec = int(seconds)
+        return Duration(sec, int((seconds - sec) * 1e9))
+
+    @staticmethod
+    def from_milliseconds(milliseconds):
+        return Duration.from_seconds(milliseconds / 1000.0)
+
+    def to_seconds(self):
+        return self.sec + self.nanosec / 1e9
+
+
+class StatusMask:
+    NONE = 0
+    DATA_AVAILABLE = 1 << 10
+
+
+class DomainParticipantQos:
+    pass
+
+
+class TopicQos:
+    pass
+
+
+class Batch:
+    def __init__(self):
+        self.enable = False
+        self.max_samples = 0  # 0: 제한 없음 (flush 시에만 전달)
+
+
+class DataWriterQos:
+    def __init__(self, other=None):
+        self.batch = Batch()
+        if other is not None:
+            self.batch.enable = other.batch.enable
+            self.batch.max_samples = other.batch.max_samples
+
+
+class DataReaderQos:
+    pass
+
+
+class QosProvider:
+    """Check that the QoS file and requested profiles exist; return default QoS objects."""
+
+    def __init__(self, uri):
+        path = uri[len("file://"):] if uri.startswith("file://") else uri
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"QoS file not found: {path}")
+
+        self.profiles = set()
+        for library in ET.parse(path).getroot().iter("qos_library"):
+            for profile in library.iter("qos_profile"):
+                self.profiles.add(f"{library.get('name')}::{profile.get('name')}")
+
+    def _check(self, profile):
+        if profile not in self.profiles:
+            raise ValueError(f"QoS profile not found: {profile}")
+
+    def participant_qos_from_profile(self, profile):
+        self._check(profile)
+        return DomainParticipantQos()
+
+    def topic_qos_from_profile(self, profile):
+        self._check(profile)
+        return TopicQos()
+
+    def datawriter_qos_from_profile(self, profile):
+        self._check(profile)
+        return DataWriterQos()
+
+    def datareader_qos_from_profile(self, profile):
+        self._check(profile)
+        return DataReaderQos()
+
+
+class Publisher:
+    def __init__(self, participant):
+        self.participant = participant
+
+
+class Subscriber:
+    def __init__(self, participant):
+        self.participant = participant
+
+
+class DomainParticipant:
+    def __init__(self, domain_id, qos=None):
+        self.domain_id = domain_id
+        self.qos = qos or DomainParticipantQos()
+        self.implicit_publisher = Publisher(self)
+        self.implicit_subscriber = Subscriber(self)
+        self._topic_names = set()
+
+    def close(self):
+        """Remove this participant's readers from the domain."""
+        with _domains_lock:
+            for readers in _domains.get(self.domain_id, {}).values():
+                readers[:] = [reader for reader in readers if reader.subscriber.participant is not self]
+
+
+class Topic:
+    def __init__(self, participant, name, type, qos=None):
+        # RTI 와 동일하게 같은 participant 에 같은 이름의 Topic 은 하나만 허용
+        if name in participant._topic_names:
+            raise RuntimeError(f"Topic {name} already exists in this participant")
+        participant._topic_names.add(name)
+        self.participant = participant
+        self.name = name
+        self.type = type
+        self.qos = qos or TopicQos()
+
+
+class SampleInfo:
+    __slots__ = ("valid", "source_timestamp", "reception_timestamp")
+
+    def __init__(self, source_timestamp, reception_timestamp):
+        self.valid = True
+        self.source_timestamp = source_timestamp
+        self.reception_timestamp = reception_timestamp
+
+
+def _matched_readers(domain_id, topic_name):
+    with _domains_lock:
+        return list(_domains.get(domain_id, {}).get(topic_name, ()))
+
+
+class DataWriter:
+    def __init__(self, publisher, topic, qos=None):
+        self.publisher = publisher
+        self.topic = topic
+        self.qos = qos or DataWriterQos()
+        self.samples_written = 0
+        self._batch = []
+
+    @property
+    def topic_name(self):
+        return self.topic.name
+
+    def write(self, sample):
+        """Deliver an independent copy of sample to every matched reader (batched if enabled)."""
+        self.samples_written += 1
+        batch = self.qos.batch
+        if batch.enable:
+            self._batch.append(sample)
+            if batch.max_samples and len(self._batch) >= batch.max_samples:
+                self.flush()
+            return
+        self._send([sample])
+
+    def flush(self):
+        """Send the samples held in the current batch."""
+        if self._batch:
+            samples, self._batch = self._batch, []
+            self._send(samples)
+
+    def _send(self, samples):
+        readers = _matched_readers(self.publisher.participant.domain_id, self.topic.name)
+        if readers:
+            payload = pickle.dumps(samples, pickle.HIGHEST_PROTOCOL)
+            source_timestamp = time.time()
+            for reader in readers:
+                reader._deliver(pickle.loads(payload), source_timestamp)
+
+
+class DataReader:
+    def __init__(self, subscriber, topic, qos=None):
+        self.subscriber = subscriber
+        self.topic = topic
+        self.qos = qos or DataReaderQos()
+        self._samples = deque()
+        self._lock = threading.Lock()
+        self._conditions = []
+
+        with _domains_lock:
+            topics = _domains.setdefault(subscriber.participant.domain_id, {})
+            topics.setdefault(topic.name, []).append(self)
+
+    @property
+    def topic_name(self):
+        return self.topic.name
+
+    def close(self):
+        with _domains_lock:
+            readers = _domains.get(self.subscriber.participant.domain_id, {}).get(self.topic.name, [])
+            if self in readers:
+                readers.remove(self)
+
+    def _deliver(self, samples, source_timestamp):
+        reception_timestamp = time.time()
+        with self._lock:
+            self._samples.extend((sample, SampleInfo(source_timestamp, reception_timestamp)) for sample in samples)
+        for condition in self._conditions:
+            condition._signal()
+
+    def _has_data(self):
+        return bool(self._samples)
+
+    def take(self):
+        """Remove and return all pending (data, info) pairs."""
+        with self._lock:
+            samples = list(self._samples)
+            self._samples.clear()
+        return samples
+
+    def take_data(self):
+        """Remove and return all pending samples (valid data only)."""
+        return [data for data, _ in self.take()]
+
+    def read_data(self):
+        """Return pending samples without removing them."""
+        with self._lock:
+            return [data for data, _ in self._samples]
+
+
+class StatusCondition:
+    def __init__(self, entity):
+        self.entity = entity
+        self.enabled_statuses = StatusMask.NONE
+        self._handler = None
+        self._waitsets = []
+        entity._conditions.append(self)
+
+    def set_handler(self, handler):
+        self._handler = handler
+
+    def reset_handler(self):
+        self._handler = None
+
+    @property
+    def trigger_value(self):
+        return bool(self.enabled_statuses & StatusMask.DATA_AVAILABLE) and self.entity._has_data()
+
+    def dispatch(self):
+        if self._handler is not None:
+            self._handler(self)
+
+    def _signal(self):
+        for waitset in self._waitsets:
+            waitset._wake()
+
+
+class WaitSet:
+    def __init__(self):
+        self.conditions = []
+        self._cv = threading.Condition()
+
+    def attach_condition(self, condition):
+        if condition not in self.conditions:
+            self.conditions.append(condition)
+            condition._waitsets.append(self)
+
+    def detach_condition(self, condition):
+        if condition in self.conditions:
+            self.conditions.remove(condition)
+            condition._waitsets.remove(self)
+
+    def __iadd__(self, condition):
+        self.attach_condition(condition)
+        return self
+
+    def __isub__(self, condition):
+        self.detach_condition(condition)
+        return self
+
+    def _wake(self):
+        with self._cv:
+            self._cv.notify_all()
+
+    def _triggered(self):
+        return [condition for condition in self.conditions if condition.trigger_value]
+
+    def wait(self, timeout=None):
+        """Block until at least one condition is triggered (or timeout); return the triggered ones."""
+        seconds = None if timeout is None else timeout.to_seconds()
+        with self._cv:
+            self._cv.wait_for(self._triggered, seconds)
+        return self._triggered()
+
+    def dispatch(self, timeout=None):
+        """Wait like wait() and call the handler of each triggered condition."""
+        for condition in self.wait(timeout):
+            condition.dispatch()
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_loopback_types.py
+dds.AIEP_AIEP_ 메시지 타입의 pure-Python stand-in (loopback transport 용)
+- RTI 설치 없이 벤치마크/오프라인 실행을 위해 동일한 필드 이름, 중첩 구조, 고정 배열 크기를 유지
+- rti.idl 생성 타입과 같이 dataclass, 배열은 미리 채워진 list (char 배열은 int list)
+- 필드 annotation 에 IDL 기본 타입 폭 표시 (int16, uint16, float32 ... / Sequence[...] 는 고정 배열)
+  -> aiep_types.field_types() 가 생성 타입의 TypeCode 와 같은 형식으로 조회
+- enum 필드는 int (annotation 은 enum), boolean 필드는 bool
+- 필드는 시뮬레이터가 참조하는 IDL 필드 (IDL 원본은 저장소에 없음)
+  생성 모듈 dds.AIEP_AIEP_ 를 import 할 수 있으면 loopback 에서도 그 타입을 사용 (aiep_types)
+"""
+
+from dataclasses import dataclass, field
+from typing import Annotated, Sequence
+
+# IDL 기본 타입 (Annotated metadata = numpy dtype, enum 은 "enum")
+int16 = Annotated[int, "i2"]
+uint16 = Annotated[int, "u2"]
+int32 = Annotated[int, "i4"]
+uint32 = Annotated[int, "u4"]
+float32 = Annotated[float, "f4"]
+float64 = Annotated[float, "f8"]
+boolean = Annotated[bool, "?"]
+char = Annotated[int, "u1"]
+enum = Annotated[int, "enum"]
+
+# IDL 고정 배열 크기
+MAX_PLAN_LIST = 15
+MAX_PLAN_PER_LIST = 15
+MAX_PLAN_WAYPOINT = 8
+MAX_OWNSHIP_WAYPOINT = 40
+MAX_DESCRIPTION = 50
+MAX_GEO_WAYPOINT = 15
+MAX_EP_WAYPOINT = 8
+MAX_TRAJECTORY = 128
+MAX_PA_POINT = 16
+
+
+def _array(element_type, length):
+    return field(default_factory=lambda: [element_type() for _ in range(length)])
+
+
+def _chars(length):
+    return field(default_factory=lambda: [0] * length)
+
+
+def _struct(struct_type):
+    return field(default_factory=struct_type)
+
+
+# ---------------------------------------------------------------------------
+# 공통 구조체
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SGEODETIC_POSITION:
+    dLatitude: float64 = 0.0
+    dLongitude: float64 = 0.0
+    fAltitude: float32 = 0.0
+
+
+@dataclass
+class ST_WEAPON_WAYPOINT:
+    dLatitude: float64 = 0.0
+    dLongitude: float64 = 0.0
+    fDepth: float32 = 0.0
+    fSpeed: float32 = 0.0
+    bValid: boolean = False
+
+
+@dataclass
+class ST_WEAPON_GEO_WAYPOINTS:
+    unCntWaypoints: uint32 = 0
+    stGeoPos: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_GEO_WAYPOINT)
+
+
+# ---------------------------------------------------------------------------
+# TEWA / NAVINF / TRKMGR
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ST_WA_SESSION:
+    enConsoleNum: enum = 0
+    enTubeNum: enum = 0
+    enWeaponType: enum = 0
+    enAllocConsoleNum: enum = 0
+    unTrackNumber: uint32 = 0
+    usAllocDroppingPlanListNum: uint16 = 0
+    usAllocLayNum: uint16 = 0
+    enAllocTube: enum = 0
+    enAllocLay: enum = 0
+    enAllocTrack: enum = 0
+    stTargetPos: SGEODETIC_POSITION = _struct(SGEODETIC_POSITION)
+    enAllocTarget: enum = 0
+
+
+@dataclass
+class TEWA_ASSIGN_CMD:
+    eSetCmd: enum = 0
+    stWpnAssign: ST_WA_SESSION = _struct(ST_WA_SESSION)
+
+
+@dataclass
+class TEWA_WA_TUBE_LOAD_INFO:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+
+
+@dataclass
+class ST_SHIP_MOVEMENT_INFO:
+    dShipLatitude: float64 = 0.0
+    dShipLongitude: float64 = 0.0
+    fShipDepth: float32 = 0.0
+    fShipSpeed: float32 = 0.0
+    fShipHeading: float32 = 0.0
+
+
+@dataclass
+class ST_UNDERWATER_ENVIRONMENT_INFO:
+    fDivingDepth: float32 = 0.0
+
+
+@dataclass
+class NAVINF_SHIP_NAVIGATION_INFO:
+    stShipMovementInfo: ST_SHIP_MOVEMENT_INFO = _struct(ST_SHIP_MOVEMENT_INFO)
+    stUnderwaterEnvironmentInfo: ST_UNDERWATER_ENVIRONMENT_INFO = _struct(ST_UNDERWATER_ENVIRONMENT_INFO)
+
+
+@dataclass
+class TRKMGR_SYSTEMTARGET_INFO:
+    unTrackNumber: uint32 = 0
+    stTargetPos: SGEODETIC_POSITION = _struct(SGEODETIC_POSITION)
+
+
+# ---------------------------------------------------------------------------
+# CMSHCI -> AIEP
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ST_PA_POINT:
+    dRadius: float64 = 0.0
+    dLatitude: float64 = 0.0
+    dLongitude: float64 = 0.0
+    dCourse: float64 = 0.0
+    dSpeed: float64 = 0.0
+
+
+@dataclass
+class CMSHCI_AIEP_PA_INFO:
+    nCountPA: int32 = 0
+    stPaPoint: Sequence[ST_PA_POINT] = _array(ST_PA_POINT, MAX_PA_POINT)
+
+
+@dataclass
+class CMSHCI_AIEP_WPN_CTRL_CMD:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+    eWpnCtrlCmd: enum = 0
+
+
+@dataclass
+class CMSHCI_AIEP_WPN_GEO_WAYPOINTS:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+    bValid_GenerateWaypoints: boolean = False
+    stGeoWaypoints: ST_WEAPON_GEO_WAYPOINTS = _struct(ST_WEAPON_GEO_WAYPOINTS)
+
+
+@dataclass
+class CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ:
+    eWpnKind: enum = 0
+    eTubeNum: enum = 0
+    bGenerateAIWaypoints: boolean = False
+
+
+@dataclass
+class CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ:
+    bDroppingPlanReq: boolean = False
+
+
+@dataclass
+class CMSHCI_AIEP_M_MINE_SELECTED_PLAN:
+    usListID: uint16 = 0
+    usDroppingPlanNumber: uint16 = 0
+
+
+@dataclass
+class AIEP_INTERNAL_INFER_REQ:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+
+
+# ---------------------------------------------------------------------------
+# 자항기뢰 부설계획
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ST_M_MINE_PLAN_INFO:
+    sListID: int16 = 0
+    usDroppingPlanNumber: uint16 = 0
+    ePlanState: enum = 0
+    usWeaponID: uint16 = 0
+    cAdditionalText: Sequence[char] = _chars(MAX_DESCRIPTION)
+    stDropPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    stLaunchPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    usWaypointCnt: uint16 = 0
+    stWaypoint: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_PLAN_WAYPOINT)
+
+
+@dataclass
+class ST_M_MINE_PLAN_OWNSHIP_WAYPOINT:
+    dLatitude: float64 = 0.0
+    dLongitude: float64 = 0.0
+    fDepth: float32 = 0.0
+    fSpeed: float32 = 0.0
+    fHeading: float32 = 0.0
+    bLaunchPoint: boolean = False
+    usListID: uint16 = 0
+
+
+@dataclass
+class ST_M_MINE_PLAN_LIST:
+    chDescription: Sequence[char] = _chars(MAX_DESCRIPTION)
+    sListID: int16 = 0
+    usOwnshipWaypointCnt: uint16 = 0
+    stPlan: Sequence[ST_M_MINE_PLAN_INFO] = _array(ST_M_MINE_PLAN_INFO, MAX_PLAN_PER_LIST)
+    stOwnshipWaypoint: Sequence[ST_M_MINE_PLAN_OWNSHIP_WAYPOINT] = _array(ST_M_MINE_PLAN_OWNSHIP_WAYPOINT, MAX_OWNSHIP_WAYPOINT)
+
+
+@dataclass
+class AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST:
+    usPlanListCnt: uint16 = 0
+    stMinePlanList: Sequence[ST_M_MINE_PLAN_LIST] = _array(ST_M_MINE_PLAN_LIST, MAX_PLAN_LIST)
+
+
+@dataclass
+class CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST:
+    usPlanListCnt: uint16 = 0
+    stMinePlanList: Sequence[ST_M_MINE_PLAN_LIST] = _array(ST_M_MINE_PLAN_LIST, MAX_PLAN_LIST)
+
+
+# ---------------------------------------------------------------------------
+# AIEP -> 결과 / 상태
+# ---------------------------------------------------------------------------
+
+@dataclass
+class AIEP_WPN_CTRL_STATUS_INFO:
+    eTubeNum: enum = 0
+    eCtrlState: enum = 0
+    wpnTime: float64 = 0.0
+
+
+@dataclass
+class AIEP_INTERNAL_INFER_RESULT_FIRE_TIME:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+
+
+@dataclass
+class AIEP_AI_INFER_RESULT_WP:
+    eTubeNum: enum = 0
+    eWpnKind: enum = 0
+    stGeoWaypoints: ST_WEAPON_GEO_WAYPOINTS = _struct(ST_WEAPON_GEO_WAYPOINTS)
+
+
+@dataclass
+class AIEP_M_MINE_EP_RESULT:
+    enTubeNum: enum = 0
+    unCntTrajectory: uint32 = 0
+    stTrajectories: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_TRAJECTORY)
+    unCntWaypoint: uint32 = 0
+    stWaypoints: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_EP_WAYPOINT)
+    stLaunchPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    stDropPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    bValidMslPos: boolean = False
+    MslPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    numberOfNextWP: int32 = 0
+    timeToNextWP: float64 = 0.0
+    fEstimatedDrivingTime: float32 = 0.0
+    fRemainingTime: float32 = 0.0
+
+
+@dataclass
+class AIEP_ALM_ASM_EP_RESULT:
+    enTubeNum: enum = 0
+    unCntTrajectory: uint32 = 0
+    stTrajectories: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_TRAJECTORY)
+    unCntWaypoint: uint32 = 0
+    stWaypoints: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_EP_WAYPOINT)
+    unCntTurningpoints: uint32 = 0
+    stTurningpoints: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_EP_WAYPOINT)
+    bValidMslPos: boolean = False
+    MslPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+    numberOfNextWP: int32 = 0
+    timeToNextWP: float64 = 0.0
+
+
+@dataclass
+class AIEP_WGT_EP_RESULT:
+    enTubeNum: enum = 0
+    stTrajectories_WGT: Sequence[ST_WEAPON_WAYPOINT] = _array(ST_WEAPON_WAYPOINT, MAX_TRAJECTORY)
+    bHitPointFound: boolean = False
+    dHit_Latitude: float64 = 0.0
+    dHit_Longitude: float64 = 0.0
+    dHit_TimeDiff: float64 = 0.0
+    bValidTorpedoCurrentPosition: boolean = False
+    stTorpedoCurrentPosition: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+
+
+@dataclass
+class ST_AAM_TRAJECTORY_POINT:
+    dblLatitude: float64 = 0.0
+    dblLongitude: float64 = 0.0
+    fAltitude: float32 = 0.0
+
+
+@dataclass
+class AIEP_AAM_EP_RESULT:
+    eTubeNum: enum = 0
+    Early_Traj: Sequence[ST_AAM_TRAJECTORY_POINT] = _array(ST_AAM_TRAJECTORY_POINT, MAX_TRAJECTORY)
+    Short_Traj: Sequence[ST_AAM_TRAJECTORY_POINT] = _array(ST_AAM_TRAJECTORY_POINT, MAX_TRAJECTORY)
+    Late_Traj: Sequence[ST_AAM_TRAJECTORY_POINT] = _array(ST_AAM_TRAJECTORY_POINT, MAX_TRAJECTORY)
+    Target_Traj: Sequence[ST_AAM_TRAJECTORY_POINT] = _array(ST_AAM_TRAJECTORY_POINT, MAX_TRAJECTORY)
+    Early_RunTime: float32 = 0.0
+    Short_RunTime: float32 = 0.0
+    Late_RunTime: float32 = 0.0
+    Early_LaunchTimeLeft: float32 = 0.0
+    Short_LaunchTimeLeft: float32 = 0.0
+    Late_LaunchTimeLeft: float32 = 0.0
+    bValidMslPos: boolean = False
+    MslPos: ST_WEAPON_WAYPOINT = _struct(ST_WEAPON_WAYPOINT)
+
+
+__all__ = [name for name, value in list(globals().items())
+           if isinstance(value, type) and name.isupper() and not name.startswith("_")]
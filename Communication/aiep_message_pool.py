@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_message_pool.py
+송신 메시지 객체 재사용 pool (주기/스크립트 송신용)
+- 타입별 free list, acquire() 는 기본값으로 reset 된 객체를 반환 (없으면 새로 생성)
+- reset 은 필드 단위 재설정: 중첩 구조체/구조체 배열은 객체를 그대로 두고 값만 기본값으로 (할당 없음)
+- 타입별 reset 함수는 처음 한 번 생성 (필드를 펼친 단일 함수 -> 새 객체 생성보다 빠름)
+- release() 된 객체는 다음 acquire() 에서 다시 사용되므로, 더 이상 참조되지 않을 때만 release 할 것
+  (MYPublisher.publish_async(..., release=True) 는 publish worker 의 완료 통지에서 release)
+- 필드 몇 개뿐인 명령 메시지는 reset 이 새 객체 생성보다 느림 -> 구조체 배열이 있는 메시지 (WPN_GEO_WAYPOINTS 등) 에만 사용
+"""
+
+import dataclasses
+import threading
+
+MAX_POOLED_PER_TYPE = 8
+
+
+def _is_struct(value):
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+def _compile_reset(message_class):
+    """Build reset(sample) for message_class as one flat function (no per-field dispatch at run time).
+
+    기본값 template 을 한 번 만들어 필드 종류를 판별하고, 중첩 구조체는 변수로, 구조체 배열은 for 문으로 펼침
+    """
+    lines = ["def reset(s0):"]
+    defaults = {}
+    names = iter(range(1, 1 << 30))
+
+    def emit(template, var, indent):
+        for f in dataclasses.fields(template):
+            value = getattr(template, f.name)
+            if _is_struct(value):
+                child = f"s{next(names)}"
+                lines.append(f"{indent}{child} = {var}.{f.name}")
+                emit(value, child, indent)
+            elif hasattr(value, "__len__") and not isinstance(value, (str, bytes)):
+                if len(value) and _is_struct(value[0]):
+                    child = f"s{next(names)}"
+                    lines.append(f"{indent}for {child} in {var}.{f.name}:")
+                    emit(value[0], child, indent + "    ")
+                else:
+                    default = f"d{len(defaults)}"
+                    defaults[default] = value
+                    lines.append(f"{indent}{var}.{f.name}[:] = {default}")
+            else:
+                default = f"d{len(defaults)}"
+                defaults[default] = value
+                lines.append(f"{indent}{var}.{f.name} = {default}")
+
+    emit(message_class(), "s0", "    ")
+    if len(lines) == 1:
+        lines.append("    pass")
+    namespace = dict(defaults)
+    exec("\n".join(lines), namespace)
+    return namespace["reset"]
+
+
+class MessagePool:
+    """Per-type free lists of message objects, reset to default values on acquire."""
+
+    def __init__(self, max_per_type=MAX_POOLED_PER_TYPE):
+        self.max_per_type = max_per_type
+        self.created = 0
+        self.reused = 0
+        self._free = {}    # message class -> [object]
+        self._resets = {}  # message class -> reset(sample)
+        self._lock = threading.Lock()
+
+    def acquire(self, message_class):
+        """Return a default-valued message_class object, reusing a released one if available."""
+        with self._lock:
+            free = self._free.get(message_class)
+            sample = free.pop() if free else None
+        if sample is None:
+            self.created += 1
+            return message_class()
+        self.reset(sample)
+        self.reused += 1
+        return sample
+
+    def release(self, sample):
+        """Return sample to its type's free list (dropped when the list is full)."""
+        with self._lock:
+            free = self._free.setdefault(type(sample), [])
+            if len(free) < self.max_per_type:
+                free.append(sample)
+
+    def reset(self, sample):
+        """Set every field of sample (recursively) back to the type's default value in place."""
+        reset = self._resets.get(type(sample))
+        if reset is None:
+            reset = self._resets[type(sample)] = _compile_reset(type(sample))
+        reset(sample)
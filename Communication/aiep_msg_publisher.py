@@ -1,120 +1,330 @@
 # _*_ coding: utf-8 _*_
 import time
 import sys
-import numpy as np
-import xml.etree.ElementTree as ET
-import rti.connextdds as dds
-from dds.AIEP_AIEP_ import SGEODETIC_POSITION
-from dds.AIEP_AIEP_ import CMSHCI_AIEP_M_MINE_SELECTED_PLAN, CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ, AIEP_INTERNAL_INFER_REQ, TEWA_ASSIGN_CMD, NAVINF_SHIP_NAVIGATION_INFO, CMSHCI_AIEP_PA_INFO, CMSHCI_AIEP_WPN_GEO_WAYPOINTS,CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST, NAVINF_SHIP_NAVIGATION_INFO, TEWA_WA_TUBE_LOAD_INFO, TRKMGR_SYSTEMTARGET_INFO, AIEP_WPN_CTRL_STATUS_INFO
-from dds.AIEP_AIEP_ import CMSHCI_AIEP_WPN_CTRL_CMD
+import threading
+from Communication.aiep_transport import dds
+from Communication.aiep_types import SGEODETIC_POSITION
+from Communication.aiep_types import CMSHCI_AIEP_M_MINE_SELECTED_PLAN, CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ, AIEP_INTERNAL_INFER_REQ, TEWA_ASSIGN_CMD, NAVINF_SHIP_NAVIGATION_INFO, CMSHCI_AIEP_PA_INFO, CMSHCI_AIEP_WPN_GEO_WAYPOINTS,CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST, NAVINF_SHIP_NAVIGATION_INFO, TEWA_WA_TUBE_LOAD_INFO, TRKMGR_SYSTEMTARGET_INFO, AIEP_WPN_CTRL_STATUS_INFO
+from Communication.aiep_types import CMSHCI_AIEP_WPN_CTRL_CMD
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_qos import QosResolver
+from Communication.aiep_publish_worker import PublishWorker, QUEUED
+from Communication.aiep_message_pool import MessagePool
+from Communication.aiep_logger import get_logger
 
-import numpy as np
-import matplotlib.pyplot as plt
+log = get_logger("publisher")
 
 class MYPublisher:
     participant = None
-    provider = None
-    qos_mapping = {}
     data_AIEP_INTERNAL_INFER_REQ = None
-  
-    @staticmethod
-    def load_qos_mapping():
-        tree = ET.parse("MY_QOS_PROFILES.xml")
-        root = tree.getroot()
-            
-        for profile in root.findall('.//qos_profile'):
-            name = profile.get('name')
-            base = profile.get('base_name')
-            if name and base:
-                MYPublisher.qos_mapping[name] = base
-                print(f"Mapped: {name} -> {base}")
+    # 송신 topic/writer 목록 (writer 는 start_initialization 에서 모두 생성, writer<NAME> / topic<NAME> 속성으로도 접근)
+    message_classes = [
+        CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST,
+        CMSHCI_AIEP_M_MINE_SELECTED_PLAN,
+        CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ,
+        CMSHCI_AIEP_PA_INFO,
+        CMSHCI_AIEP_WPN_CTRL_CMD,
+        CMSHCI_AIEP_WPN_GEO_WAYPOINTS,
+        CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ,
+        TEWA_ASSIGN_CMD,
+        TEWA_WA_TUBE_LOAD_INFO,
+        TRKMGR_SYSTEMTARGET_INFO,
+        NAVINF_SHIP_NAVIGATION_INFO,
+        AIEP_INTERNAL_INFER_REQ,
+        AIEP_WPN_CTRL_STATUS_INFO
+    ]
+    message_types = {message_class.__name__: message_class for message_class in message_classes}
+    # 발사관별 메시지: writer batching 활성화 (publish_batch 의 샘플을 한 번에 전송), 값은 batch 당 최대 샘플 수
+    batch_topics = {
+        "TEWA_WA_TUBE_LOAD_INFO": 6,
+    }
+    writers = {}            # message_name -> DataWriter (생성된 것만)
+    init_time = None        # 백그라운드 초기화 (participant + writer) 소요 시간 (s)
 
+    # 초기화 상태: publish() 는 ready 전까지 샘플을 pending 에 보관, ready 시 순서대로 전송
+    ready = False
+    status = "not started"  # not started / initializing / ready / failed / offline
+    offline_reason = None   # set_offline() 사유 (예: "replay")
+    pending = []            # (message_name, sample)
+    status_listeners = []   # callable() - 상태 또는 대기 건수 변경 시 호출 (호출 스레드 임의)
+    worker = None           # GUI 송신용 PublishWorker (publish_async 첫 호출 시 생성)
+    pool = MessagePool()    # 송신 메시지 객체 재사용 (acquire_message / publish_async(..., release=True))
+    _writer_lock = threading.RLock()
+    _publish_lock = threading.Lock()
 
     @staticmethod
     def get_message_qos(message_name):
-        base_profile = MYPublisher.qos_mapping.get(message_name)
-        
-        if base_profile:
-            try:
-                topic_qos = MYPublisher.provider.topic_qos_from_profile(base_profile)
-                writer_qos = MYPublisher.provider.datawriter_qos_from_profile(base_profile)
-                print(f"Loaded QoS for {message_name}: {base_profile}")
-                return topic_qos, writer_qos
-            except Exception as e:
-                print(f"QoS load failed for {message_name}: {e}")
-        else:
-            print(f"No QoS mapping found for {message_name}, using default")
-        
-        return dds.TopicQos(), dds.DataWriterQos()
+        # QoS 파일은 QosResolver 가 한 번만 읽고, base profile 별로 resolve 결과를 캐시
+        if QosResolver.base_profile(message_name) is None:
+            log.info("No QoS mapping found for %s, using default", message_name)
+        return QosResolver.topic_qos(message_name), QosResolver.datawriter_qos(message_name)
 
     @staticmethod
-    def initialize_participant(domain_id: int):
+    def initialize_participant(domain_id: int, create_writers=False):
+        """Bring up the shared participant (and optionally every writer), then start publishing.
+
+        create_writers=False 이면 writer 는 첫 publish 시 생성 (지연 생성)
+        """
         if MYPublisher.participant is None:
+            # MySubscriber 와 같은 participant 사용 (QoS 파일도 한 번만 읽음)
+            MYPublisher.participant = ParticipantManager.get_participant(domain_id)
+        if create_writers:
+            MYPublisher.create_all_topics_and_writers()
+        MYPublisher._mark_ready()
+
+    @staticmethod
+    def start_initialization(domain_id: int, on_ready=None):
+        """Initialize DDS on a worker thread so the Tk thread never waits for it.
+
+        participant 와 모든 writer 를 만든 뒤 ready 로 전환하고, 그동안 publish() 된 샘플을 전송.
+        (첫 publish 시 만든 writer 로 바로 쓰면 discovery 전이라 VOLATILE reader 가 놓칠 수 있음)
+        on_ready(elapsed_s) 는 worker 스레드에서 호출된다.
+        """
+        def initialize():
+            start = time.perf_counter()
+            MYPublisher._set_status("initializing")
             try:
-                MYPublisher.provider = dds.QosProvider("file://MY_QOS_PROFILES.xml")
+                MYPublisher.initialize_participant(domain_id, create_writers=True)
+            except Exception as e:
+                log.error("DDS initialization failed: %s", e)
+                MYPublisher._set_status("failed")
+                return
+            MYPublisher.init_time = time.perf_counter() - start
+            log.info("DDS ready: %d writers in %.1f ms", len(MYPublisher.writers), MYPublisher.init_time * 1000)
+            if on_ready is not None:
+                on_ready(MYPublisher.init_time)
+
+        threading.Thread(target=initialize, name="DDSInit", daemon=True).start()
+
+    @staticmethod
+    def set_offline(reason):
+        """Run without DDS (e.g. capture replay): publish() raises instead of queuing.
 
-                MYPublisher.load_qos_mapping()
+        대기 중인 샘플은 버리고, publish worker 를 통한 송신은 FAILED 로 보고된다.
+        """
+        with MYPublisher._publish_lock:
+            dropped, MYPublisher.pending = MYPublisher.pending, []
+            MYPublisher.offline_reason = reason
+            MYPublisher.status = "offline"
+        if dropped:
+            log.warning("Dropped %d samples queued before going offline (%s)", len(dropped), reason)
+        MYPublisher._notify_status()
 
-                MYPublisher.participant_qos = MYPublisher.provider.participant_qos_from_profile("k1pqos::ParticipantQos")                
-                MYPublisher.participant = dds.DomainParticipant(domain_id, qos=MYPublisher.participant_qos)
+    @staticmethod
+    def _check_offline(message_name):
+        if MYPublisher.status == "offline":
+            raise RuntimeError(f"DDS is offline ({MYPublisher.offline_reason}): {message_name} not sent")
+
+    @staticmethod
+    def _mark_ready():
+        with MYPublisher._publish_lock:
+            if MYPublisher.ready:
+                return
+            pending, MYPublisher.pending = MYPublisher.pending, []
+            flushed = set()
+            for message_name, sample in pending:
+                try:
+                    MYPublisher.get_writer(message_name).write(sample)
+                    flushed.add(message_name)
+                except Exception as e:
+                    log.error("Queued %s could not be sent: %s", message_name, e)
+            # batching writer 에 남은 샘플 전송
+            for message_name in flushed & MYPublisher.batch_topics.keys():
+                MYPublisher.writers[message_name].flush()
+            # 대기 샘플을 모두 보낸 뒤 ready -> 이후 publish 와 순서가 뒤바뀌지 않음
+            MYPublisher.ready = True
+        if pending:
+            log.info("Sent %d samples queued during DDS initialization", len(pending))
+        MYPublisher._set_status("ready")
 
-                MYPublisher.create_all_topics_and_writers()
-                
+    @staticmethod
+    def _set_status(status):
+        MYPublisher.status = status
+        MYPublisher._notify_status()
+
+    @staticmethod
+    def _notify_status():
+        for listener in list(MYPublisher.status_listeners):
+            try:
+                listener()
             except Exception as e:
-                print(f"Initialization error: {e}")
-                MYPublisher.participant = dds.DomainParticipant(domain_id)
-                  
+                log.exception("Status listener failed: %s", e)
+
+    @staticmethod
+    def publish(message_name, sample):
+        """Write sample on message_name's writer; before DDS is ready, queue it instead.
+
+        Returns True if written now, False if queued.
+        offline (set_offline) 이면 RuntimeError.
+        """
+        if not MYPublisher.ready:
+            MYPublisher._check_offline(message_name)
+            with MYPublisher._publish_lock:
+                if not MYPublisher.ready:
+                    MYPublisher.pending.append((message_name, sample))
+                    queued = len(MYPublisher.pending)
+                else:
+                    queued = 0
+            if queued:
+                log.info("%s queued until DDS is ready (%d pending)", message_name, queued)
+                MYPublisher._notify_status()
+                return False
+
+        writer = MYPublisher.get_writer(message_name)
+        writer.write(sample)
+        if message_name in MYPublisher.batch_topics:
+            # batching writer: 단건도 batch 가 찰 때까지 기다리지 않고 바로 전송
+            writer.flush()
+        return True
+
+    @staticmethod
+    def publish_batch(message_name, samples):
+        """Write samples (e.g. one per tube) as one operation with a single flush.
+
+        모든 샘플을 write 한 뒤 한 번만 flush (batch_topics 의 writer 는 한 batch 로 전송).
+        Returns True if written now, False if queued until DDS is ready.
+        실패한 샘플이 있으면 나머지를 모두 보낸 뒤 RuntimeError (실패 건수/원인 포함).
+        offline (set_offline) 이면 RuntimeError.
+        """
+        if not MYPublisher.ready:
+            MYPublisher._check_offline(message_name)
+            with MYPublisher._publish_lock:
+                if not MYPublisher.ready:
+                    MYPublisher.pending.extend((message_name, sample) for sample in samples)
+                    queued = len(MYPublisher.pending)
+                else:
+                    queued = 0
+            if queued:
+                log.info("%d %s samples queued until DDS is ready (%d pending)", len(samples), message_name, queued)
+                MYPublisher._notify_status()
+                return False
+
+        writer = MYPublisher.get_writer(message_name)
+        errors = []
+        try:
+            for index, sample in enumerate(samples):
+                try:
+                    writer.write(sample)
+                except Exception as e:
+                    errors.append(f"#{index + 1}: {e}")
+        finally:
+            writer.flush()
+
+        if errors:
+            raise RuntimeError(f"{len(errors)} of {len(samples)} {message_name} samples failed ({'; '.join(errors)})")
+        log.info("%s batch of %d sent", message_name, len(samples))
+        return True
+
+    @staticmethod
+    def get_worker():
+        """Return the background publish worker, starting it on first use."""
+        if MYPublisher.worker is None:
+            with MYPublisher._writer_lock:
+                if MYPublisher.worker is None:
+                    MYPublisher.worker = PublishWorker(MYPublisher.publish, MYPublisher.publish_batch)
+        return MYPublisher.worker
+
+    @staticmethod
+    def acquire_message(message_name):
+        """Return a reset, reusable message object for message_name (send it with publish_async(..., release=True))."""
+        return MYPublisher.pool.acquire(MYPublisher.message_types[message_name])
+
+    @staticmethod
+    def publish_async(message_name, sample, on_done=None, release=False):
+        """Hand sample to the publish worker and return immediately (Tk 스레드용).
+
+        on_done(status, error) 는 전송/대기/교체/거부 후 호출 (aiep_publish_worker 의 상태 상수).
+        release=True: acquire_message() 로 받은 sample 을 worker 완료 통지 (전송/교체/거부/실패) 후 pool 에 반납
+        (QUEUED 는 DDS 준비 전 pending 이 보관하므로 반납하지 않음). 호출자는 반납 후 sample 을 참조하지 말 것.
+        Returns False if the publish queue is full.
+        """
+        if release:
+            on_done = MYPublisher._release_when_done(sample, on_done)
+        return MYPublisher.get_worker().submit(message_name, sample, on_done)
+
+    @staticmethod
+    def _release_when_done(sample, on_done):
+        def done(status, error):
+            try:
+                if on_done is not None:
+                    on_done(status, error)
+            finally:
+                if status != QUEUED:
+                    MYPublisher.pool.release(sample)
+        return done
+
+    @staticmethod
+    def publish_batch_async(message_name, samples, on_done=None):
+        """publish_batch() on the publish worker; on_done(status, error) reports the whole batch once."""
+        return MYPublisher.get_worker().submit_batch(message_name, samples, on_done)
+
+    @staticmethod
+    def get_writer(message_name):
+        """Return the writer for message_name, creating its topic and writer on first use."""
+        writer = MYPublisher.writers.get(message_name)
+        if writer is None:
+            with MYPublisher._writer_lock:
+                writer = MYPublisher.writers.get(message_name)
+                if writer is None:
+                    writer = MYPublisher._create_writer(MYPublisher.message_types[message_name])
+        return writer
+
+    @staticmethod
+    def _create_writer(message_class):
+        if MYPublisher.participant is None:
+            raise RuntimeError("MYPublisher.initialize_participant() has not been called")
+
+        start = time.perf_counter()
+        message_name = message_class.__name__
+        topic_qos, writer_qos = MYPublisher.get_message_qos(message_name)
+
+        topic = ParticipantManager.get_topic(message_name, message_class, topic_qos)
+
+        max_samples = MYPublisher.batch_topics.get(message_name)
+        if max_samples:
+            # QosResolver 의 QoS 는 공유 객체이므로 복사 후 batch 설정
+            writer_qos = dds.DataWriterQos(writer_qos)
+            writer_qos.batch.enable = True
+            writer_qos.batch.max_samples = max_samples
+        setattr(MYPublisher, f"topic{message_name}", topic)
+
+        writer = dds.DataWriter(MYPublisher.participant.implicit_publisher, topic, qos=writer_qos)
+        setattr(MYPublisher, f"writer{message_name}", writer)
+        MYPublisher.writers[message_name] = writer
+
+        log.info("Created topic%s and writer%s (%.1f ms)", message_name, message_name,
+                 (time.perf_counter() - start) * 1000)
+        return writer
+
     @staticmethod
     def create_all_topics_and_writers():
-        message_classes = [
-            CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST,
-            CMSHCI_AIEP_M_MINE_SELECTED_PLAN,
-            CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ,
-            CMSHCI_AIEP_PA_INFO,
-            CMSHCI_AIEP_WPN_CTRL_CMD,
-            CMSHCI_AIEP_WPN_GEO_WAYPOINTS,
-            CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ,
-            TEWA_ASSIGN_CMD,
-            TEWA_WA_TUBE_LOAD_INFO,
-            TRKMGR_SYSTEMTARGET_INFO,
-            NAVINF_SHIP_NAVIGATION_INFO,
-            TEWA_WA_TUBE_LOAD_INFO, 
-            AIEP_INTERNAL_INFER_REQ,
-            AIEP_WPN_CTRL_STATUS_INFO
-        ]
-        
-        for message_class in message_classes:
-            message_name = message_class.__name__ 
-            topic_qos, writer_qos = MYPublisher.get_message_qos(message_name)
-
-            topic = dds.Topic(MYPublisher.participant, message_name, message_class, qos=topic_qos)
-            setattr(MYPublisher, f"topic{message_name}", topic)
-
-            writer = dds.DataWriter(MYPublisher.participant.implicit_publisher, topic, qos=writer_qos)
-            setattr(MYPublisher, f"writer{message_name}", writer)
-                
-            print(f"Created topic{message_name} and writer{message_name}")
-
-    @staticmethod
-    def publish_CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ():
+        # 아직 생성되지 않은 writer 만 생성
+        for message_name in MYPublisher.message_types:
+            try:
+                MYPublisher.get_writer(message_name)
+            except Exception as e:
+                log.error("Writer creation failed for %s: %s", message_name, e)
+
+    @staticmethod
+    def publish_CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ(on_done=None):
         message = CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ()
         message.bDroppingPlanReq = bool( 1 )
 
-        MYPublisher.writerCMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ.write(message)
-        print("writerCMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ is sent")
+        MYPublisher.publish_async("CMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ", message, on_done)
+        log.info("writerCMSHCI_AIEP_M_MINE_DROPPING_PLAN_REQ is queued")
 
     @staticmethod
-    def publish_TEWA_ASSIGN_CMD(data):
-        MYPublisher.writerTEWA_ASSIGN_CMD.write(data)
+    def publish_TEWA_ASSIGN_CMD(data, on_done=None):
+        MYPublisher.publish_async("TEWA_ASSIGN_CMD", data, on_done)
 
     @staticmethod
-    def publish_NAVINF_SHIP_NAVIGATION_INFO(data):
+    def publish_NAVINF_SHIP_NAVIGATION_INFO(data, on_done=None):
         """Publish ownship navigation info"""
-        MYPublisher.writerNAVINF_SHIP_NAVIGATION_INFO.write(data)
-        print("NAVINF_SHIP_NAVIGATION_INFO sent")
+        MYPublisher.publish_async("NAVINF_SHIP_NAVIGATION_INFO", data, on_done)
+        log.info("NAVINF_SHIP_NAVIGATION_INFO queued")
 
     @staticmethod
-    def publish_TEWA_WA_TUBE_LOAD_INFO(data):
+    def publish_TEWA_WA_TUBE_LOAD_INFO(data, on_done=None):
         """Publish tube load info"""
-        MYPublisher.writerTEWA_WA_TUBE_LOAD_INFO.write(data)
-        print(f"TEWA_WA_TUBE_LOAD_INFO sent for Tube {data.eTubeNum}")
+        MYPublisher.publish_async("TEWA_WA_TUBE_LOAD_INFO", data, on_done)
+        log.info("TEWA_WA_TUBE_LOAD_INFO queued for Tube %s", data.eTubeNum)
@@ -1,10 +1,9 @@
 
 import time
 import sys
-import xml.etree.ElementTree as ET
-import rti.connextdds as dds
+from Communication.aiep_transport import dds
 from typing import cast
-from dds.AIEP_AIEP_ import (
+from Communication.aiep_types import (
         AIEP_INTERNAL_INFER_RESULT_FIRE_TIME,
         AIEP_WPN_CTRL_STATUS_INFO,
         AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST,
@@ -17,81 +16,71 @@ from dds.AIEP_AIEP_ import (
         CMSHCI_AIEP_WPN_GEO_WAYPOINTS
 )
 from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_qos import QosResolver
+from Communication.aiep_state_store import StateStore
+from Communication.aiep_logger import get_logger
+from Communication.aiep_capture import CaptureWriter
+
+log = get_logger("subscriber")
 
 class MySubscriber:
     participant = None
-    provider = None
-    qos_mapping = {}
     readers = {}
-
-    @staticmethod
-    def load_qos_mapping():
-        tree = ET.parse("MY_QOS_PROFILES.xml")
-        root = tree.getroot()
-            
-        for profile in root.findall('.//qos_profile'):
-            name = profile.get('name')
-            base = profile.get('base_name')
-            if name and base:
-                MySubscriber.qos_mapping[name] = base
+    store = StateStore()  # 수신 최신값: (topic, tube_num 또는 None) -> Entry
+    handlers = {}       # message class -> decode function
+    decoders = {}       # topic_name -> decode function (reader 기준 조회용)
+    take_calls = {}     # topic_name -> take_data() 호출 횟수
+    cpu_time = {}       # topic_name -> 누적 처리 CPU 시간 (s)
+    key_fields = {}     # topic_name -> tube 키 필드 이름 (coalescing 대상 토픽만)
+    skipped_samples = {}  # topic_name -> coalescing으로 decode 생략된 샘플 수
+    coalesce_samples = True  # 키 토픽은 한 번의 take에서 키별 최신 샘플만 decode
+    capture = None      # CaptureWriter (start_capture로 활성화)
+    relay_enabled = True  # 수신 메시지의 중계 송신 (AI_INFER_RESULT_WP -> WPN_GEO_WAYPOINTS), replay 중에는 끔
 
     @staticmethod
     def get_message_qos(message_name):
-        base_profile = MySubscriber.qos_mapping.get(message_name)
-        
-        if base_profile:
-            try:
-                topic_qos = MySubscriber.provider.topic_qos_from_profile(base_profile)
-                reader_qos = MySubscriber.provider.datareader_qos_from_profile(base_profile)
-                print(f"Subscriber loaded QoS for {message_name}: {base_profile}")
-                return topic_qos, reader_qos
-            except Exception as e:
-                print(f"Subscriber QoS load failed for {message_name}: {e}")
-        else:
-            print(f"No QoS mapping found for {message_name}, using default")
-        
-        return dds.TopicQos(), dds.DataReaderQos()
+        # QoS 파일은 QosResolver 가 한 번만 읽고, base profile 별로 resolve 결과를 캐시
+        if QosResolver.base_profile(message_name) is None:
+            log.info("Subscriber No QoS mapping found for %s, using default", message_name)
+        return QosResolver.topic_qos(message_name), QosResolver.datareader_qos(message_name)
 
     @staticmethod
     def initialize_participant(domain_id: int):
         if MySubscriber.participant is None:
+            # MYPublisher 와 같은 participant 사용 (QoS 파일도 한 번만 읽음)
+            MySubscriber.participant = ParticipantManager.get_participant(domain_id)
             try:
-                MySubscriber.provider = dds.QosProvider("file://MY_QOS_PROFILES.xml")
-                MySubscriber.load_qos_mapping()
-                
-                # Participant 생성 (Publisher와 동일한 QoS 사용)
-                participant_qos = MySubscriber.provider.participant_qos_from_profile("k1pqos::ParticipantQos")                
-                MySubscriber.participant = dds.DomainParticipant(domain_id, qos=participant_qos)
-                
                 MySubscriber.create_all_topics_and_readers()
-                
             except Exception as e:
-                print(f"Subscriber initialization error: {e}")
-                MySubscriber.participant = dds.DomainParticipant(domain_id)
+                log.error("Subscriber initialization error: %s", e)
+
+    @staticmethod
+    def register_handler(message_class, handler, key_field=None):
+        """Register the decode handler for a message class (one topic per class).
+
+        key_field 를 지정하면 (예: 'enTubeNum') coalescing take 대상이 된다.
+        """
+        message_name = message_class.__name__
+        MySubscriber.handlers[message_class] = handler
+        MySubscriber.decoders[message_name] = handler
+        if key_field:
+            MySubscriber.key_fields[message_name] = key_field
+
+        # 토픽별 통계 초기화 (reader 없이 replay로 처리하는 경우 포함)
+        MySubscriber.take_calls[message_name] = 0
+        MySubscriber.cpu_time[message_name] = 0.0
+        MySubscriber.skipped_samples[message_name] = 0
 
     @staticmethod
     def create_all_topics_and_readers():
-            
-        message_classes = [
-            AIEP_INTERNAL_INFER_RESULT_FIRE_TIME,
-            AIEP_WPN_CTRL_STATUS_INFO,
-            AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST,
-            AIEP_M_MINE_EP_RESULT,
-            AIEP_AI_INFER_RESULT_WP,
-            AIEP_ALM_ASM_EP_RESULT,
-            AIEP_WGT_EP_RESULT,
-            AIEP_AAM_EP_RESULT,
-            CMSHCI_AIEP_PA_INFO,
-            CMSHCI_AIEP_WPN_GEO_WAYPOINTS
-        ]
-        
-            
-        for message_class in message_classes:
+        # 등록된 handler마다 topic/reader 하나씩 생성
+        for message_class in MySubscriber.handlers:
             message_name = message_class.__name__
             topic_qos, reader_qos = MySubscriber.get_message_qos(message_name)
             
             # Topic 생성
-            topic = dds.Topic(MySubscriber.participant, message_name, message_class, qos=topic_qos)
+            topic = ParticipantManager.get_topic(message_name, message_class, topic_qos)
             setattr(MySubscriber, f"topic{message_name}", topic)
             
             # Reader 생성
@@ -101,87 +90,180 @@ class MySubscriber:
             # readers 딕셔너리에도 저장 (기존 코드 호환성)
             MySubscriber.readers[message_name] = reader
             
-            # data_{MESSAGE_NAME} 속성 초기화
-            # 교전계획 결과 메시지는 딕셔너리로 초기화 (tube_num을 키로 사용)
-            if message_name in ['AIEP_M_MINE_EP_RESULT', 'AIEP_ALM_ASM_EP_RESULT', 
-                                 'AIEP_WGT_EP_RESULT', 'AIEP_AAM_EP_RESULT']:
-                setattr(MySubscriber, f"data_{message_name}", {})  # 딕셔너리로 초기화
-            else:
-                setattr(MySubscriber, f"data_{message_name}", None)
-            
-            print(f"Created topic{message_name}, reader{message_name}, and data_{message_name}")
+            log.info("Created topic%s and reader%s", message_name, message_name)
     
 
     @staticmethod
-    def process_data(reader):
+    def _decode_AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST(sample):
+        # 전체 자항기뢰 부설계획 목록
+        MySubscriber.store.put('AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST', None, cast(AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST, sample))
+        log.info('[Rcvd] AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST', extra={'topic': 'AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST'})
+
+    @staticmethod
+    def _decode_AIEP_M_MINE_EP_RESULT(sample):
+        # 자항기뢰 교전계획 산출 결과 - tube_num 키로 저장
+        tube_num = sample.enTubeNum
+        MySubscriber.store.put('AIEP_M_MINE_EP_RESULT', tube_num, cast(AIEP_M_MINE_EP_RESULT, sample))
+        log.info('[Rcvd] AIEP_M_MINE_EP_RESULT from Tube %s', tube_num, extra={'topic': f'AIEP_M_MINE_EP_RESULT/{tube_num}'})
+
+    @staticmethod
+    def _decode_AIEP_ALM_ASM_EP_RESULT(sample):
+        # ALM/ASM EP Result - tube_num 키로 저장
+        tube_num = sample.enTubeNum
+        MySubscriber.store.put('AIEP_ALM_ASM_EP_RESULT', tube_num, cast(AIEP_ALM_ASM_EP_RESULT, sample))
+        log.info('[Rcvd] AIEP_ALM_ASM_EP_RESULT from Tube %s', tube_num, extra={'topic': f'AIEP_ALM_ASM_EP_RESULT/{tube_num}'})
+
+    @staticmethod
+    def _decode_AIEP_WGT_EP_RESULT(sample):
+        # WGT EP Result - tube_num 키로 저장
+        tube_num = sample.enTubeNum
+        MySubscriber.store.put('AIEP_WGT_EP_RESULT', tube_num, cast(AIEP_WGT_EP_RESULT, sample))
+        log.info('[Rcvd] AIEP_WGT_EP_RESULT from Tube %s', tube_num, extra={'topic': f'AIEP_WGT_EP_RESULT/{tube_num}'})
+
+    @staticmethod
+    def _decode_AIEP_AAM_EP_RESULT(sample):
+        # AAM EP Result - tube_num 키로 저장
+        tube_num = sample.eTubeNum
+        MySubscriber.store.put('AIEP_AAM_EP_RESULT', tube_num, cast(AIEP_AAM_EP_RESULT, sample))
+        log.info('[Rcvd] AIEP_AAM_EP_RESULT from Tube %s', tube_num, extra={'topic': f'AIEP_AAM_EP_RESULT/{tube_num}'})
+
+    @staticmethod
+    def _decode_AIEP_INTERNAL_INFER_RESULT_FIRE_TIME(sample):
+        MySubscriber.store.put('AIEP_INTERNAL_INFER_RESULT_FIRE_TIME', None, cast(AIEP_INTERNAL_INFER_RESULT_FIRE_TIME, sample))
+
+    @staticmethod
+    def _decode_AIEP_AI_INFER_RESULT_WP(sample):
+        infer_result = cast(AIEP_AI_INFER_RESULT_WP, sample)
+        MySubscriber.store.put('AIEP_AI_INFER_RESULT_WP', None, infer_result)
+        if not MySubscriber.relay_enabled:
+            return
+
+        message = CMSHCI_AIEP_WPN_GEO_WAYPOINTS()
+        message.eTubeNum = infer_result.eTubeNum
+        message.eWpnKind = infer_result.eWpnKind
+        message.stGeoWaypoints = infer_result.stGeoWaypoints
+
+        MYPublisher.publish("CMSHCI_AIEP_WPN_GEO_WAYPOINTS", message)
+
+    @staticmethod
+    def _decode_AIEP_WPN_CTRL_STATUS_INFO(sample):
+        status_info = cast(AIEP_WPN_CTRL_STATUS_INFO, sample)
+        tubeNum = status_info.eTubeNum
+        # 발사관별로 병합(coalesce)하므로 저장도 발사관별
+        MySubscriber.store.put('AIEP_WPN_CTRL_STATUS_INFO', tubeNum, status_info)
+
+        ctrlState = status_info.eCtrlState
+        wpnTime = status_info.wpnTime
+        log.info("[Rcvd] AIEP_WPN_CTRL_STATUS_INFO.eTubeNum=%s,eCtrlState=%s,wpnTime=%s", tubeNum, ctrlState, wpnTime,
+                 extra={'topic': f'AIEP_WPN_CTRL_STATUS_INFO/{tubeNum}'})
+
+    @staticmethod
+    def _decode_CMSHCI_AIEP_PA_INFO(sample):
+        MySubscriber.store.put('CMSHCI_AIEP_PA_INFO', None, cast(CMSHCI_AIEP_PA_INFO, sample))
+
+    @staticmethod
+    def _decode_CMSHCI_AIEP_WPN_GEO_WAYPOINTS(sample):
+        MySubscriber.store.put('CMSHCI_AIEP_WPN_GEO_WAYPOINTS', None, cast(CMSHCI_AIEP_WPN_GEO_WAYPOINTS, sample))
+
+    @staticmethod
+    def process_data(reader, topic_name=None):
+        """Take all pending samples from one reader and decode them with its topic decoder."""
+        if topic_name is None:
+            topic_name = reader.topic_name
+        decode = MySubscriber.decoders[topic_name]
+
+        key_field = MySubscriber.key_fields.get(topic_name)
+        if key_field and MySubscriber.coalesce_samples:
+            return MySubscriber._process_latest_per_key(reader, topic_name, key_field, decode)
+
+        start = time.process_time()
         # take_data() returns copies of all the data samples in the reader
         # and removes them. To also take the SampleInfo meta-data, use take().
         # To not remove the data from the reader, use read_data() or read().
         samples = reader.take_data()
+        if MySubscriber.capture is not None:
+            MySubscriber._capture_samples(topic_name, samples)
         for sample in samples:
-            # 전체 자항기뢰 부설계획 목록
-            if isinstance(sample, AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST):
-                MySubscriber.data_AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST = cast(AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST, sample)
-                print('[Rcvd] AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST')
-
-            # 자항기뢰 교전계획 산출 결과 - 딕셔너리에 저장
-            if isinstance(sample, AIEP_M_MINE_EP_RESULT):
-                tube_num = sample.enTubeNum
-                MySubscriber.data_AIEP_M_MINE_EP_RESULT[tube_num] = cast(AIEP_M_MINE_EP_RESULT, sample)
-                print(f'[Rcvd] AIEP_M_MINE_EP_RESULT from Tube {tube_num}')
-    
-            # ALM/ASM EP Result - 딕셔너리에 저장
-            if isinstance(sample, AIEP_ALM_ASM_EP_RESULT):
-                tube_num = sample.enTubeNum
-                MySubscriber.data_AIEP_ALM_ASM_EP_RESULT[tube_num] = cast(AIEP_ALM_ASM_EP_RESULT, sample)
-                print(f'[Rcvd] AIEP_ALM_ASM_EP_RESULT from Tube {tube_num}')
-        
-            # WGT EP Result - 딕셔너리에 저장
-            if isinstance(sample, AIEP_WGT_EP_RESULT):
-                tube_num = sample.enTubeNum
-                MySubscriber.data_AIEP_WGT_EP_RESULT[tube_num] = cast(AIEP_WGT_EP_RESULT, sample)
-                print(f'[Rcvd] AIEP_WGT_EP_RESULT from Tube {tube_num}')
-        
-            # AAM EP Result - 딕셔너리에 저장
-            if isinstance(sample, AIEP_AAM_EP_RESULT):
-                tube_num = sample.eTubeNum
-                MySubscriber.data_AIEP_AAM_EP_RESULT[tube_num] = cast(AIEP_AAM_EP_RESULT, sample)
-                print(f'[Rcvd] AIEP_AAM_EP_RESULT from Tube {tube_num}')
-
-
-            if isinstance(sample, AIEP_INTERNAL_INFER_RESULT_FIRE_TIME):
-                MySubscriber.data_AIEP_INTERNAL_INFER_RESULT_FIRE_TIME = cast(AIEP_INTERNAL_INFER_RESULT_FIRE_TIME, sample)
-                
-            if isinstance(sample, AIEP_AI_INFER_RESULT_WP):
-                MySubscriber.data_AIEP_AI_INFER_RESULT_WP = cast(AIEP_AI_INFER_RESULT_WP, sample)
-
-                message = CMSHCI_AIEP_WPN_GEO_WAYPOINTS()
-                message.eTubeNum = MySubscriber.data_AIEP_AI_INFER_RESULT_WP.eTubeNum
-                message.eWpnKind = MySubscriber.data_AIEP_AI_INFER_RESULT_WP.eWpnKind
-                message.stGeoWaypoints = MySubscriber.data_AIEP_AI_INFER_RESULT_WP.stGeoWaypoints
-
-                MYPublisher.writerCMSHCI_AIEP_WPN_GEO_WAYPOINTS.write(message)
-                
-            if isinstance(sample, AIEP_WPN_CTRL_STATUS_INFO):
-                MySubscriber.data_AIEP_WPN_CTRL_STATUS_INFO = cast(AIEP_WPN_CTRL_STATUS_INFO, sample)
-                
-                tubeNum = MySubscriber.data_AIEP_WPN_CTRL_STATUS_INFO.eTubeNum
-                ctrlState = MySubscriber.data_AIEP_WPN_CTRL_STATUS_INFO.eCtrlState
-                wpnTime = MySubscriber.data_AIEP_WPN_CTRL_STATUS_INFO.wpnTime
-                print(f"[Rcvd] AIEP_WPN_CTRL_STATUS_INFO.eTubeNum={tubeNum},eCtrlState={ctrlState},wpnTime={wpnTime}]")
+            decode(sample)
 
+        MySubscriber.take_calls[topic_name] += 1
+        MySubscriber.cpu_time[topic_name] += time.process_time() - start
         return len(samples)
 
+    @staticmethod
+    def _process_latest_per_key(reader, topic_name, key_field, decode):
+        """Take all pending samples but decode only the newest valid sample per key.
+
+        key 들은 마지막 수신 순서대로 decode (여러 key 가 섞여 와도 가장 최근 key 가 마지막)
+        """
+        start = time.process_time()
+        # take()는 (data, SampleInfo) 쌍을 수신 순서대로 반환
+        # dispose/unregister 통지(info.valid == False)는 data가 없으므로 제외
+        samples = reader.take()
+        latest = {}
+        valid_count = 0
+        for data, info in samples:
+            if not info.valid:
+                continue
+            valid_count += 1
+            key = getattr(data, key_field)
+            # 다시 넣어 dict 순서를 해당 key 의 마지막 수신 위치로 이동
+            latest.pop(key, None)
+            latest[key] = data
+
+        # 캡처는 생략된 샘플까지 모두 기록
+        if MySubscriber.capture is not None:
+            MySubscriber._capture_samples(topic_name, [data for data, info in samples if info.valid])
+
+        for sample in latest.values():
+            decode(sample)
+
+        MySubscriber.take_calls[topic_name] += 1
+        MySubscriber.skipped_samples[topic_name] += valid_count - len(latest)
+        MySubscriber.cpu_time[topic_name] += time.process_time() - start
+        return len(samples)
+
+    @staticmethod
+    def _capture_samples(topic_name, samples):
+        timestamp = time.time()
+        for sample in samples:
+            MySubscriber.capture.record(topic_name, sample, timestamp)
+
+    @staticmethod
+    def start_capture(directory):
+        """Record every received sample to capture files under directory."""
+        if MySubscriber.capture is None:
+            MySubscriber.capture = CaptureWriter(directory)
+            log.info("Capturing received samples to %s", directory)
+
+    @staticmethod
+    def stop_capture():
+        capture, MySubscriber.capture = MySubscriber.capture, None
+        if capture is not None:
+            capture.close()
+
+    @staticmethod
+    def log_statistics(samples_read):
+        """토픽별 수신 샘플 수, take 호출 수, 샘플당 CPU 시간 기록"""
+        for topic_name, count in samples_read.items():
+            take_calls = MySubscriber.take_calls.get(topic_name, 0)
+            cpu_us = MySubscriber.cpu_time.get(topic_name, 0.0) * 1e6
+            per_sample = cpu_us / count if count else 0.0
+            skipped = MySubscriber.skipped_samples.get(topic_name, 0)
+            log.info("  %s: %d samples, %d takes, %d skipped, %.1f us/sample",
+                     topic_name, count, take_calls, skipped, per_sample)
+
     @staticmethod
     def run_subscriber(domain_id: int, sample_count: int):
         MySubscriber.initialize_participant(domain_id)
         samples_read = {topic_name: 0 for topic_name in MySubscriber.readers.keys()}
 
-        def condition_handler(_):
-            """Handler for processing data when status condition is triggered."""
-            nonlocal samples_read
-            for topic_name, reader in MySubscriber.readers.items():
-                samples_read[topic_name] += MySubscriber.process_data(reader)
+        def make_condition_handler(topic_name, reader):
+            """Bind a StatusCondition handler to its own reader only."""
+            def condition_handler(_):
+                """Handler for processing data when status condition is triggered."""
+                samples_read[topic_name] += MySubscriber.process_data(reader, topic_name)
+            return condition_handler
 
         # Create a WaitSet and attach StatusConditions for all readers
         waitset = dds.WaitSet()
@@ -191,17 +273,29 @@ class MySubscriber:
             status_condition = dds.StatusCondition(reader)
 
             # Enable the "data available" status and set the handler.
+            # 각 Condition은 자신의 reader만 처리 (다른 reader는 take하지 않음)
             status_condition.enabled_statuses = dds.StatusMask.DATA_AVAILABLE
-            status_condition.set_handler(condition_handler)
+            status_condition.set_handler(make_condition_handler(topic_name, reader))
 
             # Attach the StatusCondition to the WaitSet
             waitset += status_condition
 
         # Main loop to wait for data
-        print("Waiting for data...")
+        log.info("Waiting for data...")
         while any(count < sample_count for count in samples_read.values()):
             waitset.dispatch(dds.Duration(1))  # Wait for 1 second intervals
-            print(".",end='',flush=True)
-        print("Sample count reached for all topics:")
-        for topic_name, count in samples_read.items():
-            print(f"  {topic_name}: {count} samples")
+        log.info("Sample count reached for all topics:")
+        MySubscriber.log_statistics(samples_read)
+
+
+# 수신 토픽 등록 (새 토픽은 handler 등록만으로 추가)
+MySubscriber.register_handler(AIEP_INTERNAL_INFER_RESULT_FIRE_TIME, MySubscriber._decode_AIEP_INTERNAL_INFER_RESULT_FIRE_TIME)
+MySubscriber.register_handler(AIEP_WPN_CTRL_STATUS_INFO, MySubscriber._decode_AIEP_WPN_CTRL_STATUS_INFO, key_field='eTubeNum')
+MySubscriber.register_handler(AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST, MySubscriber._decode_AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST)
+MySubscriber.register_handler(AIEP_M_MINE_EP_RESULT, MySubscriber._decode_AIEP_M_MINE_EP_RESULT, key_field='enTubeNum')
+MySubscriber.register_handler(AIEP_AI_INFER_RESULT_WP, MySubscriber._decode_AIEP_AI_INFER_RESULT_WP)
+MySubscriber.register_handler(AIEP_ALM_ASM_EP_RESULT, MySubscriber._decode_AIEP_ALM_ASM_EP_RESULT, key_field='enTubeNum')
+MySubscriber.register_handler(AIEP_WGT_EP_RESULT, MySubscriber._decode_AIEP_WGT_EP_RESULT, key_field='enTubeNum')
+MySubscriber.register_handler(AIEP_AAM_EP_RESULT, MySubscriber._decode_AIEP_AAM_EP_RESULT, key_field='eTubeNum')
+MySubscriber.register_handler(CMSHCI_AIEP_PA_INFO, MySubscriber._decode_CMSHCI_AIEP_PA_INFO)
+MySubscriber.register_handler(CMSHCI_AIEP_WPN_GEO_WAYPOINTS, MySubscriber._decode_CMSHCI_AIEP_WPN_GEO_WAYPOINTS)
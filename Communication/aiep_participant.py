@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_participant.py
+MYPublisher / MySubscriber 공용 DomainParticipant 관리
+- 프로세스당 DomainParticipant 1개 (participant 별 discovery / DDS 내부 스레드가 하나로 줄어듦)
+  절감량은 RTI 환경에서 bench_participant_startup 으로 측정 (loopback 은 participant 비용이 없어 차이 없음)
+- QoS 는 QosResolver 에서 가져옴 (MY_QOS_PROFILES.xml 은 한 번만 읽음)
+- Topic 은 이름별로 공유 (같은 participant 에 같은 이름의 Topic 을 두 번 만들 수 없음)
+- publisher / subscriber 스레드가 동시에 호출해도 한 번만 생성
+"""
+
+import threading
+import time
+from Communication.aiep_transport import dds
+from Communication.aiep_qos import QosResolver
+from Communication.aiep_logger import get_logger
+
+log = get_logger("participant")
+
+PARTICIPANT_PROFILE = "k1pqos::ParticipantQos"
+
+
+class ParticipantManager:
+    participant = None
+    domain_id = None
+    topics = {}         # topic_name -> Topic
+    startup_time = None  # participant 생성 소요 시간 (s)
+    _lock = threading.RLock()
+
+    @staticmethod
+    def get_participant(domain_id: int):
+        """Return the process-wide participant, creating it on first call."""
+        with ParticipantManager._lock:
+            if ParticipantManager.participant is not None:
+                if domain_id != ParticipantManager.domain_id:
+                    raise ValueError(f"Participant already created on domain {ParticipantManager.domain_id}, "
+                                     f"requested domain {domain_id}")
+                return ParticipantManager.participant
+
+            start = time.perf_counter()
+            try:
+                QosResolver.load()
+                participant_qos = QosResolver.participant_qos(PARTICIPANT_PROFILE)
+                ParticipantManager.participant = dds.DomainParticipant(domain_id, qos=participant_qos)
+
+            except Exception as e:
+                log.error("Participant initialization error: %s", e)
+                ParticipantManager.participant = dds.DomainParticipant(domain_id)
+
+            ParticipantManager.domain_id = domain_id
+            ParticipantManager.startup_time = time.perf_counter() - start
+            log.info("DomainParticipant created on domain %d in %.1f ms",
+                     domain_id, ParticipantManager.startup_time * 1000)
+            return ParticipantManager.participant
+
+    @staticmethod
+    def get_topic(message_name, message_class, topic_qos):
+        """Return the shared Topic for message_name (created once with the first caller's QoS)."""
+        with ParticipantManager._lock:
+            topic = ParticipantManager.topics.get(message_name)
+            if topic is None:
+                topic = dds.Topic(ParticipantManager.participant, message_name, message_class, qos=topic_qos)
+                ParticipantManager.topics[message_name] = topic
+            return topic
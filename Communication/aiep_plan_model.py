@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_plan_model.py
+자항기뢰 부설계획 편집용 배열 모델 (NumPy structured array)
+- 목록 슬롯 15개를 한 배열에: 목록 필드 + stPlan (계획 15 x 경로점 8) + stOwnshipWaypoint (자함 변침점 40)
+- dtype 은 메시지 타입의 필드 정보 (aiep_types.field_types) 와 기본값의 배열 길이로 생성 (IDL 폭/enum 그대로)
+- 슬롯 순열 order: 화면 순서 i 의 목록은 저장 행 order[i]
+  목록 삽입/삭제는 order 만 바꾸고 비는 행 하나만 초기화 (필드 복사 없이 O(목록 수))
+- DDS 메시지와의 변환은 from_message (창 열기) / to_message (송신, order 순서로 생성) 에서만
+  필드별 열 단위로 읽고 (np.fromiter), 구조체별로 열을 묶어 한 번에 생성 (enum 필드는 enum 타입으로)
+  to_message 는 내용이 바뀐 목록만 새로 생성하고, 그대로인 목록은 직전 메시지 (또는 받은 메시지) 의 객체를 재사용
+  마지막으로 읽은 받은 메시지의 배열을 보관: 같은 샘플로 창을 다시 열면 배열 복사만
+  (새 샘플은 모든 객체의 필드를 읽어야 하므로 객체 수에 비례, 읽기만으로 기존 복사의 약 40%)
+  -> 송신/수신한 메시지 객체는 수정하지 않음 (StateStore 샘플과 같은 규칙)
+- 빈 목록/계획 판별, 계획 수, sListID 재정렬, 경로점 삭제는 배열 연산
+- list_slot / plan / list_plans / ownship_waypoints 는 저장 배열의 view: plan["usWeaponID"] = 3 처럼 바로 수정됨
+- 이름/설명 char 배열은 set_list_name / set_plan_text 등 모델 메서드로만 수정 (text_version 증가 -> decode 캐시 갱신)
+"""
+
+from enum import Enum
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import NamedTuple, Optional
+import weakref
+import numpy as np
+from Communication.aiep_char_codec import DecodeCache, char_codes, write_chars
+from Communication.aiep_types import field_types, ST_M_MINE_PLAN_LIST, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
+
+
+class _Field(NamedTuple):
+    name: str
+    dtype: np.dtype                  # 원소 dtype (구조체는 structured dtype)
+    length: int                      # 고정 배열 길이 (0 = 단일 값)
+    struct: Optional["_Struct"]      # 중첩 구조체 (기본 타입이면 None)
+    enum: Optional[type]             # 메시지에 쓸 때 변환할 enum 타입
+    container: Optional[type]        # 기본 타입 배열의 컨테이너 (list 가 아닐 때만)
+
+
+class _Struct(NamedTuple):
+    cls: type
+    dtype: np.dtype
+    fields: tuple
+
+
+@lru_cache(maxsize=None)
+def _struct_schema(struct_class):
+    """struct_class 의 dtype 과 필드별 변환 정보 (배열 길이, enum 타입은 기본값 객체에서)"""
+    template = struct_class()
+    fields, dtype_fields = [], []
+    for name, field_type in field_types(struct_class).items():
+        value = getattr(template, name)
+        length = len(value) if hasattr(value, "__len__") else 0
+        element = value[0] if length else value
+        struct = _struct_schema(type(element)) if field_type.dtype is None else None
+        dtype = struct.dtype if struct is not None else np.dtype(field_type.dtype)
+        enum = type(element) if field_type.enum and isinstance(element, Enum) else None
+        container = type(value) if length and struct is None and type(value) is not list else None
+        fields.append(_Field(name, dtype, length, struct, enum, container))
+        dtype_fields.append((name, dtype, (length,)) if length else (name, dtype))
+    return _Struct(struct_class, np.dtype(dtype_fields), tuple(fields))
+
+
+_LIST = _struct_schema(ST_M_MINE_PLAN_LIST)
+_MESSAGE = _struct_schema(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+
+_PLAN = next(field.struct for field in _LIST.fields if field.name == "stPlan")
+_PLAN_ENUMS = {field.name: field.enum for field in _PLAN.fields if field.enum is not None}
+
+LIST_DTYPE = _LIST.dtype
+PLAN_DTYPE = LIST_DTYPE["stPlan"].base
+WAYPOINT_DTYPE = PLAN_DTYPE["stWaypoint"].base
+OWNSHIP_WAYPOINT_DTYPE = LIST_DTYPE["stOwnshipWaypoint"].base
+
+PLAN_LISTS = _MESSAGE.dtype["stMinePlanList"].shape[0]
+PLANS_PER_LIST = LIST_DTYPE["stPlan"].shape[0]
+PLAN_WAYPOINTS = PLAN_DTYPE["stWaypoint"].shape[0]
+OWNSHIP_WAYPOINTS = LIST_DTYPE["stOwnshipWaypoint"].shape[0]
+DESCRIPTION_LENGTH = LIST_DTYPE["chDescription"].shape[0]
+
+# str.strip() 이 지우는 ASCII 공백 (빈 목록 이름 판별용 byte -> bool 표)
+_IS_SPACE = np.zeros(256, dtype=bool)
+_IS_SPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def check_plan_enum(name, value):
+    """Return value, raising ValueError if plan field name is an IDL enum without that value.
+
+    배열에는 정수로 저장되므로 편집 창에서 검사 (검사하지 않으면 to_message 의 enum 변환에서 ValueError)
+    """
+    enum = _PLAN_ENUMS.get(name)
+    if enum is not None:
+        enum(value)
+    return value
+
+
+class PlanModel:
+    """Array-backed copy of an M_MINE plan list message for editing."""
+
+    _last_read = None  # (받은 메시지 weakref, 읽은 목록 배열): 같은 샘플이면 from_message 에서 복사만
+
+    def __init__(self):
+        self.list_count = 0
+        self.text_version = 0  # 이름/설명 char 배열 또는 목록 순서가 바뀔 때마다 증가
+        self._decoded = DecodeCache()
+        self.order = np.arange(PLAN_LISTS)  # 화면 순서 -> 저장 행
+        self._slots = np.zeros(PLAN_LISTS, LIST_DTYPE)
+        # 자주 쓰는 필드 view (저장 순서)
+        self._plans = self._slots["stPlan"]
+        self._ownship = self._slots["stOwnshipWaypoint"]
+        self._built = {}  # 저장 행 -> (행 bytes, 그 내용으로 만든 ST_M_MINE_PLAN_LIST 객체)
+
+    # ------------------------------------------------------------------
+    # DDS 메시지 변환
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_message(cls, message):
+        """Build a model from an ALL_PLAN_LIST / EDITED_PLAN_LIST sample."""
+        model = cls()
+        model.list_count = message.usPlanListCnt
+        last = cls._last_read
+        if last is not None and last[0]() is message:
+            model._slots[...] = last[1]
+        else:
+            _read_columns(message.stMinePlanList, _LIST, model._slots)
+            cls._last_read = (weakref.ref(message), model._slots.copy())
+        rows = _row_bytes(model._slots)
+        model._built = {row: (rows[row].tobytes(), plan_list) for row, plan_list in enumerate(message.stMinePlanList)}
+        return model
+
+    def to_message(self, message_class):
+        """Return a new message_class sample (EDITED_PLAN_LIST) holding the lists in display order.
+
+        바뀌지 않은 목록은 이전 객체를 재사용하므로 반환한 메시지는 수정하지 않는다.
+        """
+        rows = _row_bytes(self._slots)
+        plan_lists = [None] * PLAN_LISTS
+        changed = []
+        for position, row in enumerate(self.order.tolist()):
+            data = rows[row].tobytes()
+            built = self._built.get(row)
+            if built is not None and built[0] == data:
+                plan_lists[position] = built[1]
+            else:
+                changed.append((position, row, data))
+        if changed:
+            # 바뀐 목록만 한 번에 생성
+            objects = _build_objects(self._slots[[row for _, row, _ in changed]], _LIST)
+            for (position, row, data), plan_list in zip(changed, objects):
+                plan_lists[position] = plan_list
+                self._built[row] = (data, plan_list)
+        return message_class(usPlanListCnt=int(self.list_count), stMinePlanList=plan_lists)
+
+    # ------------------------------------------------------------------
+    # 슬롯 접근 (화면 순서 index)
+    # ------------------------------------------------------------------
+
+    def list_slot(self, list_index):
+        """목록 record (저장 배열 view)"""
+        return self._slots[self.order[list_index]]
+
+    def list_plans(self, list_index):
+        """목록의 계획 PLANS_PER_LIST 개 (저장 배열 view)"""
+        return self._plans[self.order[list_index]]
+
+    def plan(self, list_index, plan_index):
+        """계획 record (저장 배열 view)"""
+        return self._plans[self.order[list_index], plan_index]
+
+    def ownship_waypoints(self, list_index):
+        """목록의 자함 변침점 OWNSHIP_WAYPOINTS 개 (저장 배열 view)"""
+        return self._ownship[self.order[list_index]]
+
+    def list_field(self, name):
+        """목록 필드 (sListID 등) 를 화면 순서로 (복사본)"""
+        return self._slots[name][self.order]
+
+    # ------------------------------------------------------------------
+    # 조회 (배열 연산)
+    # ------------------------------------------------------------------
+
+    def list_names(self):
+        """목록 이름 PLAN_LISTS 개 (text_version 이 같으면 이전 변환 결과 재사용)"""
+        names = self._stored_names()
+        return [names[row] for row in self.order.tolist()]
+
+    def _stored_names(self):
+        # 저장 순서로 캐시 (목록 순서가 바뀌어도 행별 내용은 그대로)
+        return self._decoded.rows("chDescription", self.text_version, self._slots["chDescription"])
+
+    def plan_texts(self, list_index):
+        """list_index 목록의 계획 설명 PLANS_PER_LIST 개"""
+        texts = self._decoded.rows("cAdditionalText", self.text_version, self._plans["cAdditionalText"])
+        row = self.order[list_index]
+        return texts[row * PLANS_PER_LIST:(row + 1) * PLANS_PER_LIST]
+
+    def list_name(self, list_index):
+        return self._stored_names()[self.order[list_index]]
+
+    def set_list_name(self, list_index, name):
+        write_chars(self.list_slot(list_index)["chDescription"], name)
+        self.text_version += 1
+
+    def plan_text(self, list_index, plan_index):
+        return self.plan_texts(list_index)[plan_index]
+
+    def set_plan_text(self, list_index, plan_index, text):
+        write_chars(self.plan(list_index, plan_index)["cAdditionalText"], text)
+        self.text_version += 1
+
+    def list_empty_mask(self):
+        """bool[PLAN_LISTS]: 이름이 비어 있고, sListID 가 0 이거나 sListID 가 있는 계획이 없는 목록"""
+        chars = self._slots["chDescription"]
+        before_nul = np.logical_and.accumulate(chars != 0, axis=1)
+        named = (before_nul & ~_IS_SPACE[chars]).any(axis=1)
+        has_plan = (self._plans["sListID"] != 0).any(axis=1)
+        return (~named & ((self._slots["sListID"] == 0) | ~has_plan))[self.order]
+
+    def plan_empty_mask(self):
+        """bool[PLAN_LISTS, PLANS_PER_LIST]: sListID 와 계획 번호가 모두 0 인 계획"""
+        plans = self._plans
+        return ((plans["sListID"] == 0) & (plans["usDroppingPlanNumber"] == 0))[self.order]
+
+    def valid_plan_counts(self):
+        """int[PLAN_LISTS]: 목록별 비어 있지 않은 계획 수"""
+        return PLANS_PER_LIST - self.plan_empty_mask().sum(axis=1)
+
+    def first_empty_list(self):
+        """첫 번째 빈 목록 index (없으면 -1)"""
+        empty = np.flatnonzero(self.list_empty_mask())
+        return int(empty[0]) if len(empty) else -1
+
+    def first_empty_plan(self, list_index):
+        """list_index 목록의 첫 번째 빈 계획 index (없으면 -1)"""
+        empty = np.flatnonzero(self.plan_empty_mask()[list_index])
+        return int(empty[0]) if len(empty) else -1
+
+    # ------------------------------------------------------------------
+    # 편집 (배열 연산)
+    # ------------------------------------------------------------------
+
+    def clear_list(self, list_index):
+        """목록 슬롯 하나를 기본값으로 (계획, 자함 변침점 포함)"""
+        _row_bytes(self._slots)[self.order[list_index]] = 0
+        self.text_version += 1
+
+    def insert_list(self, index, name):
+        """index 위치에 이름만 있는 새 목록 삽입 (index 이후는 한 칸씩 뒤로, 마지막 목록은 밀려남)"""
+        # 마지막 목록의 저장 행을 비워 index 위치로 (나머지는 order 만 이동)
+        row = self.order[-1]
+        self.order[index + 1:] = self.order[index:-1]
+        self.order[index] = row
+        _row_bytes(self._slots)[row] = 0
+        self.set_list_name(index, name)  # text_version 증가
+
+    def delete_list(self, index):
+        """index 목록 삭제 (이후 목록을 앞으로 당기고 마지막 슬롯은 비움)"""
+        row = self.order[index]
+        self.order[index:-1] = self.order[index + 1:]
+        self.order[-1] = row
+        _row_bytes(self._slots)[row] = 0
+        self.text_version += 1
+
+    def reorder_list_ids(self):
+        """비어 있지 않은 목록의 sListID 를 1부터 순서대로 (빈 목록은 0), list_count 갱신 후 반환"""
+        active = ~self.list_empty_mask()
+        self._slots["sListID"][self.order] = np.where(active, np.cumsum(active), 0)
+        self.list_count = int(active.sum())
+        return self.list_count
+
+    def clear_plan(self, list_index, plan_index):
+        _row_bytes(self.list_plans(list_index))[plan_index] = 0
+        self.text_version += 1
+
+    def delete_plan_waypoint(self, list_index, plan_index, wp_index):
+        """계획 경로점 삭제 (뒤의 경로점을 앞으로 당기고 usWaypointCnt 감소)"""
+        plan = self.plan(list_index, plan_index)
+        _delete_row(plan["stWaypoint"], wp_index)
+        plan["usWaypointCnt"] -= 1
+
+    def delete_ownship_waypoint(self, list_index, wp_index):
+        """자함 변침점 삭제 (뒤의 변침점을 앞으로 당기고 usOwnshipWaypointCnt 감소)"""
+        row = self.order[list_index]
+        _delete_row(self._ownship[row], wp_index)
+        self._slots["usOwnshipWaypointCnt"][row] -= 1
+
+
+def _read_columns(objects, struct, out):
+    """구조체 객체 list (out 의 C 순서) 의 값을 필드별 열 단위로 out (structured 배열) 에 기록"""
+    count = len(objects)
+    for field in struct.fields:
+        values = map(attrgetter(field.name), objects)
+        target = out[field.name]
+        if field.struct is not None:
+            values = list(chain.from_iterable(values)) if field.length else list(values)
+            _read_columns(values, field.struct, target)
+        elif field.length and field.dtype.itemsize == 1:
+            # char 배열: bytes 로 이어 붙여 한 번에 변환
+            target[...] = np.frombuffer(b"".join(map(char_codes, values)), field.dtype).reshape(target.shape)
+        elif field.length:
+            target[...] = np.array(list(values), field.dtype).reshape(target.shape)
+        else:
+            target[...] = np.fromiter(values, field.dtype, count).reshape(target.shape)
+
+
+def _build_objects(values, struct):
+    """structured 배열 values 의 원소 (C 순서) -> struct.cls 객체 list (필드별 열을 묶어 생성자 호출)"""
+    columns = []
+    for field in struct.fields:
+        column = values[field.name]
+        if field.struct is not None:
+            objects = _build_objects(column, field.struct)
+            if field.length:
+                objects = [objects[i:i + field.length] for i in range(0, len(objects), field.length)]
+            columns.append(objects)
+        elif field.length:
+            rows = column.reshape(-1, field.length).tolist()
+            columns.append(list(map(field.container, rows)) if field.container else rows)
+        else:
+            items = column.ravel().tolist()
+            columns.append(list(map(field.enum, items)) if field.enum else items)
+    return list(map(struct.cls, *columns))
+
+
+def _row_bytes(rows):
+    """structured 배열 (첫 축 = 행) 의 행별 uint8 view"""
+    return rows.view(np.uint8).reshape(len(rows), rows.dtype.itemsize * (rows.size // len(rows)))
+
+
+def _delete_row(rows, index):
+    """1차원 structured 배열에서 index 행을 지우고 뒤의 행을 당김 (마지막 행은 0)"""
+    raw = rows.view(np.uint8)
+    size = rows.dtype.itemsize
+    raw[index * size:-size] = raw[(index + 1) * size:]
+    raw[-size:] = 0
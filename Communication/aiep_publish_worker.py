@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_publish_worker.py
+GUI 송신 버튼용 비동기 publish worker
+- Tk 스레드는 샘플을 큐에 넣고 바로 반환, 실제 write() 는 "DDSPublish" 스레드에서 수행
+  (대형 EDITED_PLAN_LIST 직렬화, reliable writer backpressure 동안 UI 가 멈추지 않음)
+- 큐 크기 제한 (PUBLISH_QUEUE_SIZE): 가득 차면 새 샘플은 거부 (DROPPED)
+- 상태성 메시지는 topic (또는 topic + key) 별로 합침: 아직 전송되지 않은 이전 샘플은 새 샘플로 교체 (SUPERSEDED)
+  명령성 메시지 (WPN_CTRL_CMD, TEWA_ASSIGN_CMD 등) 는 합치지 않고 모두 순서대로 전송
+- submit_batch(): 여러 샘플 (발사관별 등) 을 한 항목으로 전송, 결과도 한 번만 통지
+- 완료 callback on_done(status, error): attach_tk() 후에는 Tk 스레드에서, 그 전에는 worker 스레드에서 호출
+
+큐에 넣은 샘플은 전송이 끝날 때까지 수정하지 말 것 (worker 가 나중에 write 함)
+"""
+
+import queue
+import threading
+from collections import deque
+from Communication.aiep_logger import get_logger
+
+log = get_logger("publish_worker")
+
+PUBLISH_QUEUE_SIZE = 64
+COMPLETION_INTERVAL_MS = 20
+
+# 완료 상태
+SENT = "sent"              # writer.write() 완료
+QUEUED = "queued"          # DDS 초기화 전이라 MYPublisher.pending 에 보관 (ready 시 전송)
+SUPERSEDED = "superseded"  # 전송 전에 같은 topic(/key) 의 새 샘플로 교체됨
+DROPPED = "dropped"        # 큐가 가득 차 거부됨
+FAILED = "failed"          # write() 예외
+
+BATCH = "batch"  # submit_batch 항목의 합치기 key (단건 샘플과 별도)
+
+# 합치기 대상 topic -> key 함수 (None: topic 전체에서 마지막 샘플만 유효)
+COALESCE_KEYS = {
+    "CMSHCI_AIEP_PA_INFO": None,
+    "CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST": None,
+    "NAVINF_SHIP_NAVIGATION_INFO": None,
+    "TEWA_WA_TUBE_LOAD_INFO": lambda sample: sample.eTubeNum,
+    "CMSHCI_AIEP_WPN_GEO_WAYPOINTS": lambda sample: sample.eTubeNum,
+}
+
+
+class _Entry:
+    __slots__ = ("message_name", "coalesce_key", "sample", "batch", "callbacks")
+
+    def __init__(self, message_name, coalesce_key, sample, batch, on_done):
+        self.message_name = message_name
+        self.coalesce_key = coalesce_key
+        self.sample = sample  # batch 이면 샘플 list
+        self.batch = batch
+        self.callbacks = [on_done] if on_done is not None else []
+
+
+class PublishWorker:
+    """Write samples on a background thread, coalescing superseded state messages."""
+
+    def __init__(self, publish, publish_batch=None, maxsize=PUBLISH_QUEUE_SIZE, coalesce_keys=None):
+        """publish(message_name, sample) / publish_batch(message_name, samples)
+        -> True (written) / False (queued until DDS ready)"""
+        self._publish = publish
+        self._publish_batch = publish_batch
+        self.maxsize = maxsize
+        self.coalesce_keys = COALESCE_KEYS if coalesce_keys is None else coalesce_keys
+        self.sent = 0
+        self.superseded = 0
+        self.dropped = 0
+
+        self._entries = deque()
+        self._coalescing = {}  # (message_name, key) -> 아직 전송되지 않은 _Entry
+        self._busy = False
+        self._cv = threading.Condition()
+        self._stopped = False
+
+        self._root = None
+        self._completions = queue.SimpleQueue()  # attach_tk() 후 Tk 스레드에서 처리할 callback
+
+        self._thread = threading.Thread(target=self._run, name="DDSPublish", daemon=True)
+        self._thread.start()
+
+    def attach_tk(self, root, interval_ms=COMPLETION_INTERVAL_MS):
+        """Deliver completion callbacks on the Tk thread (polled every interval_ms)."""
+        self._root = root
+        self._interval_ms = interval_ms
+        root.after(interval_ms, self._drain_completions)
+
+    def submit(self, message_name, sample, on_done=None):
+        """Queue sample for message_name without blocking; return False if the queue is full."""
+        key_func = self.coalesce_keys.get(message_name, False)
+        coalesce_key = None
+        if key_func is not False:
+            coalesce_key = (message_name, key_func(sample) if key_func is not None else None)
+        return self._submit(message_name, coalesce_key, sample, False, on_done)
+
+    def submit_batch(self, message_name, samples, on_done=None):
+        """Queue samples to be written as one batch; on_done is called once for the batch."""
+        # 합치기 대상 topic 이면 아직 전송되지 않은 이전 batch 를 교체
+        coalesce_key = (message_name, BATCH) if message_name in self.coalesce_keys else None
+        return self._submit(message_name, coalesce_key, list(samples), True, on_done)
+
+    def _submit(self, message_name, coalesce_key, sample, batch, on_done):
+        superseded = []
+        with self._cv:
+            entry = self._coalescing.get(coalesce_key) if coalesce_key is not None else None
+            if entry is not None:
+                # 큐 위치는 그대로 두고 샘플만 교체 -> 다른 topic 과의 순서 유지
+                superseded, entry.callbacks = entry.callbacks, []
+                entry.sample = sample
+                if on_done is not None:
+                    entry.callbacks.append(on_done)
+                self.superseded += 1
+            elif len(self._entries) >= self.maxsize:
+                self.dropped += 1
+                entry = None
+            else:
+                entry = _Entry(message_name, coalesce_key, sample, batch, on_done)
+                self._entries.append(entry)
+                if coalesce_key is not None:
+                    self._coalescing[coalesce_key] = entry
+                self._cv.notify()
+
+        for callback in superseded:
+            self._complete(callback, SUPERSEDED, None)
+        if entry is None:
+            log.warning("Publish queue full (%d), %s dropped", self.maxsize, message_name)
+            self._complete(on_done, DROPPED, None)
+            return False
+        return True
+
+    def pending_count(self):
+        with self._cv:
+            return len(self._entries) + (1 if self._busy else 0)
+
+    def wait_idle(self, timeout=None):
+        """Block until every queued sample has been written; return False on timeout."""
+        with self._cv:
+            return self._cv.wait_for(lambda: not self._entries and not self._busy, timeout)
+
+    def stop(self, timeout=None):
+        """Finish the queued samples and stop the worker thread."""
+        with self._cv:
+            self._stopped = True
+            self._cv.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._entries or self._stopped)
+                if not self._entries:
+                    return
+                entry = self._entries.popleft()
+                if entry.coalesce_key is not None:
+                    del self._coalescing[entry.coalesce_key]
+                self._busy = True
+
+            status, error = SENT, None
+            publish = self._publish_batch if entry.batch else self._publish
+            try:
+                if not publish(entry.message_name, entry.sample):
+                    status = QUEUED
+            except Exception as e:
+                log.error("Publish of %s failed: %s", entry.message_name, e)
+                status, error = FAILED, e
+
+            with self._cv:
+                self._busy = False
+                if status != FAILED:
+                    self.sent += 1
+                self._cv.notify_all()
+            for callback in entry.callbacks:
+                self._complete(callback, status, error)
+
+    def _complete(self, callback, status, error):
+        if callback is None:
+            return
+        if self._root is not None:
+            self._completions.put((callback, status, error))
+            return
+        self._call(callback, status, error)
+
+    @staticmethod
+    def _call(callback, status, error):
+        try:
+            callback(status, error)
+        except Exception as e:
+            log.exception("Publish completion callback failed: %s", e)
+
+    def _drain_completions(self):
+        try:
+            while True:
+                self._call(*self._completions.get_nowait())
+        except queue.Empty:
+            pass
+        self._root.after(self._interval_ms, self._drain_completions)
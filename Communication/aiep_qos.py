@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_qos.py
+MY_QOS_PROFILES.xml 공용 QoS resolver
+- 파일은 한 번만 읽음 (QosProvider + message 이름 -> base profile 매핑)
+- *_qos_from_profile 결과를 (종류, base profile) 별로 캐시 -> 같은 base 를 쓰는 topic 은 한 번만 resolve
+- 파일 수정 시각이 바뀌면 다시 읽고 캐시를 비움 (최대 RELOAD_CHECK_INTERVAL 마다 확인)
+- 파일이 없거나 profile 을 찾지 못하면 기본 QoS
+
+반환된 QoS 객체는 여러 topic 이 공유하므로 수정하지 말 것 (수정이 필요하면 복사 후 사용)
+"""
+
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from Communication.aiep_transport import dds
+from Communication.aiep_logger import get_logger
+
+log = get_logger("qos")
+
+QOS_FILE = "MY_QOS_PROFILES.xml"
+RELOAD_CHECK_INTERVAL = 1.0  # seconds
+
+_DEFAULT_QOS = {
+    "participant": lambda: dds.DomainParticipantQos(),
+    "topic": lambda: dds.TopicQos(),
+    "datawriter": lambda: dds.DataWriterQos(),
+    "datareader": lambda: dds.DataReaderQos(),
+}
+
+
+class QosResolver:
+    path = QOS_FILE
+    provider = None
+    qos_mapping = {}       # message_name -> base profile
+    resolve_calls = 0      # provider.*_qos_from_profile 호출 횟수 (캐시 miss)
+    _cache = {}            # (kind, base profile 또는 None) -> QoS
+    _mtime = None
+    _last_check = 0.0
+    _lock = threading.RLock()
+
+    @staticmethod
+    def load(path=None):
+        """(Re)read the QoS file and clear resolved QoS; missing file -> default QoS only."""
+        with QosResolver._lock:
+            if path is not None:
+                QosResolver.path = path
+            QosResolver._cache = {}
+            QosResolver.qos_mapping = {}
+            QosResolver.provider = None
+            QosResolver._last_check = time.monotonic()
+
+            try:
+                QosResolver._mtime = os.path.getmtime(QosResolver.path)
+                QosResolver.provider = dds.QosProvider(f"file://{QosResolver.path}")
+
+                root = ET.parse(QosResolver.path).getroot()
+                for profile in root.findall('.//qos_profile'):
+                    name = profile.get('name')
+                    base = profile.get('base_name')
+                    if name and base:
+                        QosResolver.qos_mapping[name] = base
+                        log.debug("Mapped: %s -> %s", name, base)
+                log.info("QoS profiles loaded from %s (%d mappings)", QosResolver.path, len(QosResolver.qos_mapping))
+            except Exception as e:
+                log.error("QoS file load failed (%s), using default QoS: %s", QosResolver.path, e)
+
+    @staticmethod
+    def reload_if_changed():
+        """Reload when the QoS file's modification time changed; return True if reloaded."""
+        with QosResolver._lock:
+            QosResolver._last_check = time.monotonic()
+            try:
+                mtime = os.path.getmtime(QosResolver.path)
+            except OSError:
+                mtime = None
+            if mtime == QosResolver._mtime:
+                return False
+            log.info("QoS file changed, reloading %s", QosResolver.path)
+            QosResolver.load()
+            return True
+
+    @staticmethod
+    def _resolve(kind, profile):
+        with QosResolver._lock:
+            if time.monotonic() - QosResolver._last_check >= RELOAD_CHECK_INTERVAL:
+                QosResolver.reload_if_changed()
+
+            key = (kind, profile)
+            qos = QosResolver._cache.get(key)
+            if qos is None:
+                if profile is not None and QosResolver.provider is not None:
+                    try:
+                        QosResolver.resolve_calls += 1
+                        qos = getattr(QosResolver.provider, f"{kind}_qos_from_profile")(profile)
+                    except Exception as e:
+                        log.warning("QoS load failed for %s (%s): %s", profile, kind, e)
+                if qos is None:
+                    qos = _DEFAULT_QOS[kind]()
+                QosResolver._cache[key] = qos
+            return qos
+
+    @staticmethod
+    def base_profile(message_name):
+        return QosResolver.qos_mapping.get(message_name)
+
+    @staticmethod
+    def participant_qos(profile):
+        return QosResolver._resolve("participant", profile)
+
+    @staticmethod
+    def topic_qos(message_name):
+        return QosResolver._resolve("topic", QosResolver.base_profile(message_name))
+
+    @staticmethod
+    def datawriter_qos(message_name):
+        return QosResolver._resolve("datawriter", QosResolver.base_profile(message_name))
+
+    @staticmethod
+    def datareader_qos(message_name):
+        return QosResolver._resolve("datareader", QosResolver.base_profile(message_name))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_replay.py
+캡처 파일 재생 (live AIEP 없이 수신 경로 재현)
+- 캡처된 샘플을 토픽별 ReplayReader 에 넣고 MySubscriber.process_data 로 처리
+  (coalescing, StateStore, 변경 통지 등 실시간 수신과 동일한 경로)
+- speed=1.0 실시간, speed=N N배속, speed=0 최대 속도 (초당 처리 샘플 수 보고)
+- 재생 중에는 MySubscriber 의 중계 송신(relay)을 꺼서 재생 샘플이 실제 버스로 나가지 않음
+- pump (예: ChangeNotifier.drain) 를 주면 처리 후마다 호출해 창 갱신까지 포함한 end-to-end samples/s 보고
+  decode + StateStore 저장만의 samples/s (decode_rate) 도 함께 보고
+"""
+
+import time
+from types import SimpleNamespace
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_capture import iter_records, deserialize_sample
+from Communication.aiep_logger import get_logger
+
+log = get_logger("replay")
+
+VALID_INFO = SimpleNamespace(valid=True)
+
+
+class ReplayReader:
+    """Stand-in DataReader holding replayed samples until process_data takes them."""
+
+    def __init__(self, topic_name):
+        self.topic_name = topic_name
+        self.pending = []
+
+    def take_data(self):
+        samples, self.pending = self.pending, []
+        return samples
+
+    def take(self):
+        return [(sample, VALID_INFO) for sample in self.take_data()]
+
+
+class ReplayDriver:
+    """Feed a captured session back through MySubscriber at 1x, Nx or maximum speed."""
+
+    def __init__(self, path, speed=1.0, pump=None):
+        self.path = path
+        self.speed = speed
+        self.pump = pump  # 처리 후 호출할 GUI 갱신 (None: decode + store 까지만)
+        self.samples_replayed = 0
+        self.elapsed = 0.0
+        self.decode_elapsed = 0.0  # process_data (decode + store) 시간
+        self.pump_elapsed = 0.0    # pump (GUI 갱신) 시간
+        self._stopped = False
+        self._types = {message_class.__name__: message_class for message_class in MySubscriber.handlers}
+        self._readers = {}
+
+    def stop(self):
+        self._stopped = True
+
+    @property
+    def decode_rate(self):
+        """Samples per second spent in decode + store only."""
+        return self.samples_replayed / self.decode_elapsed if self.decode_elapsed > 0 else 0.0
+
+    def run(self):
+        """Replay the whole capture with relaying disabled; return end-to-end samples per second (including pump)."""
+        relay_enabled = MySubscriber.relay_enabled
+        MySubscriber.relay_enabled = False
+        try:
+            return self._replay()
+        finally:
+            MySubscriber.relay_enabled = relay_enabled
+
+    def _replay(self):
+        first_timestamp = None
+        start = time.perf_counter()
+
+        for timestamp, topic, payload in iter_records(self.path):
+            if self._stopped:
+                break
+
+            sample_type = self._types.get(topic)
+            if sample_type is None:
+                log.warning("Replay: no handler registered for %s", topic, extra={'topic': f'replay/{topic}'})
+                continue
+
+            if self.speed:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                delay = start + (timestamp - first_timestamp) / self.speed - time.perf_counter()
+                if delay > 0:
+                    # 대기 전에 쌓인 샘플 처리 (실시간 수신처럼 도착 시점 단위로 take)
+                    self._process_pending()
+                    time.sleep(delay)
+
+            reader = self._readers.get(topic)
+            if reader is None:
+                reader = self._readers[topic] = ReplayReader(topic)
+            reader.pending.append(deserialize_sample(sample_type, payload))
+            self.samples_replayed += 1
+
+            if not self.speed:
+                self._process_pending()
+
+        self._process_pending()
+        self.elapsed = time.perf_counter() - start
+
+        rate = self.samples_replayed / self.elapsed if self.elapsed > 0 else 0.0
+        log.info("Replayed %d samples in %.2f s (%.0f samples/s %s, %.0f samples/s decode + store, speed=%s)",
+                 self.samples_replayed, self.elapsed, rate,
+                 "end-to-end" if self.pump is not None else "without GUI refresh",
+                 self.decode_rate, self.speed or "max")
+        return rate
+
+    def _process_pending(self):
+        start = time.perf_counter()
+        processed = False
+        for topic, reader in self._readers.items():
+            if reader.pending:
+                MySubscriber.process_data(reader, topic)
+                processed = True
+        decoded = time.perf_counter()
+        self.decode_elapsed += decoded - start
+        if processed and self.pump is not None:
+            self.pump()
+            self.pump_elapsed += time.perf_counter() - decoded
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_state_store.py
+수신 메시지 최신값 저장소 (subscriber 스레드 write / Tk 스레드 read)
+- (topic, key) 별 단조 증가 version 및 수신 시각 기록
+- copy-on-write: 쓰기마다 새 dict를 만들어 참조만 교체하므로 읽기는 lock 없이 수행
+- changed_since(version) 으로 마지막 확인 이후 변경된 항목만 조회
+- subscribe_changes() 로 받은 큐에 쓰기마다 (topic, key) 변경 통지
+- clear() 도 쓰기: version 증가, 지운 (topic, key) 통지, changed_since 에는 value None 인 Entry 로 보고
+"""
+
+import queue
+import threading
+import time
+from types import MappingProxyType
+from typing import NamedTuple, Any
+
+
+class Entry(NamedTuple):
+    value: Any
+    version: int
+    timestamp: float    # 수신 시각 (time.time())
+
+
+class StateStore:
+    """Thread-safe, versioned latest-value store keyed by (topic, key)."""
+
+    def __init__(self):
+        self._write_lock = threading.Lock()
+        self._version = 0
+        self._entries = MappingProxyType({})
+        self._removed = MappingProxyType({})  # clear() 로 지운 (topic, key) -> Entry(None, version, timestamp)
+        self._change_queues = ()
+
+    @property
+    def version(self):
+        """Global version of the most recent write (0 = nothing received)."""
+        return self._version
+
+    def put(self, topic, key, value):
+        """Store value for (topic, key) and return its new version."""
+        with self._write_lock:
+            version = self._version + 1
+            entries = dict(self._entries)
+            entries[(topic, key)] = Entry(value, version, time.time())
+            # 참조 교체는 원자적이므로 reader는 항상 완전한 snapshot을 본다
+            self._entries = MappingProxyType(entries)
+            if (topic, key) in self._removed:
+                removed = dict(self._removed)
+                del removed[(topic, key)]
+                self._removed = MappingProxyType(removed)
+            self._version = version
+        for change_queue in self._change_queues:
+            change_queue.put((topic, key))
+        return version
+
+    def get(self, topic, key=None):
+        """Return the Entry for (topic, key) or None."""
+        return self._entries.get((topic, key))
+
+    def get_value(self, topic, key=None, default=None):
+        """Return the latest value for (topic, key) or default."""
+        entry = self._entries.get((topic, key))
+        return entry.value if entry is not None else default
+
+    def snapshot(self):
+        """Read-only view of all entries at this instant."""
+        return self._entries
+
+    def changed_since(self, version, topic=None):
+        """Return {(topic, key): Entry} written after version (optionally one topic only).
+
+        clear() 로 지운 항목은 value 가 None 인 Entry 로 포함
+        """
+        if version >= self._version:
+            return {}
+        # 지운 항목을 먼저 읽음 -> 그 사이 다시 put 된 항목은 아래 _entries 값이 덮어씀
+        removed = self._removed
+        entries = self._entries
+        return {
+            topic_key: entry
+            for source in (removed, entries)
+            for topic_key, entry in source.items()
+            if entry.version > version and (topic is None or topic_key[0] == topic)
+        }
+
+    def subscribe_changes(self):
+        """Return a new thread-safe queue receiving (topic, key) for every subsequent write."""
+        change_queue = queue.SimpleQueue()
+        with self._write_lock:
+            self._change_queues = self._change_queues + (change_queue,)
+        return change_queue
+
+    def clear(self):
+        """Remove every entry as one write (new version, removed keys notified); return the version."""
+        with self._write_lock:
+            cleared = list(self._entries)
+            if not cleared:
+                return self._version
+            version = self._version + 1
+            removed = dict(self._removed)
+            tombstone = Entry(None, version, time.time())
+            for topic_key in cleared:
+                removed[topic_key] = tombstone
+            self._removed = MappingProxyType(removed)
+            self._entries = MappingProxyType({})
+            self._version = version
+        for change_queue in self._change_queues:
+            for topic_key in cleared:
+                change_queue.put(topic_key)
+        return version
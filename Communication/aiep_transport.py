@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_transport.py
+DDS transport 선택 (MYPublisher / MySubscriber 공용)
+- AIEP_TRANSPORT 환경변수로 선택: 'rti' (기본, RTI Connext DDS) 또는 'loopback' (in-process)
+- dds: DomainParticipant, Topic, DataWriter, DataReader, WaitSet, StatusCondition, QosProvider ... 를 제공하는 모듈
+- serialize_sample / deserialize_sample: 캡처/재생용 샘플 직렬화 (rti: CDR, loopback: pickle)
+- 메시지 타입은 Communication.aiep_types 에서 import (transport 에 맞는 모듈을 선택)
+
+Usage: AIEP_TRANSPORT=loopback python -m Benchmarks.bench_loopback
+"""
+
+import os
+
+TRANSPORTS = ("rti", "loopback")
+TRANSPORT = os.environ.get("AIEP_TRANSPORT", "rti").strip().lower()
+
+if TRANSPORT not in TRANSPORTS:
+    raise ImportError(f"Unknown AIEP_TRANSPORT '{TRANSPORT}' (expected one of {', '.join(TRANSPORTS)})")
+
+if TRANSPORT == "loopback":
+    from Communication import aiep_loopback_dds as dds
+    from Communication.aiep_loopback_dds import serialize_sample, deserialize_sample
+else:
+    import rti.connextdds as dds
+    import rti.idl as idl
+
+    _type_supports = {}
+
+    def serialize_sample(sample):
+        """Serialize a DDS sample to its CDR bytes."""
+        sample_type = type(sample)
+        type_support = _type_supports.get(sample_type)
+        if type_support is None:
+            type_support = _type_supports[sample_type] = idl.get_type_support(sample_type)
+        return type_support.serialize(sample)
+
+    def deserialize_sample(sample_type, payload):
+        """Rebuild a DDS sample of sample_type from CDR bytes."""
+        type_support = _type_supports.get(sample_type)
+        if type_support is None:
+            type_support = _type_supports[sample_type] = idl.get_type_support(sample_type)
+        return type_support.deserialize(payload)
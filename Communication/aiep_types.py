@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+aiep_types.py
+AIEP 메시지 타입 (선택된 transport 에 맞는 모듈에서 가져옴)
+- rti: IDL 생성 모듈 dds.AIEP_AIEP_
+- loopback: 생성 모듈을 import 할 수 있으면 그대로 사용 (IDL 과 동일한 필드 구성),
+  없으면 aiep_loopback_types 의 pure-Python stand-in
+- field_types(message_class): 필드별 IDL 기본 타입 (numpy dtype, enum 여부) 조회
+
+사용: from Communication.aiep_types import TEWA_ASSIGN_CMD
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional, get_args, get_origin, get_type_hints, Annotated
+from Communication.aiep_transport import TRANSPORT
+
+if TRANSPORT == "loopback":
+    try:
+        from dds.AIEP_AIEP_ import *  # noqa: F401,F403
+        TYPES_MODULE = "dds.AIEP_AIEP_"
+    except ImportError:
+        from Communication.aiep_loopback_types import *  # noqa: F401,F403
+        TYPES_MODULE = "Communication.aiep_loopback_types"
+else:
+    from dds.AIEP_AIEP_ import *  # noqa: F401,F403
+    TYPES_MODULE = "dds.AIEP_AIEP_"
+
+
+class FieldType(NamedTuple):
+    """IDL type of one struct member (element type for fixed arrays)."""
+    dtype: Optional[str]    # numpy dtype ("i2", "u2", "i4", "u4", "f4", "f8", "?", char = "u1"), 구조체는 None
+    enum: bool = False      # IDL enum (값은 "i4", 쓸 때는 enum 타입으로)
+
+
+@lru_cache(maxsize=None)
+def field_types(message_class):
+    """Return {field name: FieldType} for a message or nested struct class."""
+    if message_class.__module__ == "dds.AIEP_AIEP_":
+        return _dynamic_field_types(message_class)
+    # stand-in 등 생성 모듈 밖의 구조체는 annotation 으로
+    return _annotated_field_types(message_class)
+
+
+def _annotated_field_types(message_class):
+    # stand-in: int16 = Annotated[int, "i2"], 고정 배열은 Sequence[원소 타입]
+    result = {}
+    for name, hint in get_type_hints(message_class, include_extras=True).items():
+        if get_origin(hint) is not Annotated:
+            args = get_args(hint)
+            hint = args[0] if args else hint
+        if get_origin(hint) is Annotated:
+            dtype = hint.__metadata__[0]
+            result[name] = FieldType("i4", True) if dtype == "enum" else FieldType(dtype)
+        else:
+            result[name] = FieldType(None)
+    return result
+
+
+def _dynamic_field_types(message_class):
+    # 생성 타입: TypeSupport 의 DynamicType (IDL TypeCode) 에서 member 별 kind 조회
+    import rti.connextdds as rti_dds
+    import rti.idl as idl
+
+    kind = rti_dds.TypeKind
+    dtypes = {
+        kind.BOOLEAN_TYPE: "?",
+        kind.CHAR8_TYPE: "u1",
+        kind.UINT8_TYPE: "u1",
+        kind.INT8_TYPE: "i1",
+        kind.INT16_TYPE: "i2",
+        kind.UINT16_TYPE: "u2",
+        kind.INT32_TYPE: "i4",
+        kind.UINT32_TYPE: "u4",
+        kind.INT64_TYPE: "i8",
+        kind.UINT64_TYPE: "u8",
+        kind.FLOAT32_TYPE: "f4",
+        kind.FLOAT64_TYPE: "f8",
+    }
+    result = {}
+    for member in idl.get_type_support(message_class).dynamic_type.members():
+        member_type = member.type
+        # typedef / 고정 배열은 원소 타입까지 내려감
+        while member_type.kind in (kind.ALIAS_TYPE, kind.ARRAY_TYPE):
+            member_type = member_type.related_type if member_type.kind == kind.ALIAS_TYPE else member_type.content_type
+        if member_type.kind == kind.ENUMERATION_TYPE:
+            result[member.name] = FieldType("i4", True)
+        else:
+            result[member.name] = FieldType(dtypes.get(member_type.kind))
+    return result
@@ -1,12 +1,18 @@
 # _*_ coding: utf-8 _*_
+import time
+STARTUP_T0 = time.perf_counter()  # --profile-startup 기준 시각 (import 전)
 #from rti.connextdds import Int8Seq
 from Communication.aiep_msg_subscriber import MySubscriber
 from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_participant import ParticipantManager
+from Communication.aiep_change_notifier import ChangeNotifier
+from Communication.aiep_logger import configure_logging
+from Communication.aiep_replay import ReplayDriver
 import tkinter as tk
+import argparse
 import threading
 import sys
-import time
-from dds.AIEP_AIEP_ import TRKMGR_SYSTEMTARGET_INFO, TEWA_WA_TUBE_LOAD_INFO
+from Communication.aiep_types import TRKMGR_SYSTEMTARGET_INFO, TEWA_WA_TUBE_LOAD_INFO
 from Windows.TEWA_ASSIGN_CMD_Window import TEWAAssignCmdWindow
 from Windows.WpnCtrlCmdWindow import WpnCtrlCmdWindow
 from Windows.PAInfoWindow import PAInfoWindow
@@ -17,18 +23,58 @@ from Windows.EngagementPlanViewer import EngagementPlanViewer
 from Windows.OwnshipInfoWindow import OwnshipInfoWindow
 from Windows.TubeLoadInfoWindow import TubeLoadInfoWindow
 
+class StartupProfile:
+    """--profile-startup: record startup phases and print them when the first frame is shown."""
+
+    def __init__(self, t0):
+        self.t0 = t0
+        self.marks = []
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter()))
+
+    def report(self):
+        print("Startup profile (ms):        step   total")
+        previous = self.t0
+        for name, t in self.marks:
+            print(f"  {name:24s} {(t - previous) * 1000:8.1f} {(t - self.t0) * 1000:7.1f}")
+            previous = t
+        if ParticipantManager.startup_time is not None:
+            print(f"  (DomainParticipant create {ParticipantManager.startup_time * 1000:.1f} ms, "
+                  f"writers before first frame: {len(MYPublisher.writers)}/{len(MYPublisher.message_types)})")
+
+
 # --- Main GUI Class ---
 class M_MINE_PlanGUI:
-    def __init__(self, root, domain_id):
+    def __init__(self, root, domain_id, replay_path=None, replay_speed=1.0, startup_profile=None):
         self.root = root
         self.root.title("Dropping Plan Application")
+        self.startup_profile = startup_profile
+
+        # 수신 데이터 변경 통지 (subscriber 스레드 -> Tk 스레드)
+        self.notifier = ChangeNotifier(self.root, MySubscriber.store)
+
+        # DDS 상태 표시 (초기화 중 송신 요청은 대기 후 ready 시 전송)
+        self.dds_status_label = tk.Label(root, text="DDS: not started", fg="gray")
+        self.dds_status_label.pack(pady=(5, 0))
+        self.notifier.subscribe(self._update_dds_status, ['DDS_STATUS'])
+        MYPublisher.status_listeners.append(lambda: self.notifier.post('DDS_STATUS'))
 
-        # DDS publishers/subscribers
+        # DDS publishers/subscribers - participant/writer 생성은 worker 스레드에서 (Tk 스레드 비차단)
+        # replay 시에는 DDS 를 시작하지 않음 (재생 데이터가 실제 버스로 송신되지 않도록)
         self.req_publisher = MYPublisher()
-        self.req_publisher.initialize_participant(domain_id)
+        if replay_path:
+            self.req_publisher.set_offline("replay")
+        else:
+            self.req_publisher.start_initialization(domain_id, self._on_dds_ready)
+        # 송신 버튼은 publish worker 에 넘기고 바로 반환, 완료 callback 은 Tk 스레드에서
+        self.req_publisher.get_worker().attach_tk(self.root)
 
-        # 애플리케이션 시작 시 subscriber 스레드 시작
-        threading.Thread(target=self.run_subscriber_thread, args=(domain_id,), daemon=True).start()
+        # 애플리케이션 시작 시 subscriber 스레드 시작 (replay 지정 시 캡처 파일 재생)
+        if replay_path:
+            threading.Thread(target=self.run_replay_thread, args=(replay_path, replay_speed), daemon=True).start()
+        else:
+            threading.Thread(target=self.run_subscriber_thread, args=(domain_id,), daemon=True).start()
         
         # 시뮬레이터에서 설정한 정보 저장
         self.pa_info_data = None           # 금지구역 정보
@@ -103,9 +149,47 @@ class M_MINE_PlanGUI:
         )
         self.tube_load_info_btn.pack(pady=5)        
 
+        # 첫 화면 표시 시각 (--profile-startup)
+        if self.startup_profile is not None:
+            self._first_frame_shown = False
+            self.root.bind("<Map>", self._on_map, add="+")
+
+    def _on_map(self, event):
+        if event.widget is not self.root or self._first_frame_shown:
+            return
+        self._first_frame_shown = True
+        # 창이 그려진 뒤 (idle redraw 이후) 호출
+        self.root.after_idle(self._on_first_frame)
+
+    def _on_first_frame(self):
+        self.startup_profile.mark("first frame")
+        self.startup_profile.report()
+
+    def _on_dds_ready(self, elapsed):
+        # DDSInit worker 스레드에서 호출
+        if self.startup_profile is not None:
+            since_start = (time.perf_counter() - self.startup_profile.t0) * 1000
+            print(f"  (DDS ready {since_start:.1f} ms after process start, initialization {elapsed * 1000:.1f} ms)")
+
+    def _update_dds_status(self, changed):
+        status = MYPublisher.status
+        if status == "ready":
+            self.dds_status_label.config(text="DDS: ready", fg="green")
+        elif status == "failed":
+            self.dds_status_label.config(text="DDS: initialization failed (see log)", fg="red")
+        elif status == "offline":
+            self.dds_status_label.config(text=f"DDS: off ({MYPublisher.offline_reason}, nothing is sent)", fg="gray")
+        else:
+            queued = len(MYPublisher.pending)
+            text = f"DDS: {status}..." + (f" ({queued} queued)" if queued else "")
+            self.dds_status_label.config(text=text, fg="orange")
+
     def run_subscriber_thread(self, domainID):
         MySubscriber.run_subscriber(domain_id=domainID, sample_count=sys.maxsize)
 
+    def run_replay_thread(self, replay_path, replay_speed):
+        ReplayDriver(replay_path, replay_speed).run()
+
 
     def show_engagement_plan(self):
         """Show engagement plan viewer with PA info"""
@@ -122,7 +206,8 @@ class M_MINE_PlanGUI:
 
     def open_plan_list_window(self):
         # 데이터가 수신되었는지 확인합니다.
-        if MySubscriber.data_AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST is None:
+        plan_list = MySubscriber.store.get_value('AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST')
+        if plan_list is None:
             # 또는 주기적으로 체크하는 타이머를 설정할 수도 있습니다.
             self.root.after(500, self.open_plan_list_window)
         else:
@@ -130,21 +215,50 @@ class M_MINE_PlanGUI:
             DroppingPlanListWindow(
                 self.root,
                 self.req_publisher,
-                MySubscriber.data_AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST
+                plan_list
             )
 
     
+def parse_args():
+    parser = argparse.ArgumentParser(description="M_MINE Plan Simulator")
+    parser.add_argument("domain_id", nargs="?", type=int, default=83,
+                        help="DDS 도메인 번호 (default: 83)")
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Communication 로그 레벨 (default: INFO)")
+    parser.add_argument("--capture", metavar="DIR",
+                        help="수신한 모든 DDS 샘플을 DIR 아래 캡처 파일로 기록")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="DDS 수신 대신 캡처 파일(또는 디렉터리)을 재생")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="재생 배속 (1 = 실시간, 0 = 최대 속도, default: 1)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="기동 단계별 소요 시간과 첫 화면 표시까지의 시간 출력")
+    return parser.parse_args()
+
+
 def main():
-    if len(sys.argv) > 1:
-        arg_domain_id = int(sys.argv[1])
-        print("첫 번째 인자(도메인번호):", arg_domain_id)
-    else:
-        print("인자가 없습니다.")
-        arg_domain_id = 83
+    args = parse_args()
+    profile = StartupProfile(STARTUP_T0) if args.profile_startup else None
+    if profile:
+        profile.mark("imports")
+
+    configure_logging(args.log_level)
+    print("도메인번호:", args.domain_id)
+
+    if args.capture and not args.replay:
+        MySubscriber.start_capture(args.capture)
 
     root = tk.Tk()
-    app = M_MINE_PlanGUI(root, arg_domain_id)    
-    root.mainloop()
+    if profile:
+        profile.mark("Tk root")
+    app = M_MINE_PlanGUI(root, args.domain_id, args.replay, args.replay_speed, profile)    
+    if profile:
+        profile.mark("main window built")
+    try:
+        root.mainloop()
+    finally:
+        MySubscriber.stop_capture()
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
-from dds.AIEP_AIEP_ import CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ
+from Communication.aiep_types import CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ
+from Communication.aiep_publish_worker import SENT, QUEUED
 
 class AIWaypointsInferenceRequestWindow:
     def __init__(self, parent, publisher):
@@ -73,10 +74,16 @@ class AIWaypointsInferenceRequestWindow:
             msg.eTubeNum = tube_num
             msg.bGenerateAIWaypoints = 1 if generate_ai else 0
             
-            # 메시지 전송
-            self.publisher.writerCMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ.write(msg)
-            
-            messagebox.showinfo("Success", f"AI waypoints inference request sent for weapon type {wpn_kind}, tube {tube_num}.")
+            # 메시지 전송 (publish worker, 결과는 Tk 스레드에서 표시)
+            def on_done(status, error):
+                if status == SENT:
+                    messagebox.showinfo("Success", f"AI waypoints inference request sent for weapon type {wpn_kind}, tube {tube_num}.")
+                elif status == QUEUED:
+                    messagebox.showinfo("Queued", f"AI waypoints inference request for weapon type {wpn_kind}, tube {tube_num} will be sent when DDS is ready.")
+                else:
+                    messagebox.showerror("Send Failed", f"Failed to send request:\n{error or status}")
+
+            self.publisher.publish_async("CMSHCI_AIEP_AI_WAYPOINTS_INFERENCE_REQ", msg, on_done)
             
         except Exception as e:
             messagebox.showerror("Send Failed", f"Failed to send request:\n{e}")
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+EPScene.py
+교전계획 3D 플롯 retained scene (ax.clear() 없이 artist 재사용)
+- 요소(key)마다 artist 를 한 번만 만들고 이후에는 데이터만 교체 (set_data_3d / _offsets3d)
+- 이번 갱신에서 그리지 않은 요소는 숨김, 범례/제목/축 범위는 바뀔 때만 다시 설정
+- 현재 위치/자함 같은 dynamic 요소는 animated artist 로 두고 배경 위에 blit
+- 정적 요소나 범례/축 범위가 바뀌면 전체 draw, dynamic 만 바뀌면 blit, 변화가 없으면 생략
+- 전체 draw 는 canvas.draw_idle() 로 요청: Tk 에서는 notifier callback 밖 (idle) 에서 한 번만 그리고,
+  그 전에 들어온 요청은 합쳐짐 (Agg 캔버스는 바로 그림). 대기 중에 바뀐 dynamic 요소는 그 draw 에서 함께 그림
+  측정 (Agg, M_MINE 궤적 128점 + 금지구역 16개): 창 1개 full draw 3D ~210 ms / 2D ~100 ms, blit ~5 ms
+  튜브 6개 창이 같은 주기에 정적 변경되면 3D ~1.3 s (0.8 Hz) / 2D ~0.6 s (1.6 Hz) -> 정적 변경 전시율의 상한
+- 갱신 종류(full/blit/skip)별 소요 시간 기록 (stats)
+- 2D 축 (평면도) 에도 같은 API 로 사용 - z 좌표는 변경 판별에만 쓰고 그리지 않음
+"""
+
+import time
+import numpy as np
+from matplotlib.artist import Artist
+
+
+class _DrawStart(Artist):
+    """Figure 에서 가장 먼저 그려져 전체 draw 시작 시각을 기록 (그리는 것 없음)"""
+
+    def __init__(self, scene):
+        super().__init__()
+        self.scene = scene
+        self.set_zorder(-np.inf)
+
+    def draw(self, renderer):
+        self.scene._draw_started = time.perf_counter()
+
+
+class EPScene:
+    """Retained set of artists (3D or 2D axes) keyed by plot element, redrawn only when something changed."""
+
+    LEGEND_STYLE = {"loc": "upper right", "fontsize": 8}
+
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self.figure = ax.figure
+        self.is_3d = ax.name == '3d'
+
+        self._artists = {}      # key -> (artist, dynamic)
+        self._data = {}         # key -> 마지막으로 설정한 좌표 (xs, ys, zs)
+        self._groups = {}       # key -> (signature, [artist])
+        self._touched = set()
+        self._title = None
+        self._limits = None
+        self._legend_key = None
+        self._background = None
+        self._static_dirty = True
+        self._dynamic_dirty = False
+        self._full_pending = False  # draw_idle 요청 후 아직 그리지 않음
+        self._draw_started = None
+        self._draw_start = self.figure.add_artist(_DrawStart(self))
+
+        # kind -> [count, total_ms, last_ms] (full 은 실제 draw 마다 _on_draw 에서 기록)
+        self.stats = {"full": [0, 0.0, 0.0], "blit": [0, 0.0, 0.0], "skip": [0, 0.0, 0.0]}
+        self.last_kind = None
+
+        self._draw_cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    # --- 요소 갱신 ------------------------------------------------------------
+
+    def begin(self):
+        """Start a frame; elements not touched before end() are hidden."""
+        self._touched = set()
+
+    def line(self, key, xs, ys, zs, fmt="-", dynamic=False, **style):
+        """선: 처음에만 ax.plot, 이후에는 set_data_3d (2D: set_data)"""
+        data = self._coords(xs, ys, zs)
+        entry = self._artists.get(key)
+        if entry is None:
+            artist, = self.ax.plot(*(data if self.is_3d else data[:2]), fmt, animated=dynamic, **style)
+            self._add(key, artist, dynamic, data)
+        elif self._changed(key, data):
+            if self.is_3d:
+                entry[0].set_data_3d(*data)
+            else:
+                entry[0].set_data(data[0], data[1])
+            self._data[key] = data
+            self._mark(dynamic)
+        self._show(key)
+
+    def points(self, key, xs, ys, zs, dynamic=False, **style):
+        """산점: 처음에만 ax.scatter, 이후에는 _offsets3d 교체 (2D: set_offsets)"""
+        data = self._coords(xs, ys, zs)
+        entry = self._artists.get(key)
+        if entry is None:
+            artist = self.ax.scatter(*(data if self.is_3d else data[:2]), animated=dynamic, **style)
+            self._add(key, artist, dynamic, data)
+        elif self._changed(key, data):
+            if self.is_3d:
+                entry[0]._offsets3d = data
+                entry[0].stale = True
+            else:
+                entry[0].set_offsets(np.column_stack(data[:2]))
+            self._data[key] = data
+            self._mark(dynamic)
+        self._show(key)
+
+    def label(self, key, text, **style):
+        """축 중앙 2D 텍스트 (No Data 등)"""
+        entry = self._artists.get(key)
+        if entry is None:
+            text_2d = self.ax.text2D if self.is_3d else self.ax.text
+            artist = text_2d(0.5, 0.5, text, transform=self.ax.transAxes, **style)
+            self._add(key, artist, False, text)
+        elif self._data[key] != text:
+            entry[0].set_text(text)
+            self._data[key] = text
+            self._mark(False)
+        self._show(key)
+
+    def group(self, key, signature, build):
+        """정적 artist 묶음: signature 가 바뀔 때만 build(ax) 로 다시 만듦"""
+        current = self._groups.get(key)
+        if current is None or current[0] != signature:
+            if current is not None:
+                for artist in current[1]:
+                    artist.remove()
+            self._groups[key] = (signature, list(build(self.ax)))
+            self._static_dirty = True
+        self._touched.add(key)
+
+    def end(self, title=None, limits=None):
+        """Hide untouched elements, apply title/limits/legend if changed, then render."""
+        for key, (artist, dynamic) in self._artists.items():
+            if key not in self._touched and artist.get_visible():
+                artist.set_visible(False)
+                self._mark(dynamic)
+        for key in [k for k in self._groups if k not in self._touched]:
+            for artist in self._groups.pop(key)[1]:
+                artist.remove()
+            self._static_dirty = True
+
+        if title != self._title:
+            self.ax.set_title(title or "", fontsize=12, fontweight='bold')
+            self._title = title
+            self._static_dirty = True
+
+        if limits is not None and limits != self._limits:
+            xlim, ylim, zlim = limits
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(*ylim)
+            if zlim is not None and self.is_3d:
+                self.ax.set_zlim(*zlim)
+            if not self.is_3d:
+                # 평면도: 위도에 따른 경도 축척 (원형 금지 구역이 원으로 보이도록)
+                self.ax.set_aspect(1.0 / np.cos(np.radians(sum(ylim) / 2.0)), adjustable='box')
+            self._limits = limits
+            self._static_dirty = True
+
+        self._update_legend()
+        return self.render()
+
+    def render(self):
+        """full draw 요청 / blit / skip 중 필요한 만큼만 그리고 종류를 반환"""
+        start = time.perf_counter()
+        if self._static_dirty or (self._dynamic_dirty and self._background is None and not self._full_pending):
+            kind = "full"
+            self._full_pending = True
+            self.canvas.draw_idle()
+        elif self._dynamic_dirty and not self._full_pending:
+            kind = "blit"
+            self.canvas.restore_region(self._background)
+            self._draw_dynamic()
+            self.canvas.blit(self.figure.bbox)
+        else:
+            kind = "skip"  # 변화 없음, 또는 대기 중인 full draw 가 그림
+        self._static_dirty = self._dynamic_dirty = False
+
+        if kind != "full":
+            self._record(kind, (time.perf_counter() - start) * 1000.0)
+        self.last_kind = kind
+        return kind
+
+    def disconnect(self):
+        """canvas draw_event 연결 해제 (scene 을 버릴 때)"""
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self._draw_start.remove()
+
+    def summary(self):
+        """정보 패널용 요약: 마지막 갱신 종류/시간, full 평균"""
+        if self.last_kind is None:
+            return "-"
+        count, total, _ = self.stats["full"]
+        text = f"{self.last_kind} {self.stats[self.last_kind][2]:.1f} ms"
+        if count:
+            text += f" (full avg {total / count:.0f} ms)"
+        return text
+
+    # --- 내부 ---------------------------------------------------------------
+
+    @staticmethod
+    def _coords(xs, ys, zs):
+        return (np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), np.asarray(zs, dtype=float))
+
+    def _changed(self, key, data):
+        return not all(np.array_equal(a, b) for a, b in zip(self._data[key], data))
+
+    def _add(self, key, artist, dynamic, data):
+        self._artists[key] = (artist, dynamic)
+        self._data[key] = data
+        self._static_dirty = True  # 새 artist 는 범례/배경에 반영되어야 함
+
+    def _show(self, key):
+        artist, dynamic = self._artists[key]
+        if not artist.get_visible():
+            artist.set_visible(True)
+            self._mark(dynamic)
+        self._touched.add(key)
+
+    def _mark(self, dynamic):
+        if dynamic:
+            self._dynamic_dirty = True
+        else:
+            self._static_dirty = True
+
+    def _update_legend(self):
+        handles, labels = [], []
+        for artist, _ in self._artists.values():
+            text = artist.get_label()
+            if artist.get_visible() and text and not text.startswith('_'):
+                handles.append(artist)
+                labels.append(text)
+        for _, artists in self._groups.values():
+            for artist in artists:
+                text = artist.get_label()
+                if text and not text.startswith('_'):
+                    handles.append(artist)
+                    labels.append(text)
+
+        legend_key = tuple(zip(map(id, handles), labels))
+        if legend_key == self._legend_key:
+            return
+        self._legend_key = legend_key
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if handles:
+            self.ax.legend(handles, labels, **self.LEGEND_STYLE)
+        self._static_dirty = True
+
+    def _draw_dynamic(self):
+        for artist, dynamic in self._artists.values():
+            if dynamic and artist.get_visible():
+                if hasattr(artist, "do_3d_projection"):
+                    artist.do_3d_projection()
+                self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """전체 draw 직후 (resize/회전 포함) 배경 저장 + dynamic artist 그리기, full 소요 시간 기록"""
+        self._full_pending = False
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_dynamic()
+        if self._draw_started is not None:
+            self._record("full", (time.perf_counter() - self._draw_started) * 1000.0)
+            self._draw_started = None
+
+    def _record(self, kind, elapsed_ms):
+        stat = self.stats[kind]
+        stat[0] += 1
+        stat[1] += elapsed_ms
+        stat[2] = elapsed_ms
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 EngagementPlanViewer.py
-교전계획 전시 시스템 (수정됨)
-- 자함 위치 전시 기능 개선
-- 금지 구역 원통 형태로 전시 (심도 100m ~ 수면)
+교전계획 전시 (튜브별 창, 3D / 2D 평면도, 자함 위치 및 금지 구역 포함)
 """
 
 import tkinter as tk
@@ -11,12 +9,21 @@ from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.patches import Circle
 import matplotlib.patches as mpatches
 import numpy as np
 import threading
 import time
 from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_change_notifier import ChangeNotifier
+from Communication.aiep_logger import get_logger
+from Communication.aiep_field_snapshot import field_values
+from Communication.aiep_ep_tracks import ep_tracks
+from Windows.EPScene import EPScene
+
+log = get_logger("ep_viewer")
 
 
 # =============================================================================
@@ -36,88 +43,194 @@ WEAPON_TYPES = {
 # Helper Functions
 # =============================================================================
 
-# =============================================================================
-# Helper Functions
-# =============================================================================
-# =============================================================================
-# Helper Functions
-# =============================================================================
+# 교전계획 결과 토픽 (검색 순서 유지)
+EP_RESULT_TOPICS = {
+    'M_MINE': 'AIEP_M_MINE_EP_RESULT',
+    'ALM_ASM': 'AIEP_ALM_ASM_EP_RESULT',
+    'WGT': 'AIEP_WGT_EP_RESULT',
+    'AAM': 'AIEP_AAM_EP_RESULT',
+}
 
-def get_tube_ep_data(tube_num, main_gui=None):
-    """Get engagement plan data for specific tube (현재 할당된 무장만 반환)"""
+# 할당 무장 종류 -> 교전계획 전시 타입
+WEAPON_KIND_TO_EP_TYPE = {
+    1: 'WGT',
+    2: 'M_MINE',
+    3: 'ALM_ASM',
+    4: 'ALM_ASM',
+    5: 'AAM',
+}
+
+
+# 무장별 전시 요소 (aiep_ep_tracks 의 track 이름, 'line'/'points', dynamic, style) - 그리는 순서대로
+# dynamic: 주기적으로 움직이는 현재 위치 (EPScene 이 blit)
+EP_TRACK_STYLES = {
+    'M_MINE': (
+        ("trajectory", "line", False, dict(fmt='b-', linewidth=2, label='Trajectory')),
+        ("waypoints", "points", False, dict(c='green', s=150, marker='o', edgecolors='darkgreen',
+                                            linewidths=2, label='Waypoints', zorder=50)),
+        ("launch", "points", False, dict(c='blue', s=200, marker='*', edgecolors='darkblue',
+                                         linewidths=2, label='Launch Point', zorder=50)),
+        ("drop", "points", False, dict(c='red', s=200, marker='X', edgecolors='darkred',
+                                       linewidths=2, label='Drop Point', zorder=50)),
+        ("current", "points", True, dict(c='orange', s=250, marker='D', edgecolors='darkorange',
+                                         linewidths=2, label='Current Position', zorder=60)),
+    ),
+    'ALM_ASM': (
+        ("trajectory", "line", False, dict(fmt='b-', linewidth=2, label='Trajectory')),
+        ("waypoints", "points", False, dict(c='green', s=100, marker='o', label='Waypoints')),
+        ("turning_points", "points", False, dict(c='purple', s=80, marker='s', label='Turning Points')),
+        ("current", "points", True, dict(c='orange', s=150, marker='D', label='Current Position')),
+    ),
+    'WGT': (
+        ("trajectory", "line", False, dict(fmt='b-', linewidth=2, label='Trajectory')),
+        ("hit_point", "points", False, dict(c='red', s=200, marker='X', label='Target Hit Point', zorder=50)),
+        ("current", "points", True, dict(c='orange', s=150, marker='D', label='Current Position', zorder=60)),
+    ),
+    'AAM': (
+        ("early", "line", False, dict(fmt='b-', linewidth=2, alpha=0.7, label='Early Scenario')),
+        ("short", "line", False, dict(fmt='g-', linewidth=2, alpha=0.7, label='Short Scenario')),
+        ("late", "line", False, dict(fmt='b-', linewidth=2, alpha=0.7, label='Late Scenario')),
+        ("target", "points", False, dict(c='red', linewidth=2, alpha=0.7, label='Target', zorder=50)),
+        ("current", "points", True, dict(c='orange', s=150, marker='D', label='Current Position', zorder=60)),
+    ),
+}
+
+
+def get_tube_ep_entry(tube_num, main_gui=None):
+    """Get (wpn_type, store Entry) for specific tube (현재 할당된 무장만 반환)"""
     
     # 현재 할당된 무장 종류 확인 (main_gui를 통해)
     assigned_weapon_kind = None
     if main_gui and hasattr(main_gui, 'tube_load_info_data'):
         assigned_weapon_kind = main_gui.tube_load_info_data.get(tube_num)
     
-    # 할당된 무장이 없거나 None인 경우
-    if assigned_weapon_kind is None or assigned_weapon_kind == 0:
-        # 무장이 명시적으로 설정되지 않은 경우, 기존 방식대로 검색
-        # (backward compatibility)
-        pass
-    else:
+    wpn_type = WEAPON_KIND_TO_EP_TYPE.get(assigned_weapon_kind)
+    if wpn_type:
         # 무장이 명시적으로 할당된 경우, 해당 무장의 데이터만 반환
-        if assigned_weapon_kind == 2:  # M_MINE
-            if hasattr(MySubscriber, 'data_AIEP_M_MINE_EP_RESULT'):
-                data_dict = MySubscriber.data_AIEP_M_MINE_EP_RESULT
-                if isinstance(data_dict, dict) and tube_num in data_dict:
-                    return ('M_MINE', data_dict[tube_num])
-            return (None, None)
-        
-        elif assigned_weapon_kind in [3, 4]:  # ASM or ALM
-            if hasattr(MySubscriber, 'data_AIEP_ALM_ASM_EP_RESULT'):
-                data_dict = MySubscriber.data_AIEP_ALM_ASM_EP_RESULT
-                if isinstance(data_dict, dict) and tube_num in data_dict:
-                    return ('ALM_ASM', data_dict[tube_num])
-            return (None, None)
-        
-        elif assigned_weapon_kind == 1:  # WGT
-            if hasattr(MySubscriber, 'data_AIEP_WGT_EP_RESULT'):
-                data_dict = MySubscriber.data_AIEP_WGT_EP_RESULT
-                if isinstance(data_dict, dict) and tube_num in data_dict:
-                    return ('WGT', data_dict[tube_num])
-            return (None, None)
-        
-        elif assigned_weapon_kind == 5:  # AAM
-            if hasattr(MySubscriber, 'data_AIEP_AAM_EP_RESULT'):
-                data_dict = MySubscriber.data_AIEP_AAM_EP_RESULT
-                if isinstance(data_dict, dict) and tube_num in data_dict:
-                    return ('AAM', data_dict[tube_num])
-            return (None, None)
-    
-    # 기존 방식 (순서대로 검색) - backward compatibility
-    # M_MINE - 딕셔너리에서 조회
-    if hasattr(MySubscriber, 'data_AIEP_M_MINE_EP_RESULT'):
-        data_dict = MySubscriber.data_AIEP_M_MINE_EP_RESULT
-        if isinstance(data_dict, dict) and tube_num in data_dict:
-            return ('M_MINE', data_dict[tube_num])
-    
-    # ALM/ASM - 딕셔너리에서 조회
-    if hasattr(MySubscriber, 'data_AIEP_ALM_ASM_EP_RESULT'):
-        data_dict = MySubscriber.data_AIEP_ALM_ASM_EP_RESULT
-        if isinstance(data_dict, dict) and tube_num in data_dict:
-            return ('ALM_ASM', data_dict[tuple_num])
-    
-    # WGT - 딕셔너리에서 조회
-    if hasattr(MySubscriber, 'data_AIEP_WGT_EP_RESULT'):
-        data_dict = MySubscriber.data_AIEP_WGT_EP_RESULT
-        if isinstance(data_dict, dict) and tube_num in data_dict:
-            return ('WGT', data_dict[tube_num])
-    
-    # AAM - 딕셔너리에서 조회
-    if hasattr(MySubscriber, 'data_AIEP_AAM_EP_RESULT'):
-        data_dict = MySubscriber.data_AIEP_AAM_EP_RESULT
-        if isinstance(data_dict, dict) and tube_num in data_dict:
-            return ('AAM', data_dict[tube_num])
+        entry = MySubscriber.store.get(EP_RESULT_TOPICS[wpn_type], tube_num)
+        if entry is not None:
+            return (wpn_type, entry)
+        return (None, None)
+    
+    # 무장이 명시적으로 설정되지 않은 경우, 순서대로 검색 (backward compatibility)
+    for wpn_type, topic in EP_RESULT_TOPICS.items():
+        entry = MySubscriber.store.get(topic, tube_num)
+        if entry is not None:
+            return (wpn_type, entry)
     
     return (None, None)
 
+
+def get_tube_ep_data(tube_num, main_gui=None):
+    """Get engagement plan data for specific tube (현재 할당된 무장만 반환)"""
+    wpn_type, entry = get_tube_ep_entry(tube_num, main_gui)
+    if entry is None:
+        return (None, None)
+    return (wpn_type, entry.value)
+
+
 def get_ownship_info():
     """Get ownship navigation info"""
-    if hasattr(MySubscriber, 'data_NAVINF_SHIP_NAVIGATION_INFO'):
-        return MySubscriber.data_NAVINF_SHIP_NAVIGATION_INFO
-    return None
+    return MySubscriber.store.get_value('NAVINF_SHIP_NAVIGATION_INFO')
+
+
+# =============================================================================
+# Prohibited Area Cylinder Geometry
+# =============================================================================
+
+# 원통 형상 (심도 -60m ~ 수면, 링 20개 / 수직선 12개 / 원주 50점)
+PA_BOTTOM_DEPTH = -60.0
+PA_RING_DEPTHS = np.linspace(PA_BOTTOM_DEPTH, 0, 20)
+PA_EDGE_ANGLES = np.linspace(0, 2*np.pi, 12)
+PA_CIRCLE_THETA = np.linspace(0, 2*np.pi, 50)
+PA_MESH_DEPTHS = np.linspace(PA_BOTTOM_DEPTH, 0, 2)
+
+# 선 스타일 (color, linewidth, linestyle): 위/아래 링, 수직선, 중간 링
+PA_OUTLINE_STYLE = ((1.0, 0.0, 0.0, 0.9), 2.0, 'solid')
+PA_EDGE_STYLE = ((1.0, 0.0, 0.0, 0.6), 1.0, 'solid')
+PA_MIDDLE_STYLE = ((1.0, 0.0, 0.0, 0.4), 0.5, '--')
+PA_SURFACE_COLOR = (1.0, 0.0, 0.0, 0.15)
+
+_pa_geometry_cache = {}  # (lon, lat, radius) -> (outlines, edges, middles, quads)
+PA_GEOMETRY_CACHE_SIZE = 64
+
+
+def pa_cylinder_geometry(center_lon, center_lat, radius_m):
+    """Cylinder polylines/quads for one PA, computed once per (lon, lat, radius).
+
+    반환: (outlines (2,50,3), edges (12,2,3), middles (18,50,3), quads (N,4,3)) - 읽기 전용 배열
+    """
+    key = (center_lon, center_lat, radius_m)
+    geometry = _pa_geometry_cache.get(key)
+    if geometry is not None:
+        return geometry
+    
+    # Convert radius from meters to degrees (approximate)
+    # 1 degree latitude ≈ 111,000 meters, longitude adjusted by cos(latitude)
+    radius_deg_lat = radius_m / 111000.0
+    radius_deg_lon = radius_m / (111000.0 * np.cos(np.radians(center_lat)))
+    
+    # Horizontal circles at each depth level
+    rings = np.empty((len(PA_RING_DEPTHS), len(PA_CIRCLE_THETA), 3))
+    rings[..., 0] = center_lon + radius_deg_lon * np.cos(PA_CIRCLE_THETA)
+    rings[..., 1] = center_lat + radius_deg_lat * np.sin(PA_CIRCLE_THETA)
+    rings[..., 2] = PA_RING_DEPTHS[:, None]
+    
+    # Vertical lines (edges of cylinder)
+    edges = np.empty((len(PA_EDGE_ANGLES), 2, 3))
+    edges[..., 0] = (center_lon + radius_deg_lon * np.cos(PA_EDGE_ANGLES))[:, None]
+    edges[..., 1] = (center_lat + radius_deg_lat * np.sin(PA_EDGE_ANGLES))[:, None]
+    edges[..., 2] = (PA_BOTTOM_DEPTH, 0.0)
+    
+    # Side surface: (depth band, angle step) 마다 사각형 하나
+    mesh = np.empty((len(PA_MESH_DEPTHS), len(PA_CIRCLE_THETA), 3))
+    mesh[..., :2] = rings[0, :, :2]
+    mesh[..., 2] = PA_MESH_DEPTHS[:, None]
+    quads = np.stack((mesh[:-1, :-1], mesh[:-1, 1:], mesh[1:, 1:], mesh[1:, :-1]), axis=2).reshape(-1, 4, 3)
+    
+    geometry = (rings[[0, -1]], edges, rings[1:-1], quads)
+    for array in geometry:
+        array.flags.writeable = False
+    
+    if len(_pa_geometry_cache) >= PA_GEOMETRY_CACHE_SIZE:
+        _pa_geometry_cache.pop(next(iter(_pa_geometry_cache)))
+    _pa_geometry_cache[key] = geometry
+    return geometry
+
+
+def build_pa_layer(ax, areas):
+    """All PA cylinders as one Line3DCollection + one Poly3DCollection (returns both)"""
+    geometries = [pa_cylinder_geometry(*area) for area in areas]
+    
+    # 스타일별로 모아서 하나의 collection 에 (첫 선분 = 아래/위 링: 범례 표시용)
+    segments = []
+    styles = []
+    for index, style in ((0, PA_OUTLINE_STYLE), (1, PA_EDGE_STYLE), (2, PA_MIDDLE_STYLE)):
+        for geometry in geometries:
+            segments.extend(geometry[index])
+            styles.extend([style] * len(geometry[index]))
+    colors, linewidths, linestyles = zip(*styles)
+    
+    lines = Line3DCollection(segments, colors=colors, linewidths=linewidths,
+                             linestyles=linestyles, label='Prohibited Area')
+    surface = Poly3DCollection(np.concatenate([g[3] for g in geometries]),
+                               facecolors=PA_SURFACE_COLOR, edgecolors='none', linewidths=0)
+    ax.add_collection3d(surface, autolim=False)
+    ax.add_collection3d(lines, autolim=False)
+    return [surface, lines]
+
+
+def build_pa_plan_layer(ax, areas):
+    """All PA circles for the 2D plan view: one PolyCollection (fill) + one LineCollection (outline)"""
+    circles = [pa_cylinder_geometry(*area)[0][0, :, :2] for area in areas]
+    color, linewidth, _ = PA_OUTLINE_STYLE
+    
+    fill = PolyCollection(circles, facecolors=PA_SURFACE_COLOR, edgecolors='none', zorder=1)
+    lines = LineCollection(circles, colors=[color], linewidths=linewidth,
+                           label='Prohibited Area', zorder=2)
+    ax.add_collection(fill, autolim=False)
+    ax.add_collection(lines, autolim=False)
+    return [fill, lines]
 
 
 # =============================================================================
@@ -137,6 +250,8 @@ class EngagementPlanViewer(tk.Toplevel):
         
         self._setup_ui()
         self._start_status_update()
+        
+        self.bind("<Destroy>", self._on_destroy)
     
     def _setup_ui(self):
         """Setup UI with tube button layout"""
@@ -218,8 +333,17 @@ class EngagementPlanViewer(tk.Toplevel):
             self.tube_status_labels[tube_num] = status_label
     
     def _start_status_update(self):
-        """Start periodic tube status update"""
+        """Update tube status now and whenever EP results or tube loads change"""
         self._update_tube_status()
+        self._notify_token = self.main_gui.notifier.subscribe(
+            lambda changed: self._update_tube_status(),
+            list(EP_RESULT_TOPICS.values()) + ['TEWA_WA_TUBE_LOAD_INFO']
+        )
+    
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.main_gui.notifier.unsubscribe(self._notify_token)
+    
     def _update_tube_status(self):
         """Update tube button status"""
         for tube_num in self.tube_buttons.keys():
@@ -238,9 +362,6 @@ class EngagementPlanViewer(tk.Toplevel):
                     fg="gray"
                 )
                 self.tube_buttons[tube_num].config(bg="lightblue")
-        
-        # Schedule next update
-        self.after(1000, self._update_tube_status)
     
     def _open_plot_window(self, tube_num):
         """Open plot window for selected tube"""
@@ -271,7 +392,7 @@ class EngagementPlanViewer(tk.Toplevel):
 # =============================================================================
 
 class EPPlotWindow(tk.Toplevel):
-    """3D Engagement Plan Plot Window"""
+    """Engagement Plan Plot Window (3D or 2D plan view)"""
     
     def __init__(self, parent, tube_num, wpn_type, main_gui):
         super().__init__(parent)
@@ -282,15 +403,23 @@ class EPPlotWindow(tk.Toplevel):
         self.wpn_type = wpn_type
         self.main_gui = main_gui  # Reference to main GUI for real-time PA info
         self.is_running = True
+        self._rotate_job = None
+        self._plot_key = None       # (wpn_type, EP version, id(PA), id(ownship)) - 새 샘플 판별
+        self._plot_refs = None      # key 의 객체 참조 유지 (id 재사용 방지)
+        self._plot_content = None   # 마지막으로 그린 입력 내용 (field_values)
+        self.unchanged_updates = 0
+        self.view_mode = '3D'       # '3D' / '2D'
+        self.scene = None
         
         self._setup_ui()
         self._start_plot_update()
         
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.bind("<Destroy>", self._on_destroy)
     
     def _setup_ui(self):
-        """Setup UI with 3D plot and info panel"""
+        """Setup UI with plot (3D / 2D plan) and info panel"""
         # Info panel (top)
         info_frame = tk.LabelFrame(self, text="Status Information", padx=10, pady=5)
         info_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
@@ -303,6 +432,7 @@ class EPPlotWindow(tk.Toplevel):
             ("Total Time:", "total_time"),
             ("Remaining Time:", "remaining_time"),
             ("Missile Valid:", "msl_valid"),
+            ("Redraw:", "redraw"),
         ]
         
         for i, (label_text, key) in enumerate(info_items):
@@ -318,144 +448,218 @@ class EPPlotWindow(tk.Toplevel):
         
         self.info_labels["wpn_type"].config(text=self.wpn_type)
         
-        # 3D Plot (center)
+        # Initial view angle (Reset View 기준)
+        self.view_azim = -60
+        self.view_elev = 30
+        
+        # Plot (center)
         plot_frame = tk.Frame(self)
         plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         self.fig = plt.Figure(figsize=(10, 6))
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._create_axes()
         
         # Control panel (bottom)
         control_frame = tk.Frame(self)
         control_frame.pack(side=tk.BOTTOM, pady=10)
         
+        self.view_mode_var = tk.StringVar(value=self.view_mode)
+        for text, mode in (("3D", '3D'), ("2D Plan", '2D')):
+            tk.Radiobutton(
+                control_frame,
+                text=text,
+                value=mode,
+                variable=self.view_mode_var,
+                command=self._switch_view_mode
+            ).pack(side=tk.LEFT, padx=5)
+        
+        # 3D 전용 조작 (2D 평면도에서는 비활성)
         self.auto_rotate_var = tk.BooleanVar(value=False)
-        tk.Checkbutton(
+        self.auto_rotate_check = tk.Checkbutton(
             control_frame,
             text="Auto Rotate",
-            variable=self.auto_rotate_var
-        ).pack(side=tk.LEFT, padx=10)
+            variable=self.auto_rotate_var,
+            command=self._toggle_auto_rotate
+        )
+        self.auto_rotate_check.pack(side=tk.LEFT, padx=10)
         
-        tk.Button(
+        self.reset_view_button = tk.Button(
             control_frame,
             text="Reset View",
             command=self._reset_view
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.reset_view_button.pack(side=tk.LEFT, padx=5)
         
         tk.Button(
             control_frame,
             text="Close",
             command=self._on_closing
         ).pack(side=tk.LEFT, padx=5)
-        
-        # Initial view angle
-        self.view_azim = -60
-        self.view_elev = 30
-        
-    def _start_plot_update(self):
-        """Start periodic plot update"""
-        self._update_plot()
     
-        def _update_plot(self):
-            """Update plot with latest data"""
-            if not self.is_running or not self.winfo_exists():
-                return
+    def _create_axes(self):
+        """(Re)create the axes and retained scene for the current view mode"""
+        if self.scene is not None:
+            self.scene.disconnect()
+        self.fig.clear()
+        
+        if self.view_mode == '3D':
+            self.ax = self.fig.add_subplot(111, projection='3d')
+            self.ax.set_zlabel('Depth/Altitude (m)', fontsize=10)
+            self.ax.view_init(elev=self.view_elev, azim=self.view_azim)
+        else:
+            # 평면도: 위에서 본 위경도 (심도/고도는 전시하지 않음)
+            self.ax = self.fig.add_subplot(111)
+            self.ax.ticklabel_format(useOffset=False)
+            self.ax.locator_params(axis='x', nbins=4)  # 경도 눈금 겹침 방지 (좁은 축)
+            self.ax.grid(True, alpha=0.3)
         
-            wpn_type, ep_data = get_tube_ep_data(self.tube_num)
+        self.ax.set_xlabel('Longitude (deg)', fontsize=10)
+        self.ax.set_ylabel('Latitude (deg)', fontsize=10)
+        self.scene = EPScene(self.canvas, self.ax)
+    
+    def _switch_view_mode(self):
+        """Switch this window between 3D and 2D plan view and redraw the current data"""
+        mode = self.view_mode_var.get()
+        if mode == self.view_mode:
+            return
+        self.view_mode = mode
         
-            if wpn_type and ep_data:
-                self._plot_engagement_plan(wpn_type, ep_data)
-                self._update_info_panel(wpn_type, ep_data)
-            else:
-                self.ax.clear()
-                self.ax.text(0.5, 0.5, 0.5, "No Data", 
-                            ha='center', va='center', fontsize=20, color='red')
+        is_3d = mode == '3D'
+        if not is_3d:
+            self.auto_rotate_var.set(False)
+        state = tk.NORMAL if is_3d else tk.DISABLED
+        self.auto_rotate_check.config(state=state)
+        self.reset_view_button.config(state=state)
         
-            self.canvas.draw()
+        self._create_axes()
+        self._plot_key = self._plot_content = None  # 새 축에 다시 그리도록
+        self._update_plot()
         
-            # Auto rotate
-            if self.auto_rotate_var.get():
-                self.view_azim = (self.view_azim + 2) % 360
-                self.ax.view_init(elev=self.view_elev, azim=self.view_azim)
+    def _start_plot_update(self):
+        """Plot now and re-plot whenever this tube's EP result, PA or ownship info changes"""
+        self._update_plot()
         
-            # Schedule next update (1 second)
-            self.after(1000, self._update_plot)
+        interests = [(topic, self.tube_num) for topic in EP_RESULT_TOPICS.values()]
+        interests += [
+            ('TEWA_WA_TUBE_LOAD_INFO', self.tube_num),
+            'CMSHCI_AIEP_PA_INFO',
+            'NAVINF_SHIP_NAVIGATION_INFO',
+        ]
+        self._notify_token = self.main_gui.notifier.subscribe(
+            lambda changed: self._update_plot(), interests
+        )
     
-    def _plot_engagement_plan(self, wpn_type, ep_data):
-        """Plot engagement plan based on weapon type"""
-        # 사용자가 회전시킨 현재 view angle 저장
-        if hasattr(self.ax, 'elev') and hasattr(self.ax, 'azim'):
-            self.view_elev = self.ax.elev
-            self.view_azim = self.ax.azim
-            
-        self.ax.clear()
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.is_running = False
+            self.main_gui.notifier.unsubscribe(self._notify_token)
+    
+    def _update_plot(self):
+        """Update plot with latest data (skipped when the inputs did not change)
+
+        새 샘플/객체이면 field_values 로 모든 필드를 펼쳐 이전 내용과 비교: M_MINE 결과 + PA + 자함 ~80 us,
+        AAM 결과 ~170 us. 같은 내용 재수신을 그대로 그리면 궤적 변환 + scene 비교로 ~380 us (M_MINE) 이므로
+        주기 재수신에서는 이득, 내용이 바뀐 샘플에서는 draw (blit ~5 ms, full ~100-200 ms) 에 더해지는 비용
+        """
+        if not self.is_running or not self.winfo_exists():
+            return
+    
+        wpn_type, entry = get_tube_ep_entry(self.tube_num, self.main_gui)
+        ep_data = entry.value if entry is not None else None
+        pa_info = getattr(self.main_gui, 'pa_info_data', None)
+        ownship_source, ownship_info = self._ownship_info()
+    
+        # 1) 새 샘플/새 객체가 없으면 바로 종료 (다른 튜브/관심 밖 변경 통지)
+        key = (wpn_type, entry.version if entry is not None else None, id(pa_info), id(ownship_info))
+        if key == self._plot_key:
+            self.unchanged_updates += 1
+            return
+        self._plot_key = key
+        self._plot_refs = (pa_info, ownship_info)
+    
+        # 2) 같은 내용의 재수신이면 종료 (주기 송신되는 교전계획 결과 등)
+        content = (
+            wpn_type,
+            field_values(ep_data) if ep_data is not None else None,
+            field_values(pa_info) if pa_info is not None else None,
+            ownship_source,
+            field_values(ownship_info) if ownship_info is not None else None,
+        )
+        if content == self._plot_content:
+            self.unchanged_updates += 1
+            return
+        self._plot_content = content
+    
+        if wpn_type and ep_data:
+            self._plot_engagement_plan(wpn_type, ep_data)
+            self._update_info_panel(wpn_type, ep_data)
+        else:
+            # 이전 요소는 숨기고 No Data 문구만 전시 (artist 는 유지)
+            self.scene.begin()
+            self.scene.label("no_data", "No Data",
+                             ha='center', va='center', fontsize=20, color='red')
+            self.scene.end()
+    
+        self.info_labels["redraw"].config(text=self.scene.summary())
+    
+    def _toggle_auto_rotate(self):
+        """Start rotation timer when Auto Rotate is checked"""
+        if self.auto_rotate_var.get() and self._rotate_job is None:
+            self._auto_rotate_step()
+    
+    def _auto_rotate_step(self):
+        """Rotate view by 2 degrees every second while Auto Rotate is checked"""
+        self._rotate_job = None
+        if not self.is_running or not self.auto_rotate_var.get() or self.view_mode != '3D':
+            return
         
-        # Collect all points for range calculation
-        all_lons = []
-        all_lats = []
-        all_depths = []
+        # 사용자가 마우스로 돌린 각도에서 이어서 회전
+        self.ax.view_init(elev=self.ax.elev, azim=(self.ax.azim + 2) % 360)
+        self.canvas.draw_idle()
         
-        # Plot weapon-specific data
-        if wpn_type == 'M_MINE':
-            wpn_lons, wpn_lats, wpn_depths = self._plot_m_mine(ep_data)
-        elif wpn_type == 'ALM_ASM':
-            wpn_lons, wpn_lats, wpn_depths = self._plot_alm_asm(ep_data)
-        elif wpn_type == 'WGT':
-            wpn_lons, wpn_lats, wpn_depths = self._plot_wgt(ep_data)
-        elif wpn_type == 'AAM':
-            wpn_lons, wpn_lats, wpn_depths = self._plot_aam(ep_data)
-        else:
-            wpn_lons, wpn_lats, wpn_depths = [], [], []
+        self._rotate_job = self.after(1000, self._auto_rotate_step)
+
+    def _plot_engagement_plan(self, wpn_type, ep_data):
+        """Update the retained scene for the engagement plan (no ax.clear())"""
+        self.scene.begin()
         
-        all_lons.extend(wpn_lons)
-        all_lats.extend(wpn_lats)
-        all_depths.extend(wpn_depths)
+        # Plot weapon-specific data (range calculation uses the same arrays)
+        all_lons, all_lats, all_depths = self._plot_tracks(wpn_type, ep_data)
         
-        # Plot ownship position (MUST be plotted after weapon data to appear in legend)
+        # Plot ownship position
         ownship_lon, ownship_lat, ownship_depth = self._plot_ownship()
         if ownship_lon is not None:
-            all_lons.append(ownship_lon)
-            all_lats.append(ownship_lat)
-            all_depths.append(ownship_depth)
+            all_lons.append(np.array([ownship_lon]))
+            all_lats.append(np.array([ownship_lat]))
+            all_depths.append(np.array([ownship_depth]))
         
         # Plot prohibited areas (real-time from main GUI)
         pa_lons, pa_lats = self._plot_prohibited_areas()
-        all_lons.extend(pa_lons)
-        all_lats.extend(pa_lats)
+        all_lons.append(pa_lons)
+        all_lats.append(pa_lats)
         
-        # Set labels and title
-        self.ax.set_xlabel('Longitude (deg)', fontsize=10)
-        self.ax.set_ylabel('Latitude (deg)', fontsize=10)
-        self.ax.set_zlabel('Depth/Altitude (m)', fontsize=10)
-        self.ax.set_title(f'{wpn_type} Engagement Plan - Tube {self.tube_num}', fontsize=12, fontweight='bold')
-        self.ax.view_init(elev=self.view_elev, azim=self.view_azim)
+        # 제목/축 범위/범례는 바뀐 경우에만 scene 이 다시 설정
+        self.scene.end(
+            title=f'{wpn_type} Engagement Plan - Tube {self.tube_num}',
+            limits=self._axis_limits(all_lons, all_lats, all_depths),
+        )
 
-        self.ax.view_init(elev=self.view_elev, azim=self.view_azim)
-        # Set axis limits based on data range
-        self._set_axis_limits(all_lons, all_lats, all_depths)
-        
-        # Add legend (after all plots are added)
-        self.ax.legend(loc='upper right', fontsize=8)
+    def _ownship_info(self):
+        """(source, ownship info): simulator ownship info first, DDS subscription otherwise"""
+        # 1. Try simulator ownship info first (from main GUI)
+        if hasattr(self.main_gui, 'ownship_info_data') and self.main_gui.ownship_info_data:
+            return "Simulator", self.main_gui.ownship_info_data
+        # 2. Fall back to external subscription
+        return "DDS", get_ownship_info()
 
     def _plot_ownship(self):
         """Plot ownship position (FIXED - now properly visible)"""
-        # 1. Try simulator ownship info first (from main GUI)
-        ownship_info = None
-        source = None
-        
-        if hasattr(self.main_gui, 'ownship_info_data') and self.main_gui.ownship_info_data:
-            ownship_info = self.main_gui.ownship_info_data
-            source = "Simulator"
-        else:
-            # 2. Fall back to external subscription
-            ownship_info = get_ownship_info()
-            source = "DDS"
+        source, ownship_info = self._ownship_info()
         
         if not ownship_info:
-            print("[DEBUG] No ownship info available")
+            log.debug("No ownship info available")
             return None, None, None
         
         try:
@@ -465,40 +669,30 @@ class EPPlotWindow(tk.Toplevel):
             
             # Validate coordinates
             if lat == 0 and lon == 0:
-                print("[DEBUG] Ownship coordinates are zero")
+                log.debug("Ownship coordinates are zero")
                 return None, None, None
             
-            # Different color/marker for simulator vs external
+            # Different color/marker for simulator vs external (출처별로 별도 artist)
             if source == "Simulator":
-                color = 'cyan'
-                marker = '^'  # Triangle up
-                size = 400
-                edge_color = 'darkblue'
+                style = dict(c='cyan', s=400, marker='^', edgecolors='darkblue')
             else:
-                color = 'lightblue'
-                marker = 's'  # Square
-                size = 300
-                edge_color = 'black'
+                style = dict(c='lightblue', s=300, marker='s', edgecolors='black')
             
-            # Plot ownship with high zorder to ensure visibility
-            self.ax.scatter(
-                [lon], [lat], [depth],
-                c=color, s=size, marker=marker,
-                edgecolors=edge_color, linewidths=3,
-                label=f'Ownship ({source})', zorder=100
+            # 자함은 주기적으로 움직이므로 dynamic (blit 대상)
+            self.scene.points(
+                f"ownship.{source}", [lon], [lat], [depth], dynamic=True,
+                linewidths=3, label=f'Ownship ({source})', zorder=100, **style
             )
             
-            print(f"[DEBUG] Ownship plotted at Lon:{lon:.6f}, Lat:{lat:.6f}, Depth:{depth:.2f}m ({source})")
+            log.debug("Ownship plotted at Lon:%.6f, Lat:%.6f, Depth:%.2fm (%s)", lon, lat, depth, source)
             return lon, lat, depth
             
         except Exception as e:
-            print(f"[ERROR] Error plotting ownship: {e}")
+            log.error("Error plotting ownship: %s", e)
             return None, None, None
   
     def _plot_prohibited_areas(self):
-        """Plot prohibited areas as 3D cylinders (FIXED - from 100m depth to surface)"""
-        all_pa_lons = []
-        all_pa_lats = []
+        """Plot prohibited areas as 3D cylinders, returns (lons, lats) arrays of the rings"""
         
         # Get PA info from main GUI in real-time
         pa_info = None
@@ -506,417 +700,84 @@ class EPPlotWindow(tk.Toplevel):
             pa_info = self.main_gui.pa_info_data
         
         if not pa_info or pa_info.nCountPA == 0:
-            print("[DEBUG] No prohibited area data")
-            return all_pa_lons, all_pa_lats
-        
-        print(f"[DEBUG] Plotting {pa_info.nCountPA} prohibited areas")
-        
-        for i in range(pa_info.nCountPA):
-            pa = pa_info.stPaPoint[i]
-            
-            # Cylinder parameters
-            center_lon = pa.dLongitude
-            center_lat = pa.dLatitude
-            radius_m = pa.dRadius
-            
-            # Convert radius from meters to degrees (approximate)
-            # 1 degree latitude ≈ 111,000 meters
-            # For longitude, we need to adjust by cos(latitude)
-            radius_deg_lat = radius_m / 111000.0
-            radius_deg_lon = radius_m / (111000.0 * np.cos(np.radians(center_lat)))
-            
-            # Create cylinder: circle at multiple depth levels
-            num_circle_points = 50
-            theta = np.linspace(0, 2*np.pi, num_circle_points)
-            
-            # Depth levels for cylinder (from -100m to 0m, underwater so negative)
-            depth_levels = np.linspace(-60, 0, 20)  # 20 levels from 100m depth to surface
-            
-            # Draw vertical lines (edges of cylinder)
-            for angle in np.linspace(0, 2*np.pi, 12):  # 12 vertical lines
-                edge_lon = center_lon + radius_deg_lon * np.cos(angle)
-                edge_lat = center_lat + radius_deg_lat * np.sin(angle)
-                self.ax.plot(
-                    [edge_lon, edge_lon], 
-                    [edge_lat, edge_lat], 
-                    [-60, 0],
-                    'r-', linewidth=1, alpha=0.6
-                )
-            
-            # Draw horizontal circles at each depth level
-            for j, depth in enumerate(depth_levels):
-                circle_lons = center_lon + radius_deg_lon * np.cos(theta)
-                circle_lats = center_lat + radius_deg_lat * np.sin(theta)
-                circle_depths = np.full(num_circle_points, depth)
-                
-                # Different style for top (surface) and bottom circles
-                if j == 0:  # Bottom circle (100m depth)
-                    self.ax.plot(circle_lons, circle_lats, circle_depths,
-                                'r-', linewidth=2, alpha=0.9,
-                                label='Prohibited Area' if i == 0 else '')
-                elif j == len(depth_levels) - 1:  # Top circle (surface)
-                    self.ax.plot(circle_lons, circle_lats, circle_depths,
-                                'r-', linewidth=2, alpha=0.9)
-                else:  # Middle circles
-                    self.ax.plot(circle_lons, circle_lats, circle_depths,
-                                'r--', linewidth=0.5, alpha=0.4)
-                
-                # Add to all points for range calculation
-                all_pa_lons.extend(circle_lons.tolist())
-                all_pa_lats.extend(circle_lats.tolist())
-            
-            # Optional: Fill the cylinder with semi-transparent surface
-            # Create mesh for cylinder surface
-            z_mesh = np.linspace(-60, 0, 10)
-            theta_mesh = np.linspace(0, 2*np.pi, num_circle_points)
-            Theta_mesh, Z_mesh = np.meshgrid(theta_mesh, z_mesh)
-            
-            X_mesh = center_lon + radius_deg_lon * np.cos(Theta_mesh)
-            Y_mesh = center_lat + radius_deg_lat * np.sin(Theta_mesh)
-            
-            self.ax.plot_surface(X_mesh, Y_mesh, Z_mesh,
-                                alpha=0.15, color='red', 
-                                linewidth=0, antialiased=True)
+            return np.empty(0), np.empty(0)
         
-        return all_pa_lons, all_pa_lats
-    
-    def _plot_m_mine(self, ep_data):
-        """Plot M_MINE engagement plan"""
-        all_lons = []
-        all_lats = []
-        all_depths = []
+        areas = tuple(
+            (pa.dLongitude, pa.dLatitude, pa.dRadius)
+            for pa in pa_info.stPaPoint[:pa_info.nCountPA]
+        )
         
-        # Extract trajectory
-        traj_lats = []
-        traj_lons = []
-        traj_depths = []
-        
-        for i in range(ep_data.unCntTrajectory):
-            traj = ep_data.stTrajectories[i]
-            if traj.dLatitude != 0 or traj.dLongitude != 0:
-                traj_lats.append(traj.dLatitude)
-                traj_lons.append(traj.dLongitude)
-                traj_depths.append(-traj.fDepth)  # Negative for underwater
-        
-        if traj_lats:
-            self.ax.plot(traj_lons, traj_lats, traj_depths, 
-                        'b-', linewidth=2, label='Trajectory')
-            all_lons.extend(traj_lons)
-            all_lats.extend(traj_lats)
-            all_depths.extend(traj_depths)
-        
-        # Waypoints
-        wp_lats = []
-        wp_lons = []
-        wp_depths = []
-        
-        for i in range(ep_data.unCntWaypoint):
-            wp = ep_data.stWaypoints[i]
-            if wp.bValid:
-                wp_lats.append(wp.dLatitude)
-                wp_lons.append(wp.dLongitude)
-                wp_depths.append(-wp.fDepth)
-        
-        if wp_lats:
-            self.ax.scatter(wp_lons, wp_lats, wp_depths,
-                           c='green', s=150, marker='o', 
-                           edgecolors='darkgreen', linewidths=2,
-                           label='Waypoints', zorder=50)
-            all_lons.extend(wp_lons)
-            all_lats.extend(wp_lats)
-            all_depths.extend(wp_depths)
-        
-        # Launch point
-        if ep_data.stLaunchPos.dLatitude != 0 or ep_data.stLaunchPos.dLongitude != 0:
-            self.ax.scatter(
-                [ep_data.stLaunchPos.dLongitude],
-                [ep_data.stLaunchPos.dLatitude],
-                [-ep_data.stLaunchPos.fDepth],
-                c='blue', s=200, marker='*',
-                edgecolors='darkblue', linewidths=2,
-                label='Launch Point', zorder=50
-            )
-            all_lons.append(ep_data.stLaunchPos.dLongitude)
-            all_lats.append(ep_data.stLaunchPos.dLatitude)
-            all_depths.append(-ep_data.stLaunchPos.fDepth)
-        
-        # Drop point (target)
-        if ep_data.stDropPos.dLatitude != 0 or ep_data.stDropPos.dLongitude != 0:
-            self.ax.scatter(
-                [ep_data.stDropPos.dLongitude],
-                [ep_data.stDropPos.dLatitude],
-                [-ep_data.stDropPos.fDepth],
-                c='red', s=200, marker='X',
-                edgecolors='darkred', linewidths=2,
-                label='Drop Point', zorder=50
-            )
-            all_lons.append(ep_data.stDropPos.dLongitude)
-            all_lats.append(ep_data.stDropPos.dLatitude)
-            all_depths.append(-ep_data.stDropPos.fDepth)
-        
-        # Current mine position (if valid)
-        if ep_data.bValidMslPos:
-            self.ax.scatter(
-                [ep_data.MslPos.dLongitude],
-                [ep_data.MslPos.dLatitude],
-                [-ep_data.MslPos.fDepth],
-                c='orange', s=250, marker='D',
-                edgecolors='darkorange', linewidths=2,
-                label='Current Position', zorder=60
-            )
-            all_lons.append(ep_data.MslPos.dLongitude)
-            all_lats.append(ep_data.MslPos.dLatitude)
-            all_depths.append(-ep_data.MslPos.fDepth)
+        # 원통 collection 은 PA 목록이 바뀔 때만 다시 만듦 (형상은 PA 별 캐시)
+        self.scene.group("pa", areas, lambda ax: self._build_pa_cylinders(ax, areas))
         
-        return all_lons, all_lats, all_depths
+        rings = np.concatenate([pa_cylinder_geometry(*area)[0][0] for area in areas])
+        return rings[:, 0], rings[:, 1]
     
-    def _plot_alm_asm(self, ep_data):
-        """Plot ALM/ASM (Missile) engagement plan"""
-        all_lons = []
-        all_lats = []
-        all_depths = []
-        
-        # Trajectory
-        traj_lats = []
-        traj_lons = []
-        traj_alts = []
-        
-        for i in range(ep_data.unCntTrajectory):
-            traj = ep_data.stTrajectories[i]
-            if traj.dLatitude != 0 or traj.dLongitude != 0:
-                traj_lats.append(traj.dLatitude)
-                traj_lons.append(traj.dLongitude)
-                traj_alts.append(traj.fDepth)  # Altitude for missiles
-        
-        if traj_lats:
-            self.ax.plot(traj_lons, traj_lats, traj_alts,
-                        'b-', linewidth=2, label='Trajectory')
-            all_lons.extend(traj_lons)
-            all_lats.extend(traj_lats)
-            all_depths.extend(traj_alts)
-        
-        # Waypoints
-        for i in range(ep_data.unCntWaypoint):
-            wp = ep_data.stWaypoints[i]
-            if wp.dLatitude != 0 or wp.dLongitude != 0:
-                self.ax.scatter([wp.dLongitude], [wp.dLatitude], [wp.fDepth],
-                               c='green', s=100, marker='o',
-                               label='Waypoints' if i == 0 else '')
-                all_lons.append(wp.dLongitude)
-                all_lats.append(wp.dLatitude)
-                all_depths.append(wp.fDepth)
-        
-        # Turning points
-        for i in range(ep_data.unCntTurningpoints):
-            tp = ep_data.stTurningpoints[i]
-            if tp.dLatitude != 0 or tp.dLongitude != 0:
-                self.ax.scatter([tp.dLongitude], [tp.dLatitude], [tp.fDepth],
-                               c='purple', s=80, marker='s',
-                               label='Turning Points' if i == 0 else '')
-                all_lons.append(tp.dLongitude)
-                all_lats.append(tp.dLatitude)
-                all_depths.append(tp.fDepth)
-        
-        # Current missile position
-        if ep_data.bValidMslPos:
-            self.ax.scatter(
-                [ep_data.MslPos.dLongitude],
-                [ep_data.MslPos.dLatitude],
-                [ep_data.MslPos.fDepth],
-                c='orange', s=150, marker='D', label='Current Position'
-            )
-            all_lons.append(ep_data.MslPos.dLongitude)
-            all_lats.append(ep_data.MslPos.dLatitude)
-            all_depths.append(ep_data.MslPos.fDepth)
-        
-        return all_lons, all_lats, all_depths
+    @staticmethod
+    def _build_pa_cylinders(ax, areas):
+        """Create the merged PA layer (3D cylinders / 2D circles) once per PA set (returns the artists)"""
+        log.debug("Plotting %d prohibited areas", len(areas))
+        if ax.name == '3d':
+            return build_pa_layer(ax, areas)
+        return build_pa_plan_layer(ax, areas)
     
-    def _plot_wgt(self, ep_data):
-        """Plot WGT (Torpedo) engagement plan"""
+    def _plot_tracks(self, wpn_type, ep_data):
+        """Plot weapon elements from the cached track arrays, returns lists of (lons, lats, depths) arrays"""
+        tracks = ep_tracks(wpn_type, ep_data)
+        prefix = wpn_type.lower()
         all_lons = []
         all_lats = []
         all_depths = []
         
-        # Torpedo trajectory
-        traj_lats = []
-        traj_lons = []
-        traj_depths = []
-        	
-        for i in range(128):  # Assuming max 128 trajectory points
-            lat = ep_data.stTrajectories_WGT[i].dLatitude
-            lon = ep_data.stTrajectories_WGT[i].dLongitude
-            depth = ep_data.stTrajectories_WGT[i].fDepth
+        for name, kind, dynamic, style in EP_TRACK_STYLES.get(wpn_type, ()):
+            lons, lats, depths = tracks[name].points()
+            if not len(lons):
+                continue  # 그리지 않은 요소는 scene 이 숨김
             
-            if lat != 0 or lon != 0:
-                traj_lats.append(lat)
-                traj_lons.append(lon)
-                traj_depths.append(-depth)  # Negative for underwater
-        
-        if traj_lats:
-            self.ax.plot(traj_lons, traj_lats, traj_depths,
-                        'b-', linewidth=2, label='Trajectory')
-            all_lons.extend(traj_lons)
-            all_lats.extend(traj_lats)
-            all_depths.extend(traj_depths)
-        
-        # Hit point (target)
-        if ep_data.bHitPointFound:
-            self.ax.scatter(
-                [ep_data.dHit_Longitude],
-                [ep_data.dHit_Latitude],
-                [0],
-                c='red', s=200, marker='X',
-                label='Target Hit Point', zorder=50
-            )
-            all_lons.append(ep_data.dHit_Longitude)
-            all_lats.append(ep_data.dHit_Latitude)
-            all_depths.append(0)
-        
-        # Current torpedo position
-        if ep_data.bValidTorpedoCurrentPosition:
-            self.ax.scatter(
-                [ep_data.stTorpedoCurrentPosition.dLongitude],
-                [ep_data.stTorpedoCurrentPosition.dLatitude],
-                [-ep_data.stTorpedoCurrentPosition.fDepth],
-                c='orange', s=150, marker='D',
-                label='Current Position', zorder=60
-            )
-            all_lons.append(ep_data.stTorpedoCurrentPosition.dLongitude)
-            all_lats.append(ep_data.stTorpedoCurrentPosition.dLatitude)
-            all_depths.append(-ep_data.stTorpedoCurrentPosition.fDepth)
-        
-        return all_lons, all_lats, all_depths    
-    
-    def _plot_aam(self, ep_data):
-        """Plot AAM engagement plan (3 scenarios)"""
-        all_lons = []
-        all_lats = []
-        all_depths = []
-        
-        # Early scenario trajectory
-        early_lons = []
-        early_lats = []
-        early_alts = []
-        for i in range(128):
-            traj = ep_data.Early_Traj[i]
-            if traj.dblLatitude != 0 or traj.dblLongitude != 0:
-                early_lons.append(traj.dblLongitude)
-                early_lats.append(traj.dblLatitude)
-                early_alts.append(traj.fAltitude)
-        
-        if early_lons:
-            self.ax.plot(early_lons, early_lats, early_alts,
-                        'b-', linewidth=2, alpha=0.7, label='Early Scenario')
-            all_lons.extend(early_lons)
-            all_lats.extend(early_lats)
-            all_depths.extend(early_alts)
-        
-        # Short scenario trajectory
-        short_lons = []
-        short_lats = []
-        short_alts = []
-        for i in range(128):
-            traj = ep_data.Short_Traj[i]
-            if traj.dblLatitude != 0 or traj.dblLongitude != 0:
-                short_lons.append(traj.dblLongitude)
-                short_lats.append(traj.dblLatitude)
-                short_alts.append(traj.fAltitude)
-        
-        if short_lons:
-            self.ax.plot(short_lons, short_lats, short_alts,
-                        'g-', linewidth=2, alpha=0.7, label='Short Scenario')
-            all_lons.extend(short_lons)
-            all_lats.extend(short_lats)
-            all_depths.extend(short_alts)
-        
-        # Late scenario trajectory
-        late_lons = []
-        late_lats = []
-        late_alts = []
-        for i in range(128):
-            traj = ep_data.Late_Traj[i]
-            if traj.dblLatitude != 0 or traj.dblLongitude != 0:
-                late_lons.append(traj.dblLongitude)
-                late_lats.append(traj.dblLatitude)
-                late_alts.append(traj.fAltitude)
-        
-        if late_lons:
-            self.ax.plot(late_lons, late_lats, late_alts,
-                        'b-', linewidth=2, alpha=0.7, label='Late Scenario')
-            all_lons.extend(late_lons)
-            all_lats.extend(late_lats)
-            all_depths.extend(late_alts)
-        
-        # Target position
-        target_lons = []
-        target_lats = []
-        target_alts = []
-        for i in range(128):
-            traj = ep_data.Target_Traj[i]
-            if traj.dblLatitude != 0 or traj.dblLongitude != 0:
-                target_lons.append(traj.dblLongitude)
-                target_lats.append(traj.dblLatitude)
-                target_alts.append(traj.fAltitude)
-
-        if target_lons:
-            self.ax.scatter(target_lons,target_lats,target_alts,
-                c='r-', linewidth=2, alpha=0.7, label= 'Target', zorder=50)
-            all_lons.append(target_lons)
-            all_lats.append(target_lats)
-            all_depths.append(target_alts)
-        
-        # Current missile position
-        if ep_data.bValidMslPos:
-            self.ax.scatter(
-                [ep_data.MslPos.dLongitude],
-                [ep_data.MslPos.dLatitude],
-                [ep_data.MslPos.fAltitude],
-                c='orange', s=150, marker='D',
-                label='Current Position', zorder=60
-            )
-            all_lons.append(ep_data.MslPos.dLongitude)
-            all_lats.append(ep_data.MslPos.dLatitude)
-            all_depths.append(ep_data.MslPos.fAltitude)
+            key = f"{prefix}.{name}"
+            if kind == "line":
+                self.scene.line(key, lons, lats, depths, dynamic=dynamic, **style)
+            else:
+                self.scene.points(key, lons, lats, depths, dynamic=dynamic, **style)
+            all_lons.append(lons)
+            all_lats.append(lats)
+            all_depths.append(depths)
         
         return all_lons, all_lats, all_depths
     
-    def _set_axis_limits(self, all_lons, all_lats, all_depths):
-        """Set axis limits based on data range with margin"""
-        if not all_lons or not all_lats:
-            return
+    @staticmethod
+    def _axis_limits(all_lons, all_lats, all_depths):
+        """Axis limits ((xlim), (ylim), (zlim) or None) from lists of data arrays, equal lon/lat scale"""
+        all_lons, all_lats, all_depths = (
+            np.concatenate(parts) if parts else np.empty(0)
+            for parts in (all_lons, all_lats, all_depths)
+        )
+        if not all_lons.size or not all_lats.size:
+            return None
         
         # Calculate ranges
-        lon_min, lon_max = min(all_lons), max(all_lons)
-        lat_min, lat_max = min(all_lats), max(all_lats)
-        
-        # Add 20% margin
+        lon_min, lon_max = float(all_lons.min()), float(all_lons.max())
+        lat_min, lat_max = float(all_lats.min()), float(all_lats.max())
         lon_range = lon_max - lon_min
         lat_range = lat_max - lat_min
         
-        margin_lon = max(lon_range * 0.2, 0.01)  # Minimum 0.01 degree
-        margin_lat = max(lat_range * 0.2, 0.01)
-        
-        self.ax.set_xlim(lon_min - margin_lon, lon_max + margin_lon)
-        self.ax.set_ylim(lat_min - margin_lat, lat_max + margin_lat)
-        
-        # Depth/altitude
-        if all_depths:
-            depth_min, depth_max = min(all_depths), max(all_depths)
-            depth_range = depth_max - depth_min
-            margin_depth = max(depth_range * 0.2, 10)  # Minimum 10 meters
-            
-            self.ax.set_zlim(depth_min - margin_depth, depth_max + margin_depth)
+        # Depth/altitude: 20% margin (minimum 10 meters)
+        zlim = None
+        if all_depths.size:
+            depth_min, depth_max = float(all_depths.min()), float(all_depths.max())
+            margin_depth = max((depth_max - depth_min) * 0.2, 10)
+            zlim = (depth_min - margin_depth, depth_max + margin_depth)
         
         # Equal aspect ratio for x and y (lat/lon)
-        try:
-            lon_center = (lon_min + lon_max) / 2
-            lat_center = (lat_min + lat_max) / 2
-            max_range = max(lon_range, lat_range) * 0.6
-            
-            self.ax.set_xlim(lon_center - max_range, lon_center + max_range)
-            self.ax.set_ylim(lat_center - max_range, lat_center + max_range)
-        except:
-            pass
+        lon_center = (lon_min + lon_max) / 2
+        lat_center = (lat_min + lat_max) / 2
+        max_range = max(lon_range, lat_range) * 0.6
+        
+        return (
+            (lon_center - max_range, lon_center + max_range),
+            (lat_center - max_range, lat_center + max_range),
+            zlim,
+        )
     
     def _update_info_panel(self, wpn_type, ep_data):
         """Update information panel"""
@@ -967,10 +828,12 @@ class EPPlotWindow(tk.Toplevel):
                 )
         
         except Exception as e:
-            print(f"Error updating info panel: {e}")
+            log.error("Error updating info panel: %s", e)
     
     def _reset_view(self):
-        """Reset view angle"""
+        """Reset view angle (3D only)"""
+        if self.view_mode != '3D':
+            return
         self.view_azim = -60
         self.view_elev = 30
         self.ax.view_init(elev=self.view_elev, azim=self.view_azim)
@@ -997,5 +860,6 @@ if __name__ == "__main__":
             self.ownship_info_data = None
     
     mock_gui = MockMainGUI()
+    mock_gui.notifier = ChangeNotifier(root, MySubscriber.store)
     viewer = EngagementPlanViewer(root, mock_gui)
     root.mainloop()
@@ -6,8 +6,9 @@ OwnshipInfoWindow.py
 
 import tkinter as tk
 from tkinter import messagebox
+from Communication.aiep_publish_worker import SENT, QUEUED, SUPERSEDED
 import json
-from dds.AIEP_AIEP_ import NAVINF_SHIP_NAVIGATION_INFO
+from Communication.aiep_types import NAVINF_SHIP_NAVIGATION_INFO
 
 
 def save_values_to_json(data, filename="ownship_info.json"):
@@ -130,18 +131,25 @@ class OwnshipInfoWindow(tk.Toplevel):
             msg.stShipMovementInfo.fShipSpeed = speed
             msg.stShipMovementInfo.fShipHeading = heading
             
-            # Send message
-            self.publisher.publish_NAVINF_SHIP_NAVIGATION_INFO(msg)
+            # Send message (publish worker, result shown on the Tk thread)
+            self.publisher.publish_NAVINF_SHIP_NAVIGATION_INFO(msg, self._on_ownship_info_sent)
             
             # Save to main GUI for simulator use
             self.main_gui.ownship_info_data = msg
-            
-            messagebox.showinfo("Success", "Ownship info sent and saved!")
+            self.main_gui.notifier.post('NAVINF_SHIP_NAVIGATION_INFO')
         
         except ValueError:
             messagebox.showerror("Error", "Invalid input! Please enter valid numbers.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send: {e}")
+
+    def _on_ownship_info_sent(self, status, error):
+        if status == SENT:
+            messagebox.showinfo("Success", "Ownship info sent and saved!")
+        elif status == QUEUED:
+            messagebox.showinfo("Queued", "Ownship info saved, will be sent when DDS is ready.")
+        elif status != SUPERSEDED:
+            messagebox.showerror("Error", f"Failed to send: {error or status}")
     
     def save_to_json(self):
         """Save values to JSON"""
@@ -1,4 +1,5 @@
-from dds.AIEP_AIEP_ import CMSHCI_AIEP_PA_INFO
+from Communication.aiep_types import CMSHCI_AIEP_PA_INFO
+from Communication.aiep_publish_worker import SENT, QUEUED, FAILED, DROPPED
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import csv
@@ -247,10 +248,6 @@ class PAInfoWindow:
             # 헤더 설정이 필요하면 여기에 추가
             msg.nCountPA = count
             
-            # 로컬 저장 객체 생성
-            stored_pa_info = CMSHCI_AIEP_PA_INFO()
-            stored_pa_info.nCountPA = count
-            
             # 각 금지구역 정보 설정
             for i in range(count):
                 entry_fields = self.pa_entries[i]
@@ -280,33 +277,36 @@ class PAInfoWindow:
                     msg.stPaPoint[i].dLongitude = longitude
                     msg.stPaPoint[i].dCourse = course
                     msg.stPaPoint[i].dSpeed = speed
-                    
-                    # 로컬 저장 객체에도 설정
-                    stored_pa_info.stPaPoint[i].dRadius = radius
-                    stored_pa_info.stPaPoint[i].dLatitude = latitude
-                    stored_pa_info.stPaPoint[i].dLongitude = longitude
-                    stored_pa_info.stPaPoint[i].dCourse = course
-                    stored_pa_info.stPaPoint[i].dSpeed = speed
                 except ValueError as e:
                     if str(e).startswith("Radius") or str(e).startswith("Latitude") or str(e).startswith("Longitude") or str(e).startswith("Course") or str(e).startswith("Speed"):
                         raise
                     else:
                         raise ValueError(f"Invalid input for PA #{i+1}: {e}")
             
-            # 메시지 전송
-            self.publisher.writerCMSHCI_AIEP_PA_INFO.write(msg)
+            # 메시지 전송 (publish worker, 결과는 _on_pa_info_sent)
+            self.publisher.publish_async("CMSHCI_AIEP_PA_INFO", msg,
+                                         lambda status, error: self._on_pa_info_sent(status, error, count))
             
             # GUI 인스턴스에 금지구역 정보 직접 업데이트
-            self.gui_instance.pa_info_data = stored_pa_info
-            
-            # 플롯 창이 열려있으면 업데이트
-            if hasattr(self.gui_instance, 'ep_plot_window') and self.gui_instance.ep_plot_window and self.gui_instance.ep_plot_window.winfo_exists():
-                self.gui_instance.update_ep_plot()
+            # (송신 메시지를 그대로 보관 - 전송 후 수정하지 않으므로 별도 사본 불필요, 다음 송신은 새 객체)
+            self.gui_instance.pa_info_data = msg
             
-            messagebox.showinfo("Success", f"{count} prohibited area(s) information sent successfully.")
+            # 열려있는 교전계획 플롯 창에 변경 통지
+            self.gui_instance.notifier.post('CMSHCI_AIEP_PA_INFO')
             
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
         except Exception as e:
             messagebox.showerror("Send Failed", f"Failed to send message:\n{e}")
 
+    def _on_pa_info_sent(self, status, error, count):
+        # 전송 전에 새 PA 정보로 교체된 경우 (SUPERSEDED) 는 새 전송 결과만 표시
+        if status == SENT:
+            messagebox.showinfo("Success", f"{count} prohibited area(s) information sent successfully.")
+        elif status == QUEUED:
+            messagebox.showinfo("Queued", f"{count} prohibited area(s) information will be sent when DDS is ready.")
+        elif status == FAILED:
+            messagebox.showerror("Send Failed", f"Failed to send message:\n{error}")
+        elif status == DROPPED:
+            messagebox.showerror("Send Failed", "Publish queue is full, message was not sent.")
+
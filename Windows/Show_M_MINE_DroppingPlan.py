@@ -1,66 +1,9 @@
 # DroppingPlanWindows.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-import copy
-from dds.AIEP_AIEP_ import (
-    AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST,
-    CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
-)
-
-
-# =============================================================================
-# Helper Functions
-# =============================================================================
-
-def extract_string_from_char_array(char_array):
-    """DDS char 배열을 Python 문자열로 변환"""
-    try:
-        result = ""
-        for c in char_array:
-            if c == 0 or c == '\0':
-                break
-            result += chr(c) if isinstance(c, int) else c
-        return result
-    except:
-        return ""
-
-
-def set_string_to_char_array(char_array, string_value, max_length=50):
-    """Python 문자열을 DDS char 배열로 설정"""
-    try:
-        bytes_data = string_value.encode('utf-8')[:max_length-1]
-        for i in range(max_length):
-            if i < len(bytes_data):
-                char_array[i] = bytes_data[i]
-            else:
-                char_array[i] = 0
-    except Exception as e:
-        print(f"Error setting char array: {e}")
-
-
-def is_plan_list_empty(plan_list):
-    """Check if plan list is empty"""
-    # 이름이 있으면 비어있지 않음
-    name = extract_string_from_char_array(plan_list.chDescription)
-    if name.strip():
-        return False
-    
-    # 이름도 없고 sListID도 0이면 비어있음
-    if plan_list.sListID == 0:
-        return True
-    
-    # sListID가 있지만 이름이 없는 경우, 계획이 있는지 확인
-    has_valid_plan = any(
-        plan_list.stPlan[i].sListID != 0 
-        for i in range(15)
-    )
-    
-    return not has_valid_plan
-
-
-def is_plan_info_empty(plan_info):
-    """개별 부설계획이 비어있는지 확인"""
-    return plan_info.sListID == 0 and plan_info.usDroppingPlanNumber == 0
+from Communication.aiep_plan_model import PlanModel, check_plan_enum, PLAN_LISTS, PLANS_PER_LIST, PLAN_WAYPOINTS, OWNSHIP_WAYPOINTS
+from Communication.aiep_publish_worker import SENT, QUEUED, FAILED, DROPPED
+from Communication.aiep_types import CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
 
 
 # =============================================================================
@@ -77,90 +20,24 @@ class DroppingPlanListWindow(tk.Toplevel):
         
         self.publisher = publisher
         
-        # 원본 데이터 복사 (수정 중 원본 보존)
+        # 원본 데이터를 배열 모델로 변환 (수정 중 원본 보존, 메시지 변환은 열 때와 송신할 때만)
         if plan_data is None:
             messagebox.showerror("Error", "No plan data received!")
             self.destroy()
             return
-            
-        self.plan_data = self._deep_copy_plan_data(plan_data)
+        
+        self.model = PlanModel.from_message(plan_data)
         
         self._setup_ui()
         self._populate_tree()
-        
-    def _deep_copy_plan_data(self, source):
-        """AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST 깊은 복사"""
-        copied = AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST()
-        copied.usPlanListCnt = source.usPlanListCnt
-        
-        for i in range(15):
-            src_list = source.stMinePlanList[i]
-            dst_list = copied.stMinePlanList[i]
-            
-            # chDescription 복사
-            for j in range(50):
-                dst_list.chDescription[j] = src_list.chDescription[j]
-            
-            dst_list.sListID = src_list.sListID
-            dst_list.usOwnshipWaypointCnt = src_list.usOwnshipWaypointCnt
-            
-            # stPlan 복사 (15개)
-            for j in range(15):
-                self._copy_plan_info(src_list.stPlan[j], dst_list.stPlan[j])
-            
-            # stOwnshipWaypoint 복사 (40개)
-            for j in range(40):
-                self._copy_ownship_waypoint(
-                    src_list.stOwnshipWaypoint[j],
-                    dst_list.stOwnshipWaypoint[j]
-                )
-        
-        return copied
-    
-    def _copy_plan_info(self, src, dst):
-        """ST_M_MINE_PLAN_INFO 복사"""
-        dst.sListID = src.sListID
-        dst.usDroppingPlanNumber = src.usDroppingPlanNumber
-        dst.ePlanState = src.ePlanState
-        dst.usWeaponID = src.usWeaponID
-        
-        # cAdditionalText 복사
-        for i in range(50):
-            dst.cAdditionalText[i] = src.cAdditionalText[i]
-        
-        # 위치 정보 복사
-        self._copy_waypoint(src.stDropPos, dst.stDropPos)
-        self._copy_waypoint(src.stLaunchPos, dst.stLaunchPos)
-        
-        dst.usWaypointCnt = src.usWaypointCnt
-        for i in range(8):
-            self._copy_waypoint(src.stWaypoint[i], dst.stWaypoint[i])
     
-    def _copy_waypoint(self, src, dst):
-        """ST_WEAPON_WAYPOINT 복사"""
-        dst.dLatitude = src.dLatitude
-        dst.dLongitude = src.dLongitude
-        dst.fDepth = src.fDepth
-        dst.fSpeed = src.fSpeed
-        dst.bValid = src.bValid
-    
-    def _copy_ownship_waypoint(self, src, dst):
-        """ST_M_MINE_PLAN_OWNSHIP_WAYPOINT 복사"""
-        dst.dLatitude = src.dLatitude
-        dst.dLongitude = src.dLongitude
-        dst.fDepth = src.fDepth
-        dst.fSpeed = src.fSpeed
-        dst.fHeading = src.fHeading
-        dst.bLaunchPoint = src.bLaunchPoint
-        dst.usListID = src.usListID
-        
     def _setup_ui(self):
         """UI 구성"""
         # 상단 프레임: 정보 표시
         info_frame = tk.Frame(self)
         info_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
         
-        tk.Label(info_frame, text=f"Total Plan Lists: {self.plan_data.usPlanListCnt}",
+        tk.Label(info_frame, text=f"Total Plan Lists: {self.model.list_count}",
                  font=("Arial", 10, "bold")).pack(side=tk.LEFT)
         
         # 중앙 프레임: Treeview
@@ -217,11 +94,15 @@ class DroppingPlanListWindow(tk.Toplevel):
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # 15개 슬롯 표시
-        for i in range(15):
-            plan_list = self.plan_data.stMinePlanList[i]
-            
-            if is_plan_list_empty(plan_list):
+        # 15개 슬롯 표시 (빈 슬롯 / 계획 수는 배열 연산으로 한 번에)
+        empty = self.model.list_empty_mask()
+        plan_counts = self.model.valid_plan_counts().tolist()
+        list_ids = self.model.list_field("sListID").tolist()
+        own_wp_counts = self.model.list_field("usOwnshipWaypointCnt").tolist()
+        names = self.model.list_names()
+        
+        for i in range(PLAN_LISTS):
+            if empty[i]:
                 # 비어있는 슬롯
                 self.tree.insert("", "end", iid=str(i), values=(
                     i+1,
@@ -233,38 +114,27 @@ class DroppingPlanListWindow(tk.Toplevel):
                 ), tags=("empty",))
             else:
                 # 사용 중인 슬롯
-                name = extract_string_from_char_array(plan_list.chDescription)
-                list_id = plan_list.sListID
-                plan_count = self._count_valid_plans(plan_list)
-                own_wp_cnt = plan_list.usOwnshipWaypointCnt
+                name = names[i]
                 
                 self.tree.insert("", "end", iid=str(i), values=(
                     i+1,
                     name if name else "<Unnamed>",
-                    list_id,
-                    plan_count,
-                    own_wp_cnt,
+                    list_ids[i],
+                    plan_counts[i],
+                    own_wp_counts[i],
                     "Active"
                 ))
         
         # 스타일 설정
         self.tree.tag_configure("empty", foreground="gray")
     
-    def _count_valid_plans(self, plan_list):
-        """유효한 계획 개수 세기"""
-        count = 0
-        for i in range(15):
-            if not is_plan_info_empty(plan_list.stPlan[i]):
-                count += 1
-        return count
-        
     def _add_new_list(self):
       """Add new plan list"""
       selection = self.tree.selection()
       
       if not selection:
           # 선택 없으면 빈 슬롯 찾기
-          insert_index = self._find_first_empty_slot()
+          insert_index = self.model.first_empty_list()
           if insert_index == -1:
               messagebox.showwarning("Warning", "All 15 slots are full!")
               return
@@ -328,100 +198,13 @@ class DroppingPlanListWindow(tk.Toplevel):
                              f"List '{result['name']}' added at position {insert_index+1}",
                              parent=self)
     
-    def _find_first_empty_slot(self):
-        """첫 번째 빈 슬롯 찾기"""
-        for i in range(15):
-            if is_plan_list_empty(self.plan_data.stMinePlanList[i]):
-                return i
-        return -1
-    
     def _insert_list_at_index(self, index, name):
         """Insert list at specific position (shift others back)"""
-        # 뒤에서부터 한 칸씩 뒤로 이동
-        for i in range(14, index, -1):
-            self._copy_entire_list(
-                self.plan_data.stMinePlanList[i-1],
-                self.plan_data.stMinePlanList[i]
-            )
-        
-        # index 위치에 새 목록 생성
-        new_list = self.plan_data.stMinePlanList[index]
-        self._clear_plan_list(new_list)
-        set_string_to_char_array(new_list.chDescription, name, 50)
-        
-        # sListID 재정렬 (이 함수가 자동으로 설정함)
-        self._reorder_list_ids()
-    
-    def _copy_entire_list(self, src, dst):
-        """ST_M_MINE_PLAN_LIST 전체 복사"""
-        for i in range(50):
-            dst.chDescription[i] = src.chDescription[i]
-        
-        dst.sListID = src.sListID
-        dst.usOwnshipWaypointCnt = src.usOwnshipWaypointCnt
-        
-        for i in range(15):
-            self._copy_plan_info(src.stPlan[i], dst.stPlan[i])
-        
-        for i in range(40):
-            self._copy_ownship_waypoint(
-                src.stOwnshipWaypoint[i],
-                dst.stOwnshipWaypoint[i]
-            )
-    
-    def _clear_plan_list(self, plan_list):
-        """ST_M_MINE_PLAN_LIST 초기화"""
-        for i in range(50):
-            plan_list.chDescription[i] = 0
-        
-        plan_list.sListID = 0
-        plan_list.usOwnshipWaypointCnt = 0
+        # 목록/계획/자함 변침점 배열을 한 칸씩 뒤로 밀고 index 위치에 새 목록 생성
+        self.model.insert_list(index, name)
         
-        for i in range(15):
-            self._clear_plan_info(plan_list.stPlan[i])
-        
-        for i in range(40):
-            self._clear_ownship_waypoint(plan_list.stOwnshipWaypoint[i])
-    
-    def _clear_plan_info(self, plan_info):
-        """ST_M_MINE_PLAN_INFO 초기화"""
-        plan_info.sListID = 0
-        plan_info.usDroppingPlanNumber = 0
-        plan_info.ePlanState = 0
-        plan_info.usWeaponID = 0
-        
-        for i in range(50):
-            plan_info.cAdditionalText[i] = 0
-        
-        plan_info.stDropPos.dLatitude = 0.0
-        plan_info.stDropPos.dLongitude = 0.0
-        plan_info.stDropPos.fDepth = 0.0
-        plan_info.stDropPos.fSpeed = 0.0
-        plan_info.stDropPos.bValid = 0
-        
-        plan_info.stLaunchPos.dLatitude = 0.0
-        plan_info.stLaunchPos.dLongitude = 0.0
-        plan_info.stLaunchPos.fDepth = 0.0
-        plan_info.stLaunchPos.fSpeed = 0.0
-        plan_info.stLaunchPos.bValid = 0
-        
-        plan_info.usWaypointCnt = 0
-        for i in range(8):
-            plan_info.stWaypoint[i].dLatitude = 0.0
-            plan_info.stWaypoint[i].dLongitude = 0.0
-            plan_info.stWaypoint[i].fDepth = 0.0
-            plan_info.stWaypoint[i].fSpeed = 0.0
-            plan_info.stWaypoint[i].bValid = 0
-    
-    def _clear_ownship_waypoint(self, wp):
-        """ST_M_MINE_PLAN_OWNSHIP_WAYPOINT 초기화"""
-        wp.dLatitude = 0.0
-        wp.dLongitude = 0.0
-        wp.fDepth = 0.0
-        wp.fSpeed = 0.0
-        wp.fHeading = 0.0
-        wp.bLaunchPoint = 0
-        wp.usListID = 0
+        # sListID 재정렬
+        self._reorder_list_ids()
     
     def _edit_selected_list(self):
         """선택된 목록 편집"""
@@ -433,14 +216,14 @@ class DroppingPlanListWindow(tk.Toplevel):
         list_index = int(self.tree.item(selection[0])["values"][0]) - 1
         
         # 비어있는 슬롯이면 편집 불가
-        if is_plan_list_empty(self.plan_data.stMinePlanList[list_index]):
+        if self.model.list_empty_mask()[list_index]:
             messagebox.showinfo("Info", "Cannot edit empty slot. Add a new list first.")
             return
         
         # PlanListEditorWindow 오픈
         editor = PlanListEditorWindow(
             self,
-            self.plan_data.stMinePlanList[list_index],
+            self.model,
             list_index
         )
         
@@ -464,15 +247,8 @@ class DroppingPlanListWindow(tk.Toplevel):
                                     f"Delete plan list at position {list_index+1}?"):
             return
         
-        # 앞으로 당기기
-        for i in range(list_index, 14):
-            self._copy_entire_list(
-                self.plan_data.stMinePlanList[i+1],
-                self.plan_data.stMinePlanList[i]
-            )
-        
-        # 마지막 슬롯 초기화
-        self._clear_plan_list(self.plan_data.stMinePlanList[14])
+        # 앞으로 당기기 (마지막 슬롯은 초기화)
+        self.model.delete_list(list_index)
         
         # sListID 재정렬
         self._reorder_list_ids()
@@ -482,47 +258,37 @@ class DroppingPlanListWindow(tk.Toplevel):
         messagebox.showinfo("Success", "Plan list deleted!")
     
     def _reorder_list_ids(self):
-        """sListID 재정렬 (비어있지 않은 목록만 1부터 순차적으로)"""
-        current_id = 1
-        valid_count = 0
-        
-        for i in range(15):
-            plan_list = self.plan_data.stMinePlanList[i]
-            
-            if is_plan_list_empty(plan_list):
-                plan_list.sListID = 0
-            else:
-                plan_list.sListID = current_id
-                current_id += 1
-                valid_count += 1
-        
-        # usPlanListCnt 업데이트
-        self.plan_data.usPlanListCnt = valid_count
+        """sListID 재정렬 (비어있지 않은 목록만 1부터 순차적으로), usPlanListCnt 업데이트"""
+        self.model.reorder_list_ids()
     
     def _save_and_send(self):
         """저장 및 DDS 메시지 송신"""
         # sListID 재정렬
         self._reorder_list_ids()
         
-        # CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST 생성
-        edited_msg = CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST()
-        edited_msg.usPlanListCnt = self.plan_data.usPlanListCnt
-        
-        # 데이터 복사
-        for i in range(15):
-            self._copy_entire_list(
-                self.plan_data.stMinePlanList[i],
-                edited_msg.stMinePlanList[i]
-            )
-        
-        # 메시지 송신
         try:
-            self.publisher.writerCMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST.write(edited_msg)
-            messagebox.showinfo("Success", 
-                                f"Plan lists saved and sent!\nTotal lists: {edited_msg.usPlanListCnt}")
+            # CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST 생성 (편집은 배열 모델에서만 하고, 송신 메시지는 여기서 한 번만 만든다)
+            # 정의되지 않은 enum 값이 있으면 ValueError
+            edited_msg = self.model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+            
+            # 메시지 송신 (publish worker 에서 직렬화/전송, 결과는 _on_plan_list_sent)
+            self.publisher.publish_async("CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST", edited_msg,
+                                         lambda status, error: self._on_plan_list_sent(status, error, edited_msg.usPlanListCnt))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send message: {e}")
 
+    def _on_plan_list_sent(self, status, error, list_count):
+        if status == SENT:
+            messagebox.showinfo("Success", 
+                                f"Plan lists saved and sent!\nTotal lists: {list_count}")
+        elif status == QUEUED:
+            messagebox.showinfo("Queued", 
+                                f"Plan lists saved, will be sent when DDS is ready.\nTotal lists: {list_count}")
+        elif status == FAILED:
+            messagebox.showerror("Error", f"Failed to send message: {error}")
+        elif status == DROPPED:
+            messagebox.showerror("Error", "Failed to send message: publish queue is full")
+
 
 # =============================================================================
 # Level 2: Plan List Editor Window
@@ -531,13 +297,14 @@ class DroppingPlanListWindow(tk.Toplevel):
 class PlanListEditorWindow(tk.Toplevel):
     """특정 목록 내 개별 계획들 편집 (최대 15개)"""
     
-    def __init__(self, parent, plan_list, list_index):
+    def __init__(self, parent, model, list_index):
         super().__init__(parent)
         self.title(f"Edit Plan List #{list_index+1}")
         self.geometry("1000x700")
         
-        self.plan_list = plan_list  # ST_M_MINE_PLAN_LIST 참조
+        self.model = model  # PlanModel 참조
         self.list_index = list_index
+        self.plan_list = model.list_slot(list_index)  # 목록 record (배열 view)
         
         self._setup_ui()
         self._populate_tree()
@@ -551,18 +318,18 @@ class PlanListEditorWindow(tk.Toplevel):
         # 목록 이름
         tk.Label(info_frame, text="List Name:").grid(row=0, column=0, sticky="w", padx=5)
         self.name_entry = tk.Entry(info_frame, width=40)
-        current_name = extract_string_from_char_array(self.plan_list.chDescription)
+        current_name = self.model.list_name(self.list_index)
         self.name_entry.insert(0, current_name)
         self.name_entry.grid(row=0, column=1, sticky="w", padx=5)
         
         # List ID (읽기 전용)
         tk.Label(info_frame, text="List ID:").grid(row=0, column=2, sticky="w", padx=20)
-        tk.Label(info_frame, text=str(self.plan_list.sListID), 
+        tk.Label(info_frame, text=str(self.plan_list["sListID"]), 
                  font=("Arial", 10, "bold")).grid(row=0, column=3, sticky="w")
         
         # Ownship Waypoint Count
         tk.Label(info_frame, text="Ownship WP Count:").grid(row=1, column=0, sticky="w", padx=5)
-        tk.Label(info_frame, text=str(self.plan_list.usOwnshipWaypointCnt),
+        tk.Label(info_frame, text=str(self.plan_list["usOwnshipWaypointCnt"]),
                  font=("Arial", 10, "bold")).grid(row=1, column=1, sticky="w", padx=5)
         
         tk.Button(info_frame, text="Edit Ownship Waypoints",
@@ -620,20 +387,24 @@ class PlanListEditorWindow(tk.Toplevel):
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        for i in range(15):
-            plan_info = self.plan_list.stPlan[i]
+        plans = self.model.list_plans(self.list_index)
+        empty = self.model.plan_empty_mask()[self.list_index]
+        texts = self.model.plan_texts(self.list_index)
+        
+        for i in range(PLANS_PER_LIST):
+            plan_info = plans[i]
             
-            if is_plan_info_empty(plan_info):
+            if empty[i]:
                 self.tree.insert("", "end", iid=str(i), values=(
                     i+1, "<Empty>", "-", "0", "-", "-", "-"
                 ), tags=("empty",))
             else:
-                name = extract_string_from_char_array(plan_info.cAdditionalText)
-                state = plan_info.ePlanState
-                wp_cnt = plan_info.usWaypointCnt
-                drop_lat = f"{plan_info.stDropPos.dLatitude:.5f}"
-                drop_lon = f"{plan_info.stDropPos.dLongitude:.5f}"
-                weapon_id = plan_info.usWeaponID
+                name = texts[i]
+                state = int(plan_info["ePlanState"])
+                wp_cnt = int(plan_info["usWaypointCnt"])
+                drop_lat = f"{plan_info['stDropPos']['dLatitude']:.5f}"
+                drop_lon = f"{plan_info['stDropPos']['dLongitude']:.5f}"
+                weapon_id = int(plan_info["usWeaponID"])
                 
                 self.tree.insert("", "end", iid=str(i), values=(
                     i+1,
@@ -650,18 +421,14 @@ class PlanListEditorWindow(tk.Toplevel):
     def _add_new_plan(self):
         """새 계획 추가"""
         # 빈 슬롯 찾기
-        empty_index = -1
-        for i in range(15):
-            if is_plan_info_empty(self.plan_list.stPlan[i]):
-                empty_index = i
-                break
+        empty_index = self.model.first_empty_plan(self.list_index)
         
         if empty_index == -1:
             messagebox.showwarning("Warning", "All 15 plan slots are full!")
             return
         
         # PlanDetailEditorWindow 오픈 (새 계획)
-        editor = PlanDetailEditorWindow(self, self.plan_list, empty_index, is_new=True)
+        editor = PlanDetailEditorWindow(self, self.model, self.list_index, empty_index, is_new=True)
         self.wait_window(editor)
         self._populate_tree()
     
@@ -674,11 +441,11 @@ class PlanListEditorWindow(tk.Toplevel):
         
         plan_index = int(self.tree.item(selection[0])["values"][0]) - 1
         
-        if is_plan_info_empty(self.plan_list.stPlan[plan_index]):
+        if self.model.plan_empty_mask()[self.list_index, plan_index]:
             messagebox.showinfo("Info", "Cannot edit empty plan. Add a new plan first.")
             return
         
-        editor = PlanDetailEditorWindow(self, self.plan_list, plan_index, is_new=False)
+        editor = PlanDetailEditorWindow(self, self.model, self.list_index, plan_index, is_new=False)
         self.wait_window(editor)
         self._populate_tree()
     
@@ -695,45 +462,14 @@ class PlanListEditorWindow(tk.Toplevel):
             return
         
         # 계획 초기화
-        plan_info = self.plan_list.stPlan[plan_index]
-        self._clear_plan_info(plan_info)
+        self.model.clear_plan(self.list_index, plan_index)
         
         self._populate_tree()
         messagebox.showinfo("Success", "Plan deleted!")
     
-    def _clear_plan_info(self, plan_info):
-        """ST_M_MINE_PLAN_INFO 초기화"""
-        plan_info.sListID = 0
-        plan_info.usDroppingPlanNumber = 0
-        plan_info.ePlanState = 0
-        plan_info.usWeaponID = 0
-        
-        for i in range(50):
-            plan_info.cAdditionalText[i] = 0
-        
-        plan_info.stDropPos.dLatitude = 0.0
-        plan_info.stDropPos.dLongitude = 0.0
-        plan_info.stDropPos.fDepth = 0.0
-        plan_info.stDropPos.fSpeed = 0.0
-        plan_info.stDropPos.bValid = 0
-        
-        plan_info.stLaunchPos.dLatitude = 0.0
-        plan_info.stLaunchPos.dLongitude = 0.0
-        plan_info.stLaunchPos.fDepth = 0.0
-        plan_info.stLaunchPos.fSpeed = 0.0
-        plan_info.stLaunchPos.bValid = 0
-        
-        plan_info.usWaypointCnt = 0
-        for i in range(8):
-            plan_info.stWaypoint[i].dLatitude = 0.0
-            plan_info.stWaypoint[i].dLongitude = 0.0
-            plan_info.stWaypoint[i].fDepth = 0.0
-            plan_info.stWaypoint[i].fSpeed = 0.0
-            plan_info.stWaypoint[i].bValid = 0
-    
     def _edit_ownship_waypoints(self):
         """자함 변침점 편집"""
-        editor = OwnshipWaypointEditorWindow(self, self.plan_list)
+        editor = OwnshipWaypointEditorWindow(self, self.model, self.list_index)
         self.wait_window(editor)
         
         # usOwnshipWaypointCnt 업데이트 (UI 리프레시)
@@ -741,7 +477,7 @@ class PlanListEditorWindow(tk.Toplevel):
             if isinstance(widget, tk.LabelFrame) and widget.cget("text") == "List Information":
                 for child in widget.winfo_children():
                     if isinstance(child, tk.Label) and child.cget("text").isdigit():
-                        child.config(text=str(self.plan_list.usOwnshipWaypointCnt))
+                        child.config(text=str(self.plan_list["usOwnshipWaypointCnt"]))
                         break
                 break
     
@@ -749,7 +485,7 @@ class PlanListEditorWindow(tk.Toplevel):
         """변경사항 적용"""
         # 목록 이름 업데이트
         new_name = self.name_entry.get().strip()
-        set_string_to_char_array(self.plan_list.chDescription, new_name, 50)
+        self.model.set_list_name(self.list_index, new_name)
         
         messagebox.showinfo("Success", "Changes applied!")
         self.destroy()
@@ -762,14 +498,15 @@ class PlanListEditorWindow(tk.Toplevel):
 class PlanDetailEditorWindow(tk.Toplevel):
     """개별 부설계획 상세 편집"""
     
-    def __init__(self, parent, plan_list, plan_index, is_new=False):
+    def __init__(self, parent, model, list_index, plan_index, is_new=False):
         super().__init__(parent)
         self.title(f"Edit Plan #{plan_index+1}")
         self.geometry("800x700")
         
-        self.plan_list = plan_list  # ST_M_MINE_PLAN_LIST 참조
+        self.model = model  # PlanModel 참조
+        self.list_index = list_index
         self.plan_index = plan_index
-        self.plan_info = plan_list.stPlan[plan_index]
+        self.plan_info = model.plan(list_index, plan_index)  # 계획 record (배열 view)
         self.is_new = is_new
         
         self._setup_ui()
@@ -883,22 +620,22 @@ class PlanDetailEditorWindow(tk.Toplevel):
     def _load_data(self):
         """기존 데이터 로드"""
         # 기본 정보
-        self.plan_num_entry.insert(0, str(self.plan_info.usDroppingPlanNumber))
-        self.desc_entry.insert(0, extract_string_from_char_array(self.plan_info.cAdditionalText))
-        self.weapon_id_entry.insert(0, str(self.plan_info.usWeaponID))
-        self.state_entry.insert(0, str(self.plan_info.ePlanState))
+        self.plan_num_entry.insert(0, str(self.plan_info["usDroppingPlanNumber"]))
+        self.desc_entry.insert(0, self.model.plan_text(self.list_index, self.plan_index))
+        self.weapon_id_entry.insert(0, str(self.plan_info["usWeaponID"]))
+        self.state_entry.insert(0, str(self.plan_info["ePlanState"]))
         
         # Launch Position
-        self.launch_lat_entry.insert(0, str(self.plan_info.stLaunchPos.dLatitude))
-        self.launch_lon_entry.insert(0, str(self.plan_info.stLaunchPos.dLongitude))
-        self.launch_depth_entry.insert(0, str(self.plan_info.stLaunchPos.fDepth))
-        self.launch_speed_entry.insert(0, str(self.plan_info.stLaunchPos.fSpeed))
+        self.launch_lat_entry.insert(0, str(self.plan_info["stLaunchPos"]["dLatitude"]))
+        self.launch_lon_entry.insert(0, str(self.plan_info["stLaunchPos"]["dLongitude"]))
+        self.launch_depth_entry.insert(0, str(self.plan_info["stLaunchPos"]["fDepth"]))
+        self.launch_speed_entry.insert(0, str(self.plan_info["stLaunchPos"]["fSpeed"]))
         
         # Drop Position
-        self.drop_lat_entry.insert(0, str(self.plan_info.stDropPos.dLatitude))
-        self.drop_lon_entry.insert(0, str(self.plan_info.stDropPos.dLongitude))
-        self.drop_depth_entry.insert(0, str(self.plan_info.stDropPos.fDepth))
-        self.drop_speed_entry.insert(0, str(self.plan_info.stDropPos.fSpeed))
+        self.drop_lat_entry.insert(0, str(self.plan_info["stDropPos"]["dLatitude"]))
+        self.drop_lon_entry.insert(0, str(self.plan_info["stDropPos"]["dLongitude"]))
+        self.drop_depth_entry.insert(0, str(self.plan_info["stDropPos"]["fDepth"]))
+        self.drop_speed_entry.insert(0, str(self.plan_info["stDropPos"]["fSpeed"]))
         
         # Waypoints
         self._populate_waypoint_tree()
@@ -908,17 +645,17 @@ class PlanDetailEditorWindow(tk.Toplevel):
         for item in self.wp_tree.get_children():
             self.wp_tree.delete(item)
         
-        wp_cnt = self.plan_info.usWaypointCnt
-        for i in range(8):
+        wp_cnt = int(self.plan_info["usWaypointCnt"])
+        for i in range(PLAN_WAYPOINTS):
             if i < wp_cnt:
-                wp = self.plan_info.stWaypoint[i]
+                wp = self.plan_info["stWaypoint"][i]
                 self.wp_tree.insert("", "end", iid=str(i), values=(
                     i+1,
-                    f"{wp.dLatitude:.5f}",
-                    f"{wp.dLongitude:.5f}",
-                    f"{wp.fDepth:.2f}",
-                    f"{wp.fSpeed:.2f}",
-                    wp.bValid
+                    f"{wp['dLatitude']:.5f}",
+                    f"{wp['dLongitude']:.5f}",
+                    f"{wp['fDepth']:.2f}",
+                    f"{wp['fSpeed']:.2f}",
+                    bool(wp["bValid"])
                 ))
             else:
                 self.wp_tree.insert("", "end", iid=str(i), values=(
@@ -929,8 +666,8 @@ class PlanDetailEditorWindow(tk.Toplevel):
     
     def _add_waypoint(self):
         """경로점 추가"""
-        wp_cnt = self.plan_info.usWaypointCnt
-        if wp_cnt >= 8:
+        wp_cnt = int(self.plan_info["usWaypointCnt"])
+        if wp_cnt >= PLAN_WAYPOINTS:
             messagebox.showwarning("Warning", "Maximum 8 waypoints allowed!")
             return
         
@@ -957,14 +694,14 @@ class PlanDetailEditorWindow(tk.Toplevel):
         
         def confirm():
             try:
-                wp = self.plan_info.stWaypoint[wp_cnt]
-                wp.dLatitude = float(lat_entry.get())
-                wp.dLongitude = float(lon_entry.get())
-                wp.fDepth = float(depth_entry.get())
-                wp.fSpeed = float(speed_entry.get())
-                wp.bValid = 1
+                wp = self.plan_info["stWaypoint"][wp_cnt]
+                wp["dLatitude"] = float(lat_entry.get())
+                wp["dLongitude"] = float(lon_entry.get())
+                wp["fDepth"] = float(depth_entry.get())
+                wp["fSpeed"] = float(speed_entry.get())
+                wp["bValid"] = 1
                 
-                self.plan_info.usWaypointCnt += 1
+                self.plan_info["usWaypointCnt"] += 1
                 self._populate_waypoint_tree()
                 dialog.destroy()
             except ValueError:
@@ -981,11 +718,11 @@ class PlanDetailEditorWindow(tk.Toplevel):
         
         wp_index = int(self.wp_tree.item(selection[0])["values"][0]) - 1
         
-        if wp_index >= self.plan_info.usWaypointCnt:
+        if wp_index >= self.plan_info["usWaypointCnt"]:
             messagebox.showinfo("Info", "Cannot edit empty waypoint!")
             return
         
-        wp = self.plan_info.stWaypoint[wp_index]
+        wp = self.plan_info["stWaypoint"][wp_index]
         
         # 입력 다이얼로그
         dialog = tk.Toplevel(self)
@@ -994,30 +731,30 @@ class PlanDetailEditorWindow(tk.Toplevel):
         
         tk.Label(dialog, text="Latitude:").grid(row=0, column=0, sticky="w", padx=5, pady=3)
         lat_entry = tk.Entry(dialog, width=20)
-        lat_entry.insert(0, str(wp.dLatitude))
+        lat_entry.insert(0, str(wp["dLatitude"]))
         lat_entry.grid(row=0, column=1, padx=5, pady=3)
         
         tk.Label(dialog, text="Longitude:").grid(row=1, column=0, sticky="w", padx=5, pady=3)
         lon_entry = tk.Entry(dialog, width=20)
-        lon_entry.insert(0, str(wp.dLongitude))
+        lon_entry.insert(0, str(wp["dLongitude"]))
         lon_entry.grid(row=1, column=1, padx=5, pady=3)
         
         tk.Label(dialog, text="Depth:").grid(row=2, column=0, sticky="w", padx=5, pady=3)
         depth_entry = tk.Entry(dialog, width=20)
-        depth_entry.insert(0, str(wp.fDepth))
+        depth_entry.insert(0, str(wp["fDepth"]))
         depth_entry.grid(row=2, column=1, padx=5, pady=3)
         
         tk.Label(dialog, text="Speed:").grid(row=3, column=0, sticky="w", padx=5, pady=3)
         speed_entry = tk.Entry(dialog, width=20)
-        speed_entry.insert(0, str(wp.fSpeed))
+        speed_entry.insert(0, str(wp["fSpeed"]))
         speed_entry.grid(row=3, column=1, padx=5, pady=3)
         
         def confirm():
             try:
-                wp.dLatitude = float(lat_entry.get())
-                wp.dLongitude = float(lon_entry.get())
-                wp.fDepth = float(depth_entry.get())
-                wp.fSpeed = float(speed_entry.get())
+                wp["dLatitude"] = float(lat_entry.get())
+                wp["dLongitude"] = float(lon_entry.get())
+                wp["fDepth"] = float(depth_entry.get())
+                wp["fSpeed"] = float(speed_entry.get())
                 
                 self._populate_waypoint_tree()
                 dialog.destroy()
@@ -1035,62 +772,47 @@ class PlanDetailEditorWindow(tk.Toplevel):
         
         wp_index = int(self.wp_tree.item(selection[0])["values"][0]) - 1
         
-        if wp_index >= self.plan_info.usWaypointCnt:
+        if wp_index >= self.plan_info["usWaypointCnt"]:
             messagebox.showinfo("Info", "Cannot delete empty waypoint!")
             return
         
-        # 뒤의 경로점들을 앞으로 당기기
-        for i in range(wp_index, 7):
-            if i+1 < 8:
-                self.plan_info.stWaypoint[i].dLatitude = self.plan_info.stWaypoint[i+1].dLatitude
-                self.plan_info.stWaypoint[i].dLongitude = self.plan_info.stWaypoint[i+1].dLongitude
-                self.plan_info.stWaypoint[i].fDepth = self.plan_info.stWaypoint[i+1].fDepth
-                self.plan_info.stWaypoint[i].fSpeed = self.plan_info.stWaypoint[i+1].fSpeed
-                self.plan_info.stWaypoint[i].bValid = self.plan_info.stWaypoint[i+1].bValid
-        
-        # 마지막 경로점 초기화
-        last_wp = self.plan_info.stWaypoint[7]
-        last_wp.dLatitude = 0.0
-        last_wp.dLongitude = 0.0
-        last_wp.fDepth = 0.0
-        last_wp.fSpeed = 0.0
-        last_wp.bValid = 0
-        
-        self.plan_info.usWaypointCnt -= 1
+        # 뒤의 경로점들을 앞으로 당기고 마지막 경로점 초기화
+        self.model.delete_plan_waypoint(self.list_index, self.plan_index, wp_index)
         self._populate_waypoint_tree()
     
     def _apply(self):
         """변경사항 적용"""
         try:
             # 기본 정보
-            self.plan_info.usDroppingPlanNumber = int(self.plan_num_entry.get())
-            self.plan_info.usWeaponID = int(self.weapon_id_entry.get())
-            self.plan_info.ePlanState = int(self.state_entry.get())
+            self.plan_info["usDroppingPlanNumber"] = int(self.plan_num_entry.get())
+            self.plan_info["usWeaponID"] = int(self.weapon_id_entry.get())
+            self.plan_info["ePlanState"] = check_plan_enum("ePlanState", int(self.state_entry.get()))
             
             desc = self.desc_entry.get().strip()
-            set_string_to_char_array(self.plan_info.cAdditionalText, desc, 50)
+            self.model.set_plan_text(self.list_index, self.plan_index, desc)
             
             # sListID 설정 (목록의 sListID와 동일하게)
-            self.plan_info.sListID = self.plan_list.sListID
+            self.plan_info["sListID"] = self.model.list_slot(self.list_index)["sListID"]
             
             # Launch Position
-            self.plan_info.stLaunchPos.dLatitude = float(self.launch_lat_entry.get())
-            self.plan_info.stLaunchPos.dLongitude = float(self.launch_lon_entry.get())
-            self.plan_info.stLaunchPos.fDepth = float(self.launch_depth_entry.get())
-            self.plan_info.stLaunchPos.fSpeed = float(self.launch_speed_entry.get())
-            self.plan_info.stLaunchPos.bValid = 1
+            self.plan_info["stLaunchPos"]["dLatitude"] = float(self.launch_lat_entry.get())
+            self.plan_info["stLaunchPos"]["dLongitude"] = float(self.launch_lon_entry.get())
+            self.plan_info["stLaunchPos"]["fDepth"] = float(self.launch_depth_entry.get())
+            self.plan_info["stLaunchPos"]["fSpeed"] = float(self.launch_speed_entry.get())
+            self.plan_info["stLaunchPos"]["bValid"] = 1
             
             # Drop Position
-            self.plan_info.stDropPos.dLatitude = float(self.drop_lat_entry.get())
-            self.plan_info.stDropPos.dLongitude = float(self.drop_lon_entry.get())
-            self.plan_info.stDropPos.fDepth = float(self.drop_depth_entry.get())
-            self.plan_info.stDropPos.fSpeed = float(self.drop_speed_entry.get())
-            self.plan_info.stDropPos.bValid = 1
+            self.plan_info["stDropPos"]["dLatitude"] = float(self.drop_lat_entry.get())
+            self.plan_info["stDropPos"]["dLongitude"] = float(self.drop_lon_entry.get())
+            self.plan_info["stDropPos"]["fDepth"] = float(self.drop_depth_entry.get())
+            self.plan_info["stDropPos"]["fSpeed"] = float(self.drop_speed_entry.get())
+            self.plan_info["stDropPos"]["bValid"] = 1
             
             messagebox.showinfo("Success", "Plan updated successfully!")
             self.destroy()
             
-        except ValueError as e:
+        # OverflowError: 배열 필드 타입 범위를 벗어난 정수 (예: 음수 Weapon ID)
+        except (ValueError, OverflowError) as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
 
 
@@ -1101,12 +823,15 @@ class PlanDetailEditorWindow(tk.Toplevel):
 class OwnshipWaypointEditorWindow(tk.Toplevel):
     """자함 변침점 편집 (최대 40개)"""
     
-    def __init__(self, parent, plan_list):
+    def __init__(self, parent, model, list_index):
         super().__init__(parent)
         self.title("Edit Ownship Waypoints")
         self.geometry("900x600")
         
-        self.plan_list = plan_list  # ST_M_MINE_PLAN_LIST 참조
+        self.model = model  # PlanModel 참조
+        self.list_index = list_index
+        self.plan_list = model.list_slot(list_index)  # 목록 record (배열 view)
+        self.waypoints = model.ownship_waypoints(list_index)  # 자함 변침점 40개 (배열 view)
         
         self._setup_ui()
         self._populate_tree()
@@ -1117,7 +842,7 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         info_frame = tk.Frame(self)
         info_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
         
-        tk.Label(info_frame, text=f"Ownship Waypoint Count: {self.plan_list.usOwnshipWaypointCnt}",
+        tk.Label(info_frame, text=f"Ownship Waypoint Count: {self.plan_list['usOwnshipWaypointCnt']}",
                  font=("Arial", 10, "bold")).pack(side=tk.LEFT)
         
         # Treeview
@@ -1152,20 +877,20 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        wp_cnt = self.plan_list.usOwnshipWaypointCnt
+        wp_cnt = int(self.plan_list["usOwnshipWaypointCnt"])
         
-        for i in range(40):
+        for i in range(OWNSHIP_WAYPOINTS):
             if i < wp_cnt:
-                wp = self.plan_list.stOwnshipWaypoint[i]
+                wp = self.waypoints[i]
                 self.tree.insert("", "end", iid=str(i), values=(
                     i+1,
-                    f"{wp.dLatitude:.5f}",
-                    f"{wp.dLongitude:.5f}",
-                    f"{wp.fDepth:.2f}",
-                    f"{wp.fSpeed:.2f}",
-                    f"{wp.fHeading:.2f}",
-                    wp.bLaunchPoint,
-                    wp.usListID
+                    f"{wp['dLatitude']:.5f}",
+                    f"{wp['dLongitude']:.5f}",
+                    f"{wp['fDepth']:.2f}",
+                    f"{wp['fSpeed']:.2f}",
+                    f"{wp['fHeading']:.2f}",
+                    bool(wp["bLaunchPoint"]),
+                    int(wp["usListID"])
                 ))
             else:
                 self.tree.insert("", "end", iid=str(i), values=(
@@ -1176,8 +901,8 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
     
     def _add_waypoint(self):
         """경로점 추가"""
-        wp_cnt = self.plan_list.usOwnshipWaypointCnt
-        if wp_cnt >= 40:
+        wp_cnt = int(self.plan_list["usOwnshipWaypointCnt"])
+        if wp_cnt >= OWNSHIP_WAYPOINTS:
             messagebox.showwarning("Warning", "Maximum 40 waypoints allowed!")
             return
         
@@ -1203,16 +928,16 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         
         def confirm():
             try:
-                wp = self.plan_list.stOwnshipWaypoint[wp_cnt]
-                wp.dLatitude = float(entries["lat"].get())
-                wp.dLongitude = float(entries["lon"].get())
-                wp.fDepth = float(entries["depth"].get())
-                wp.fSpeed = float(entries["speed"].get())
-                wp.fHeading = float(entries["heading"].get())
-                wp.bLaunchPoint = int(entries["launch"].get())
-                wp.usListID = self.plan_list.sListID
+                wp = self.waypoints[wp_cnt]
+                wp["dLatitude"] = float(entries["lat"].get())
+                wp["dLongitude"] = float(entries["lon"].get())
+                wp["fDepth"] = float(entries["depth"].get())
+                wp["fSpeed"] = float(entries["speed"].get())
+                wp["fHeading"] = float(entries["heading"].get())
+                wp["bLaunchPoint"] = int(entries["launch"].get())
+                wp["usListID"] = self.plan_list["sListID"]
                 
-                self.plan_list.usOwnshipWaypointCnt += 1
+                self.plan_list["usOwnshipWaypointCnt"] += 1
                 self._populate_tree()
                 dialog.destroy()
             except ValueError:
@@ -1229,23 +954,23 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         
         wp_index = int(self.tree.item(selection[0])["values"][0]) - 1
         
-        if wp_index >= self.plan_list.usOwnshipWaypointCnt:
+        if wp_index >= self.plan_list["usOwnshipWaypointCnt"]:
             messagebox.showinfo("Info", "Cannot edit empty waypoint!")
             return
         
-        wp = self.plan_list.stOwnshipWaypoint[wp_index]
+        wp = self.waypoints[wp_index]
         
         dialog = tk.Toplevel(self)
         dialog.title(f"Edit Ownship WP #{wp_index+1}")
         dialog.geometry("350x250")
         
         fields = [
-            ("Latitude:", "lat", wp.dLatitude),
-            ("Longitude:", "lon", wp.dLongitude),
-            ("Depth:", "depth", wp.fDepth),
-            ("Speed:", "speed", wp.fSpeed),
-            ("Heading:", "heading", wp.fHeading),
-            ("Launch Point (0/1):", "launch", wp.bLaunchPoint),
+            ("Latitude:", "lat", wp["dLatitude"]),
+            ("Longitude:", "lon", wp["dLongitude"]),
+            ("Depth:", "depth", wp["fDepth"]),
+            ("Speed:", "speed", wp["fSpeed"]),
+            ("Heading:", "heading", wp["fHeading"]),
+            ("Launch Point (0/1):", "launch", wp["bLaunchPoint"]),
         ]
         
         entries = {}
@@ -1258,12 +983,12 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         
         def confirm():
             try:
-                wp.dLatitude = float(entries["lat"].get())
-                wp.dLongitude = float(entries["lon"].get())
-                wp.fDepth = float(entries["depth"].get())
-                wp.fSpeed = float(entries["speed"].get())
-                wp.fHeading = float(entries["heading"].get())
-                wp.bLaunchPoint = int(entries["launch"].get())
+                wp["dLatitude"] = float(entries["lat"].get())
+                wp["dLongitude"] = float(entries["lon"].get())
+                wp["fDepth"] = float(entries["depth"].get())
+                wp["fSpeed"] = float(entries["speed"].get())
+                wp["fHeading"] = float(entries["heading"].get())
+                wp["bLaunchPoint"] = int(entries["launch"].get())
                 
                 self._populate_tree()
                 dialog.destroy()
@@ -1281,32 +1006,10 @@ class OwnshipWaypointEditorWindow(tk.Toplevel):
         
         wp_index = int(self.tree.item(selection[0])["values"][0]) - 1
         
-        if wp_index >= self.plan_list.usOwnshipWaypointCnt:
+        if wp_index >= self.plan_list["usOwnshipWaypointCnt"]:
             messagebox.showinfo("Info", "Cannot delete empty waypoint!")
             return
         
-        # 뒤의 경로점들을 앞으로 당기기
-        for i in range(wp_index, 39):
-            if i+1 < 40:
-                src = self.plan_list.stOwnshipWaypoint[i+1]
-                dst = self.plan_list.stOwnshipWaypoint[i]
-                dst.dLatitude = src.dLatitude
-                dst.dLongitude = src.dLongitude
-                dst.fDepth = src.fDepth
-                dst.fSpeed = src.fSpeed
-                dst.fHeading = src.fHeading
-                dst.bLaunchPoint = src.bLaunchPoint
-                dst.usListID = src.usListID
-        
-        # 마지막 경로점 초기화
-        last_wp = self.plan_list.stOwnshipWaypoint[39]
-        last_wp.dLatitude = 0.0
-        last_wp.dLongitude = 0.0
-        last_wp.fDepth = 0.0
-        last_wp.fSpeed = 0.0
-        last_wp.fHeading = 0.0
-        last_wp.bLaunchPoint = 0
-        last_wp.usListID = 0
-        
-        self.plan_list.usOwnshipWaypointCnt -= 1
+        # 뒤의 경로점들을 앞으로 당기고 마지막 경로점 초기화
+        self.model.delete_ownship_waypoint(self.list_index, wp_index)
         self._populate_tree()
@@ -2,7 +2,8 @@
 import tkinter as tk
 from tkinter import messagebox
 import json
-from dds.AIEP_AIEP_ import TEWA_ASSIGN_CMD, ST_WA_SESSION, SGEODETIC_POSITION
+from Communication.aiep_types import TEWA_ASSIGN_CMD, ST_WA_SESSION, SGEODETIC_POSITION
+from Communication.aiep_publish_worker import SENT, QUEUED
 
 # 변환 함수: 입력된 문자열을 JSON 저장/불러움에 사용할 수 있도록 처리
 def save_values_to_json(data, filename="tewa_assign_cmd.json"):
@@ -125,12 +126,20 @@ class TEWAAssignCmdWindow(tk.Toplevel):
             session.enAllocTarget = enAllocTarget
             
             # 전송: publisher_callback 함수 호출
-            self.publisher_callback.publish_TEWA_ASSIGN_CMD(cmd_msg)
-            messagebox.showinfo("Info", "TEWA_ASSIGN_CMD message sent.")
+            self.publisher_callback.publish_TEWA_ASSIGN_CMD(cmd_msg, self._on_assign_cmd_sent)
             #self.destroy()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send TEWA_ASSIGN_CMD: {e}")
     
+    def _on_assign_cmd_sent(self, status, error):
+        # publish worker 완료 callback (Tk 스레드)
+        if status == SENT:
+            messagebox.showinfo("Info", "TEWA_ASSIGN_CMD message sent.")
+        elif status == QUEUED:
+            messagebox.showinfo("Info", "TEWA_ASSIGN_CMD message will be sent when DDS is ready.")
+        else:
+            messagebox.showerror("Error", f"Failed to send TEWA_ASSIGN_CMD: {error or status}")
+
     def save_to_json(self):
         try:
             # 각 입력 필드의 값을 읽어 딕셔너리 형태로 저장 (여기서는 dict를 임시 저장용으로 사용합니다)
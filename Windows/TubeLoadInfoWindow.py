@@ -6,8 +6,9 @@ TubeLoadInfoWindow.py
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from Communication.aiep_publish_worker import SENT, QUEUED, FAILED, DROPPED
 import json
-from dds.AIEP_AIEP_ import TEWA_WA_TUBE_LOAD_INFO
+from Communication.aiep_types import TEWA_WA_TUBE_LOAD_INFO
 
 
 WEAPON_TYPES = {
@@ -143,24 +144,28 @@ class TubeLoadInfoWindow(tk.Toplevel):
     def send_all_tube_loads(self):
         """Send load info for all tubes"""
         try:
-            # Read all tube configurations
+            # Read all tube configurations (모두 읽은 뒤 전송 - 일부 발사관만 전송되지 않도록)
+            messages = []
             for tube_num in range(1, 7):
                 weapon_name = self.tube_combos[tube_num].get()
                 weapon_kind = WEAPON_TYPES[weapon_name]
                 
-                # Create and send message
                 msg = TEWA_WA_TUBE_LOAD_INFO()
                 msg.eTubeNum = tube_num
                 msg.eWpnKind = weapon_kind
-                
-                self.publisher.publish_TEWA_WA_TUBE_LOAD_INFO(msg)
-                
-                # Save to main GUI
-                if not hasattr(self.main_gui, 'tube_load_info_data'):
-                    self.main_gui.tube_load_info_data = {}
-                self.main_gui.tube_load_info_data[tube_num] = weapon_kind
+                messages.append(msg)
             
-            messagebox.showinfo("Success", "All tube load info sent!")
+            # 6개 발사관을 한 batch 로 전송 (write 6회 + flush 1회), 결과는 한 번만 표시
+            self.publisher.publish_batch_async(
+                "TEWA_WA_TUBE_LOAD_INFO", messages,
+                lambda status, error: self._report_send_result(status, error, "All tube load info sent!"))
+            
+            # Save to main GUI
+            if not hasattr(self.main_gui, 'tube_load_info_data'):
+                self.main_gui.tube_load_info_data = {}
+            for msg in messages:
+                self.main_gui.tube_load_info_data[msg.eTubeNum] = msg.eWpnKind
+                self.main_gui.notifier.post('TEWA_WA_TUBE_LOAD_INFO', msg.eTubeNum)
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send: {e}")
@@ -194,14 +199,15 @@ class TubeLoadInfoWindow(tk.Toplevel):
                 msg.eTubeNum = tube_num
                 msg.eWpnKind = weapon_kind
                 
-                self.publisher.publish_TEWA_WA_TUBE_LOAD_INFO(msg)
+                self.publisher.publish_TEWA_WA_TUBE_LOAD_INFO(
+                    msg, lambda status, error: self._report_send_result(status, error, f"Tube {tube_num} load info sent!"))
                 
                 # Save to main GUI
                 if not hasattr(self.main_gui, 'tube_load_info_data'):
                     self.main_gui.tube_load_info_data = {}
                 self.main_gui.tube_load_info_data[tube_num] = weapon_kind
+                self.main_gui.notifier.post('TEWA_WA_TUBE_LOAD_INFO', tube_num)
                 
-                messagebox.showinfo("Success", f"Tube {tube_num} load info sent!")
                 dialog.destroy()
             
             except Exception as e:
@@ -209,6 +215,18 @@ class TubeLoadInfoWindow(tk.Toplevel):
         
         tk.Button(dialog, text="Send", command=send).pack(pady=10)
     
+    def _report_send_result(self, status, error, success_text):
+        """Show the publish worker result of a send (single tube or whole batch)."""
+        # 이전 전송이 새 전송으로 교체된 경우 (SUPERSEDED) 는 새 결과만 표시
+        if status == SENT:
+            messagebox.showinfo("Success", success_text)
+        elif status == QUEUED:
+            messagebox.showinfo("Queued", "Tube load info will be sent when DDS is ready.")
+        elif status == FAILED:
+            messagebox.showerror("Error", f"Failed to send:\n{error}")
+        elif status == DROPPED:
+            messagebox.showerror("Error", "Failed to send: publish queue is full")
+
     def save_to_json(self):
         """Save values to JSON"""
         try:
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
-from dds.AIEP_AIEP_ import TEWA_ASSIGN_CMD, ST_WA_SESSION, SGEODETIC_POSITION, CMSHCI_AIEP_WPN_CTRL_CMD
+from Communication.aiep_types import TEWA_ASSIGN_CMD, ST_WA_SESSION, SGEODETIC_POSITION, CMSHCI_AIEP_WPN_CTRL_CMD
+from Communication.aiep_publish_worker import SENT, QUEUED
 
 class WpnCtrlCmdWindow:
     def __init__(self, parent, publisher):
@@ -81,14 +82,20 @@ class WpnCtrlCmdWindow:
             msg.eWpnKind = wpn_kind
             msg.eWpnCtrlCmd = cmd_value
             
-            # 메시지 전송
-            self.publisher.writerCMSHCI_AIEP_WPN_CTRL_CMD.write(msg)
-            
-            messagebox.showinfo("Command Sent", 
-                               f"Weapon Control Command sent:\n"
-                               f"Tube: {tube_num}\n"
-                               f"Weapon Kind: {wpn_kind}\n"
-                               f"Command: {self.cmd_var.get()}")
+            # 메시지 전송 (publish worker, 결과는 Tk 스레드에서 표시)
+            cmd_name = self.cmd_var.get()
+
+            def on_done(status, error):
+                if status in (SENT, QUEUED):
+                    messagebox.showinfo("Command Sent", 
+                                       f"Weapon Control Command {'sent' if status == SENT else 'queued until DDS is ready'}:\n"
+                                       f"Tube: {tube_num}\n"
+                                       f"Weapon Kind: {wpn_kind}\n"
+                                       f"Command: {cmd_name}")
+                else:
+                    messagebox.showerror("Send Failed", f"Failed to send command:\n{error or status}")
+
+            self.publisher.publish_async("CMSHCI_AIEP_WPN_CTRL_CMD", msg, on_done)
                                
         except Exception as e:
             messagebox.showerror("Send Failed", f"Failed to send command:\n{e}")      
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
-from dds.AIEP_AIEP_ import CMSHCI_AIEP_WPN_GEO_WAYPOINTS
+from Communication.aiep_publish_worker import SENT, QUEUED, SUPERSEDED
 
 class WpnGeoWaypointsWindow:
     def __init__(self, parent, publisher):
@@ -157,7 +157,7 @@ class WpnGeoWaypointsWindow:
             auto_generate = self.auto_generate_var.get()
             
             # 메시지 생성
-            msg = CMSHCI_AIEP_WPN_GEO_WAYPOINTS()
+            msg = self.publisher.acquire_message("CMSHCI_AIEP_WPN_GEO_WAYPOINTS")  # 재사용 객체, 송신 완료 후 반납
             # 헤더 설정이 필요하면 여기에 추가
             msg.eWpnKind = wpn_kind
             msg.eTubeNum = tube_num
@@ -201,10 +201,16 @@ class WpnGeoWaypointsWindow:
                     else:
                         raise ValueError(f"Invalid input for waypoint #{i+1}: {e}")
             
-            # 메시지 전송
-            self.publisher.writerCMSHCI_AIEP_WPN_GEO_WAYPOINTS.write(msg)
-            
-            messagebox.showinfo("Success", f"Waypoints information for weapon type {wpn_kind}, tube {tube_num} sent successfully.")
+            # 메시지 전송 (publish worker, 같은 발사관의 미전송 경로점은 새 값으로 교체)
+            def on_done(status, error):
+                if status == SENT:
+                    messagebox.showinfo("Success", f"Waypoints information for weapon type {wpn_kind}, tube {tube_num} sent successfully.")
+                elif status == QUEUED:
+                    messagebox.showinfo("Queued", f"Waypoints information for weapon type {wpn_kind}, tube {tube_num} will be sent when DDS is ready.")
+                elif status != SUPERSEDED:
+                    messagebox.showerror("Send Failed", f"Failed to send message:\n{error or status}")
+
+            self.publisher.publish_async("CMSHCI_AIEP_WPN_GEO_WAYPOINTS", msg, on_done, release=True)
 
 
         except ValueError as e:
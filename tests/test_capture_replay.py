@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+test_capture_replay.py
+CaptureWriter 로 기록한 파일을 iter_records / ReplayDriver 로 재생 (loopback transport)
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import tempfile
+import unittest
+from unittest import mock
+
+from Communication.aiep_capture import CaptureWriter, capture_files, iter_records, deserialize_sample
+from Communication.aiep_change_notifier import ChangeNotifier
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_msg_subscriber import MySubscriber
+from Communication.aiep_replay import ReplayDriver, ReplayReader
+from Communication.aiep_types import AIEP_AI_INFER_RESULT_WP, AIEP_WPN_CTRL_STATUS_INFO, CMSHCI_AIEP_PA_INFO
+
+
+def _samples():
+    return [
+        ("AIEP_WPN_CTRL_STATUS_INFO", AIEP_WPN_CTRL_STATUS_INFO(eTubeNum=1, eCtrlState=2)),
+        ("AIEP_WPN_CTRL_STATUS_INFO", AIEP_WPN_CTRL_STATUS_INFO(eTubeNum=2, eCtrlState=5)),
+        ("CMSHCI_AIEP_PA_INFO", CMSHCI_AIEP_PA_INFO()),
+        ("AIEP_AI_INFER_RESULT_WP", AIEP_AI_INFER_RESULT_WP(eTubeNum=3)),
+    ]
+
+
+class CaptureReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.directory = self._tempdir.name
+        MySubscriber.store.clear()
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def _capture(self, **kwargs):
+        writer = CaptureWriter(self.directory, **kwargs)
+        for index, (topic, sample) in enumerate(_samples()):
+            writer.record(topic, sample, timestamp=100.0 + index)
+        writer.close()
+        return writer
+
+    def test_records_round_trip_in_order(self):
+        writer = self._capture()
+        self.assertEqual(writer.records_written, 4)
+        records = list(iter_records(self.directory))
+        self.assertEqual([(timestamp, topic) for timestamp, topic, _ in records],
+                         [(100.0 + index, topic) for index, (topic, _) in enumerate(_samples())])
+        decoded = deserialize_sample(AIEP_WPN_CTRL_STATUS_INFO, records[1][2])
+        self.assertEqual((decoded.eTubeNum, decoded.eCtrlState), (2, 5))
+
+    def test_small_chunks_are_read_back_in_order(self):
+        # 블록마다 새 chunk 파일
+        self._capture(chunk_bytes=1, block_bytes=1)
+        self.assertEqual(len(capture_files(self.directory)), 4)
+        self.assertEqual([topic for _, topic, _ in iter_records(self.directory)],
+                         [topic for topic, _ in _samples()])
+
+    def test_truncated_block_ends_the_file(self):
+        self._capture()
+        path = capture_files(self.directory)[0]
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 1)
+        self.assertEqual(list(iter_records(path)), [])
+
+    def test_replay_stores_samples_without_relaying(self):
+        self._capture()
+        with mock.patch.object(MYPublisher, "publish") as publish:
+            driver = ReplayDriver(self.directory, speed=0)
+            driver.run()
+        publish.assert_not_called()
+        self.assertTrue(MySubscriber.relay_enabled)
+        # 실시간 수신이면 중계 송신됨
+        with mock.patch.object(MYPublisher, "publish") as publish:
+            reader = ReplayReader("AIEP_AI_INFER_RESULT_WP")
+            reader.pending.append(AIEP_AI_INFER_RESULT_WP(eTubeNum=3))
+            MySubscriber.process_data(reader)
+        publish.assert_called_once()
+        self.assertEqual(driver.samples_replayed, 4)
+        self.assertEqual(MySubscriber.store.get_value("AIEP_WPN_CTRL_STATUS_INFO", 1).eCtrlState, 2)
+        self.assertEqual(MySubscriber.store.get_value("AIEP_WPN_CTRL_STATUS_INFO", 2).eCtrlState, 5)
+        self.assertIsNotNone(MySubscriber.store.get("CMSHCI_AIEP_PA_INFO"))
+        self.assertEqual(MySubscriber.store.get_value("AIEP_AI_INFER_RESULT_WP").eTubeNum, 3)
+
+    def test_pump_drives_notifier_listeners(self):
+        self._capture()
+        notifier = ChangeNotifier(None, MySubscriber.store)
+        changes = []
+        notifier.subscribe(changes.append, ["AIEP_WPN_CTRL_STATUS_INFO"])
+        driver = ReplayDriver(self.directory, speed=0, pump=notifier.drain)
+        with mock.patch.object(MYPublisher, "publish"):
+            rate = driver.run()
+        # 샘플마다 처리 후 drain -> 관심 토픽 샘플 2개가 각각 통지됨
+        self.assertEqual(changes, [{("AIEP_WPN_CTRL_STATUS_INFO", 1)}, {("AIEP_WPN_CTRL_STATUS_INFO", 2)}])
+        self.assertGreater(rate, 0)
+        self.assertGreaterEqual(driver.decode_rate, rate)
+        self.assertGreater(driver.pump_elapsed, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+test_ep_scene.py
+EPScene 전체 draw 요청 합치기 (draw_idle) 및 full/blit 판별 (Agg 캔버스, Tk 불필요)
+"""
+
+import unittest
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from Windows.EPScene import EPScene
+
+
+class _IdleCanvas(FigureCanvasAgg):
+    """Tk 처럼 draw_idle 을 모았다가 run_idle() 에서 한 번만 그리는 캔버스"""
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.idle_requested = False
+        self.draws = 0
+
+    def draw_idle(self, *args, **kwargs):
+        self.idle_requested = True
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+    def run_idle(self):
+        if self.idle_requested:
+            self.idle_requested = False
+            self.draw()
+
+
+class EPSceneTest(unittest.TestCase):
+
+    def setUp(self):
+        figure = Figure()
+        self.canvas = _IdleCanvas(figure)
+        self.scene = EPScene(self.canvas, figure.add_subplot(111))
+
+    def _frame(self, static_x, dynamic_x):
+        self.scene.begin()
+        self.scene.line("route", [static_x, 1], [0, 1], [0, 0])
+        self.scene.points("current", [dynamic_x], [0], [0], dynamic=True)
+        return self.scene.end()
+
+    def test_full_redraws_are_merged_until_idle(self):
+        self.assertEqual(self._frame(0, 0), "full")
+        self.assertEqual(self._frame(0.5, 0), "full")
+        # 대기 중인 full draw 가 있으면 dynamic 변경은 blit 하지 않음
+        self.assertEqual(self._frame(0.5, 0.2), "skip")
+        self.assertEqual(self.canvas.draws, 0)
+
+        self.canvas.run_idle()
+        self.assertEqual(self.canvas.draws, 1)
+        self.assertEqual(self.scene.stats["full"][0], 1)
+        self.assertGreater(self.scene.stats["full"][2], 0)
+
+    def test_dynamic_change_blits_after_full_draw(self):
+        self._frame(0, 0)
+        self.canvas.run_idle()
+        self.assertEqual(self._frame(0, 0.2), "blit")
+        self.assertEqual(self._frame(0, 0.2), "skip")
+        self.assertEqual(self.canvas.draws, 1)
+        self.assertEqual(self.scene.stats["blit"][0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+test_message_pool.py
+MessagePool reset 및 MYPublisher.publish_async(release=True) 의 완료 통지 후 반납 검증 (loopback transport)
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import threading
+import unittest
+from unittest import mock
+
+from Communication.aiep_message_pool import MessagePool
+from Communication.aiep_msg_publisher import MYPublisher
+from Communication.aiep_publish_worker import PublishWorker, SENT, QUEUED, SUPERSEDED
+from Communication.aiep_types import CMSHCI_AIEP_WPN_GEO_WAYPOINTS
+
+TIMEOUT = 5.0
+GEO_WAYPOINTS = "CMSHCI_AIEP_WPN_GEO_WAYPOINTS"
+
+
+class MessagePoolTest(unittest.TestCase):
+
+    def test_acquire_resets_released_object_in_place(self):
+        pool = MessagePool()
+        msg = pool.acquire(CMSHCI_AIEP_WPN_GEO_WAYPOINTS)
+        waypoints = msg.stGeoWaypoints.stGeoPos
+        msg.eTubeNum = 3
+        waypoints[0].dLatitude = 35.0
+        pool.release(msg)
+
+        again = pool.acquire(CMSHCI_AIEP_WPN_GEO_WAYPOINTS)
+        self.assertIs(again, msg)
+        self.assertIs(again.stGeoWaypoints.stGeoPos, waypoints)
+        self.assertEqual(again, CMSHCI_AIEP_WPN_GEO_WAYPOINTS())
+        self.assertEqual((pool.created, pool.reused), (1, 1))
+
+
+class PublishReleaseTest(unittest.TestCase):
+    """write 를 붙잡는 가짜 publish 로 worker 를 돌려 반납 시점 확인"""
+
+    def setUp(self):
+        self.result = True
+        self.written = []
+        self.started = threading.Event()
+        self.release_write = threading.Event()
+        self.worker = PublishWorker(self._publish)
+        self.pool = MessagePool()
+        for target, value in (("worker", self.worker), ("pool", self.pool)):
+            patcher = mock.patch.object(MYPublisher, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.worker.stop, TIMEOUT)
+        self.addCleanup(self.release_write.set)
+
+    def _publish(self, message_name, sample):
+        self.started.set()
+        self.release_write.wait(TIMEOUT)
+        self.written.append(sample)
+        return self.result
+
+    def _send(self, tube, results):
+        msg = MYPublisher.acquire_message(GEO_WAYPOINTS)
+        msg.eTubeNum = tube
+        MYPublisher.publish_async(GEO_WAYPOINTS, msg, lambda status, error: results.append(status), release=True)
+        return msg
+
+    def _finish(self):
+        # stop() 은 worker 스레드의 완료 callback 까지 끝난 뒤 반환
+        self.release_write.set()
+        self.worker.stop(TIMEOUT)
+
+    def test_sample_is_released_after_write_not_on_enqueue(self):
+        results = []
+        msg = self._send(1, results)
+        self.assertTrue(self.started.wait(TIMEOUT))
+        # write 중에는 반납되지 않아 다음 acquire 는 새 객체
+        self.assertIsNot(MYPublisher.acquire_message(GEO_WAYPOINTS), msg)
+        self._finish()
+        self.assertEqual(results, [SENT])
+        self.assertEqual(self.written, [msg])
+        self.assertIs(MYPublisher.acquire_message(GEO_WAYPOINTS), msg)
+
+    def test_superseded_sample_is_released(self):
+        results = []
+        self._send(1, results)
+        self.assertTrue(self.started.wait(TIMEOUT))
+        replaced = self._send(2, results)
+        self.assertFalse(self.pool._free.get(CMSHCI_AIEP_WPN_GEO_WAYPOINTS))
+        latest = self._send(2, results)
+        # 같은 발사관의 대기 샘플은 교체 즉시 반납
+        self.assertEqual(results, [SUPERSEDED])
+        self.assertEqual(self.pool._free[CMSHCI_AIEP_WPN_GEO_WAYPOINTS], [replaced])
+        self._finish()
+        self.assertIs(self.written[-1], latest)
+        self.assertEqual(sorted(results), [SENT, SENT, SUPERSEDED])
+
+    def test_queued_sample_is_kept_for_pending_write(self):
+        self.result = False
+        results = []
+        self._send(1, results)
+        self._finish()
+        self.assertEqual(results, [QUEUED])
+        self.assertFalse(self.pool._free.get(CMSHCI_AIEP_WPN_GEO_WAYPOINTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
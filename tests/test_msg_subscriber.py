@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+test_msg_subscriber.py
+키 토픽 coalescing take 검증 (loopback transport)
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import unittest
+from types import SimpleNamespace
+
+from Communication.aiep_types import AIEP_WPN_CTRL_STATUS_INFO
+from Communication.aiep_msg_subscriber import MySubscriber
+
+TOPIC = "AIEP_WPN_CTRL_STATUS_INFO"
+VALID = SimpleNamespace(valid=True)
+DISPOSED = SimpleNamespace(valid=False)
+
+
+class _FakeReader:
+    """take() 만 제공하는 reader 대체 (수신 순서대로 (data, info) 반환)."""
+
+    topic_name = TOPIC
+
+    def __init__(self, pairs):
+        self.pairs = list(pairs)
+
+    def take(self):
+        pairs, self.pairs = self.pairs, []
+        return pairs
+
+
+def _status(tube_num, state):
+    return AIEP_WPN_CTRL_STATUS_INFO(eTubeNum=tube_num, eCtrlState=state)
+
+
+class CoalescingTakeTest(unittest.TestCase):
+
+    def setUp(self):
+        MySubscriber.store.clear()
+        MySubscriber.skipped_samples[TOPIC] = 0
+        self.decoded = []
+        self.decoder = MySubscriber.decoders[TOPIC]
+
+        def record(sample):
+            self.decoded.append(sample)
+            self.decoder(sample)
+        MySubscriber.decoders[TOPIC] = record
+
+    def tearDown(self):
+        MySubscriber.decoders[TOPIC] = self.decoder
+
+    def test_newest_sample_per_key_in_last_occurrence_order(self):
+        reader = _FakeReader([
+            (_status(1, 1), VALID),
+            (_status(2, 1), VALID),
+            (None, DISPOSED),
+            (_status(1, 2), VALID),
+        ])
+        self.assertEqual(MySubscriber.process_data(reader), 4)
+        # tube 2 의 마지막 수신이 tube 1 보다 앞이므로 tube 2 가 먼저 decode
+        self.assertEqual([(s.eTubeNum, s.eCtrlState) for s in self.decoded], [(2, 1), (1, 2)])
+        self.assertEqual(MySubscriber.skipped_samples[TOPIC], 1)
+
+    def test_status_info_is_stored_per_tube(self):
+        MySubscriber.process_data(_FakeReader([(_status(1, 3), VALID), (_status(2, 4), VALID)]))
+        self.assertEqual(MySubscriber.store.get_value(TOPIC, 1).eCtrlState, 3)
+        self.assertEqual(MySubscriber.store.get_value(TOPIC, 2).eCtrlState, 4)
+        self.assertIsNone(MySubscriber.store.get(TOPIC, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+test_plan_model.py
+PlanModel 메시지 변환 (from_message / to_message), 편집, enum 값 검사 검증 (loopback transport)
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Sequence
+
+import numpy as np
+
+from Communication.aiep_loopback_types import int16, uint16, float64, char, enum
+from Communication import aiep_plan_model
+from Communication.aiep_plan_model import (PlanModel, PLAN_LISTS, PLANS_PER_LIST, OWNSHIP_WAYPOINTS, check_plan_enum,
+                                           _struct_schema, _read_columns, _build_objects)
+from Communication.aiep_types import AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST, CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST
+
+
+def make_plan_list(count=3):
+    """앞의 count 개 목록을 채운 ALL_PLAN_LIST 샘플"""
+    sample = AIEP_CMSHCI_M_MINE_ALL_PLAN_LIST()
+    sample.usPlanListCnt = count
+    for list_index in range(count):
+        plan_list = sample.stMinePlanList[list_index]
+        plan_list.chDescription[:4] = list(f"L{list_index:02d}".encode()) + [0]
+        plan_list.sListID = list_index + 1
+        plan_list.usOwnshipWaypointCnt = 2
+        for wp_index in range(2):
+            wp = plan_list.stOwnshipWaypoint[wp_index]
+            wp.dLatitude, wp.dLongitude, wp.usListID = 35.0 + wp_index, 128.0, list_index + 1
+        plan = plan_list.stPlan[0]
+        plan.sListID, plan.usDroppingPlanNumber, plan.usWaypointCnt = list_index + 1, 1, 1
+        plan.cAdditionalText[:5] = list(b"note") + [0]
+        plan.stWaypoint[0].dLatitude = 36.0 + list_index
+    return sample
+
+
+def plan_list_fields(plan_list):
+    """비교용: 목록 객체의 주요 필드"""
+    plan = plan_list.stPlan[0]
+    return (list(plan_list.chDescription), plan_list.sListID, plan_list.usOwnshipWaypointCnt,
+            [wp.dLatitude for wp in plan_list.stOwnshipWaypoint],
+            plan.sListID, plan.usDroppingPlanNumber, list(plan.cAdditionalText), plan.stWaypoint[0].dLatitude)
+
+
+class Color(IntEnum):
+    RED = 0
+    BLUE = 1
+
+
+@dataclass
+class _Point:
+    sX: int16 = 0
+    eColor: enum = Color.RED
+
+
+@dataclass
+class _Shape:
+    usCnt: uint16 = 0
+    dScale: float64 = 0.0
+    chName: Sequence[char] = field(default_factory=lambda: [0] * 4)
+    stPoint: Sequence[_Point] = field(default_factory=lambda: [_Point() for _ in range(2)])
+
+
+class PlanModelMessageTest(unittest.TestCase):
+
+    def test_round_trip_keeps_every_list(self):
+        source = make_plan_list()
+        message = PlanModel.from_message(source).to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+        self.assertEqual(message.usPlanListCnt, 3)
+        self.assertEqual(len(message.stMinePlanList), PLAN_LISTS)
+        for sent, received in zip(message.stMinePlanList, source.stMinePlanList):
+            self.assertEqual(plan_list_fields(sent), plan_list_fields(received))
+
+    def test_to_message_rebuilds_only_edited_lists(self):
+        source = make_plan_list()
+        model = PlanModel.from_message(source)
+        model.set_list_name(1, "edited")
+        model.plan(2, 0)["usWeaponID"] = 7
+        message = model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+        # 그대로인 목록은 받은 객체 재사용, 바뀐 목록은 새 객체 (받은 샘플은 수정하지 않음)
+        self.assertIs(message.stMinePlanList[0], source.stMinePlanList[0])
+        self.assertIsNot(message.stMinePlanList[1], source.stMinePlanList[1])
+        self.assertEqual(bytes(message.stMinePlanList[1].chDescription[:6]), b"edited")
+        self.assertEqual(message.stMinePlanList[2].stPlan[0].usWeaponID, 7)
+        self.assertEqual(source.stMinePlanList[2].stPlan[0].usWeaponID, 0)
+        again = model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+        self.assertIs(again.stMinePlanList[1], message.stMinePlanList[1])
+
+    def test_reopening_the_same_sample_copies_the_stored_array(self):
+        source = make_plan_list()
+        first = PlanModel.from_message(source)
+        first.set_list_name(0, "edited")
+        first.plan(1, 0)["usWeaponID"] = 7
+        # 같은 샘플로 다시 열면 보관한 배열 복사 (이전 모델의 편집은 반영되지 않음)
+        second = PlanModel.from_message(source)
+        self.assertEqual(second.list_name(0), "L00")
+        self.assertEqual(second.plan(1, 0)["usWeaponID"], 0)
+        self.assertIs(second.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST).stMinePlanList[0], source.stMinePlanList[0])
+        other = make_plan_list(count=1)
+        self.assertEqual(PlanModel.from_message(other).list_names()[:2], ["L00", ""])
+
+    def test_enum_fields_are_written_through_the_enum_type(self):
+        schema = _struct_schema(_Shape)
+        self.assertEqual(schema.dtype["chName"].shape, (4,))
+        self.assertEqual(schema.dtype["stPoint"].base["eColor"], np.dtype("i4"))
+        shapes = [_Shape(usCnt=2, dScale=0.5, chName=list(b"ab\0\0"), stPoint=[_Point(3, Color.BLUE), _Point()])]
+        values = np.zeros(1, schema.dtype)
+        _read_columns(shapes, schema, values)
+        built = _build_objects(values, schema)
+        self.assertEqual(built, shapes)
+        self.assertIs(type(built[0].stPoint[0].eColor), Color)
+
+
+class PlanModelEditTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = PlanModel.from_message(make_plan_list())
+
+    def test_empty_masks_and_counts(self):
+        self.assertEqual(self.model.first_empty_list(), 3)
+        self.assertEqual(self.model.valid_plan_counts()[:4].tolist(), [1, 1, 1, 0])
+        self.assertEqual(self.model.first_empty_plan(0), 1)
+
+    def test_insert_list_shifts_following_lists(self):
+        self.model.insert_list(1, "new")
+        self.assertEqual(self.model.list_names()[:4], ["L00", "new", "L01", "L02"])
+        self.assertEqual(self.model.list_field("sListID")[:4].tolist(), [1, 0, 2, 3])
+        self.assertEqual(self.model.plan(2, 0)["stWaypoint"][0]["dLatitude"], 37.0)
+        self.assertEqual(self.model.plan_texts(1)[0], "")
+        self.assertEqual(self.model.reorder_list_ids(), 4)
+        self.assertEqual(self.model.list_field("sListID")[:5].tolist(), [1, 2, 3, 4, 0])
+
+    def test_delete_list_pulls_following_lists_forward(self):
+        self.model.delete_list(0)
+        self.assertEqual(self.model.list_names()[:3], ["L01", "L02", ""])
+        self.assertEqual(self.model.ownship_waypoints(1)["usListID"][0], 3)
+        self.assertEqual(self.model.reorder_list_ids(), 2)
+        message = self.model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+        self.assertEqual([plan_list.sListID for plan_list in message.stMinePlanList[:3]], [1, 2, 0])
+        self.assertEqual(message.stMinePlanList[0].stPlan[0].stWaypoint[0].dLatitude, 37.0)
+        self.assertEqual(message.stMinePlanList[PLAN_LISTS - 1].usOwnshipWaypointCnt, 0)
+
+    def test_insert_and_delete_move_only_the_slot_order(self):
+        source = make_plan_list()
+        model = PlanModel.from_message(source)
+        model.insert_list(0, "new")
+        self.assertEqual(model.order[:4].tolist(), [PLAN_LISTS - 1, 0, 1, 2])
+        model.delete_list(2)
+        self.assertEqual(model.order[:3].tolist(), [PLAN_LISTS - 1, 0, 2])
+        self.assertEqual(model.order[-1], 1)
+        self.assertEqual(sorted(model.order.tolist()), list(range(PLAN_LISTS)))
+        # 옮겨진 목록도 내용이 그대로면 받은 객체 재사용
+        message = model.to_message(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+        self.assertIs(message.stMinePlanList[1], source.stMinePlanList[0])
+        self.assertIs(message.stMinePlanList[2], source.stMinePlanList[2])
+        self.assertEqual(bytes(message.stMinePlanList[0].chDescription[:3]), b"new")
+
+    def test_delete_waypoints(self):
+        self.model.delete_ownship_waypoint(0, 0)
+        waypoints = self.model.ownship_waypoints(0)
+        self.assertEqual(self.model.list_slot(0)["usOwnshipWaypointCnt"], 1)
+        self.assertEqual(waypoints["dLatitude"][:2].tolist(), [36.0, 0.0])
+        self.assertEqual(len(waypoints), OWNSHIP_WAYPOINTS)
+        self.model.delete_plan_waypoint(1, 0, 0)
+        self.assertEqual(self.model.plan(1, 0)["usWaypointCnt"], 0)
+        self.assertEqual(self.model.plan(1, 0)["stWaypoint"][0]["dLatitude"], 0.0)
+        self.assertEqual(len(self.model.list_plans(1)), PLANS_PER_LIST)
+
+
+
+class PlanEnumValidationTest(unittest.TestCase):
+    """생성 타입의 IntEnum 필드에 정의되지 않은 값 (편집 창 입력 검사, 송신 실패 처리)"""
+
+    def test_undefined_enum_value_is_rejected_on_apply(self):
+        with mock.patch.dict(aiep_plan_model._PLAN_ENUMS, {"ePlanState": Color}):
+            self.assertEqual(check_plan_enum("ePlanState", 1), 1)
+            with self.assertRaises(ValueError):
+                check_plan_enum("ePlanState", 5)
+        self.assertEqual(check_plan_enum("usWeaponID", 5), 5)
+
+    def test_undefined_enum_value_fails_to_build(self):
+        schema = _struct_schema(_Point)
+        values = np.zeros(1, schema.dtype)
+        values["eColor"] = 5
+        with self.assertRaises(ValueError):
+            _build_objects(values, schema)
+
+    def test_save_reports_message_build_error(self):
+        from Windows.Show_M_MINE_DroppingPlan import DroppingPlanListWindow
+        window = SimpleNamespace(_reorder_list_ids=lambda: None, publisher=mock.Mock(),
+                                 model=mock.Mock(**{"to_message.side_effect": ValueError("5 is not a valid Color")}))
+        with mock.patch("Windows.Show_M_MINE_DroppingPlan.messagebox") as messagebox:
+            DroppingPlanListWindow._save_and_send(window)
+        messagebox.showerror.assert_called_once()
+        self.assertIn("5 is not a valid Color", messagebox.showerror.call_args[0][1])
+        window.publisher.publish_async.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
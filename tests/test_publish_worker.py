@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+test_publish_worker.py
+PublishWorker 합치기 (SUPERSEDED), 큐 가득 참 (DROPPED), 전송 예외 (FAILED) 검증
+"""
+
+import threading
+import unittest
+from types import SimpleNamespace
+
+from Communication.aiep_publish_worker import PublishWorker, SENT, QUEUED, SUPERSEDED, DROPPED, FAILED
+
+TIMEOUT = 5.0
+
+
+class _BlockingPublish:
+    """publish(message_name, sample) 대체: release() 전까지 첫 write 를 붙잡아 큐에 샘플이 쌓이게 함."""
+
+    def __init__(self, result=True, error=None):
+        self.result = result
+        self.error = error
+        self.written = []
+        self.started = threading.Event()
+        self._release = threading.Event()
+
+    def release(self):
+        self._release.set()
+
+    def __call__(self, message_name, sample):
+        self.started.set()
+        self._release.wait(TIMEOUT)
+        self.written.append((message_name, sample))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class PublishWorkerTest(unittest.TestCase):
+
+    def _worker(self, publish, **kwargs):
+        worker = PublishWorker(publish, publish_batch=publish, **kwargs)
+        self.addCleanup(worker.stop, TIMEOUT)
+        self.addCleanup(publish.release)
+        return worker
+
+    def _occupy(self, worker, publish):
+        # 첫 샘플을 write 중으로 만들어 이후 샘플은 큐에 남도록
+        worker.submit("TEWA_ASSIGN_CMD", "busy")
+        self.assertTrue(publish.started.wait(TIMEOUT))
+
+    def test_keyed_state_messages_are_coalesced(self):
+        publish = _BlockingPublish()
+        worker = self._worker(publish)
+        self._occupy(worker, publish)
+        results = []
+        for tube, state in ((1, "a"), (2, "b"), (1, "c")):
+            sample = SimpleNamespace(eTubeNum=tube, state=state)
+            worker.submit("TEWA_WA_TUBE_LOAD_INFO", sample, lambda status, error, s=state: results.append((s, status)))
+        publish.release()
+        self.assertTrue(worker.wait_idle(TIMEOUT))
+
+        self.assertEqual([(name, getattr(sample, "state", sample)) for name, sample in publish.written],
+                         [("TEWA_ASSIGN_CMD", "busy"), ("TEWA_WA_TUBE_LOAD_INFO", "c"), ("TEWA_WA_TUBE_LOAD_INFO", "b")])
+        self.assertEqual(sorted(results), [("a", SUPERSEDED), ("b", SENT), ("c", SENT)])
+        self.assertEqual((worker.sent, worker.superseded, worker.dropped), (3, 1, 0))
+
+    def test_command_messages_are_not_coalesced(self):
+        publish = _BlockingPublish()
+        worker = self._worker(publish)
+        self._occupy(worker, publish)
+        worker.submit("TEWA_ASSIGN_CMD", 1)
+        worker.submit("TEWA_ASSIGN_CMD", 2)
+        publish.release()
+        self.assertTrue(worker.wait_idle(TIMEOUT))
+        self.assertEqual([sample for _, sample in publish.written], ["busy", 1, 2])
+
+    def test_full_queue_drops_new_samples(self):
+        publish = _BlockingPublish()
+        worker = self._worker(publish, maxsize=1)
+        self._occupy(worker, publish)
+        results = []
+        self.assertTrue(worker.submit("TEWA_ASSIGN_CMD", 1, lambda status, error: results.append(status)))
+        self.assertFalse(worker.submit("TEWA_ASSIGN_CMD", 2, lambda status, error: results.append(status)))
+        self.assertEqual(results, [DROPPED])
+        publish.release()
+        self.assertTrue(worker.wait_idle(TIMEOUT))
+        self.assertEqual(results, [DROPPED, SENT])
+        self.assertEqual(worker.dropped, 1)
+
+    def test_publish_error_reports_failed(self):
+        error = RuntimeError("write failed")
+        publish = _BlockingPublish(error=error)
+        publish.release()
+        worker = self._worker(publish)
+        results = []
+        worker.submit("TEWA_ASSIGN_CMD", 1, lambda status, err: results.append((status, err)))
+        self.assertTrue(worker.wait_idle(TIMEOUT))
+        self.assertEqual(results, [(FAILED, error)])
+        self.assertEqual(worker.sent, 0)
+
+    def test_not_ready_reports_queued_and_batches_complete_once(self):
+        publish = _BlockingPublish(result=False)
+        publish.release()
+        worker = self._worker(publish)
+        results = []
+        worker.submit_batch("TEWA_WA_TUBE_LOAD_INFO", [1, 2, 3], lambda status, error: results.append(status))
+        self.assertTrue(worker.wait_idle(TIMEOUT))
+        self.assertEqual(results, [QUEUED])
+        self.assertEqual(publish.written, [("TEWA_WA_TUBE_LOAD_INFO", [1, 2, 3])])
+
+    def test_stop_finishes_queued_samples(self):
+        publish = _BlockingPublish()
+        worker = self._worker(publish)
+        self._occupy(worker, publish)
+        worker.submit("TEWA_ASSIGN_CMD", 1)
+        publish.release()
+        worker.stop(TIMEOUT)
+        self.assertEqual(worker.pending_count(), 0)
+        self.assertEqual([sample for _, sample in publish.written], ["busy", 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+test_state_store.py
+StateStore version / changed_since / clear 통지 검증
+"""
+
+import unittest
+
+from Communication.aiep_state_store import StateStore
+
+
+class StateStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = StateStore()
+
+    def test_put_bumps_version_per_write(self):
+        self.assertEqual(self.store.version, 0)
+        self.assertEqual(self.store.put("PA", None, "a"), 1)
+        self.assertEqual(self.store.put("TUBE", 1, "b"), 2)
+        self.assertEqual(self.store.version, 2)
+        self.assertEqual(self.store.get("PA").version, 1)
+        self.assertEqual(self.store.get_value("TUBE", 1), "b")
+        self.assertEqual(self.store.get_value("TUBE", 2, "none"), "none")
+
+    def test_changed_since_returns_only_newer_entries(self):
+        self.store.put("PA", None, "a")
+        seen = self.store.version
+        self.store.put("TUBE", 1, "b")
+        self.store.put("TUBE", 2, "c")
+        changed = self.store.changed_since(seen)
+        self.assertEqual(set(changed), {("TUBE", 1), ("TUBE", 2)})
+        self.assertEqual(self.store.changed_since(self.store.version), {})
+        self.assertEqual(set(self.store.changed_since(0, topic="PA")), {("PA", None)})
+
+    def test_snapshot_is_not_affected_by_later_writes(self):
+        self.store.put("PA", None, "a")
+        snapshot = self.store.snapshot()
+        self.store.put("PA", None, "b")
+        self.assertEqual(snapshot[("PA", None)].value, "a")
+        self.assertEqual(self.store.get_value("PA"), "b")
+
+    def test_change_queue_receives_every_write(self):
+        changes = self.store.subscribe_changes()
+        self.store.put("TUBE", 1, "a")
+        self.store.put("TUBE", 1, "b")
+        self.assertEqual([changes.get_nowait(), changes.get_nowait()], [("TUBE", 1), ("TUBE", 1)])
+        self.assertTrue(changes.empty())
+
+    def test_clear_is_a_versioned_write(self):
+        changes = self.store.subscribe_changes()
+        self.store.put("PA", None, "a")
+        self.store.put("TUBE", 1, "b")
+        seen = self.store.version
+        while not changes.empty():
+            changes.get_nowait()
+
+        version = self.store.clear()
+        self.assertEqual(version, seen + 1)
+        self.assertEqual(self.store.version, version)
+        self.assertEqual(len(self.store.snapshot()), 0)
+        self.assertIsNone(self.store.get("PA"))
+
+        removed = self.store.changed_since(seen)
+        self.assertEqual(set(removed), {("PA", None), ("TUBE", 1)})
+        self.assertTrue(all(entry.value is None and entry.version == version for entry in removed.values()))
+        self.assertEqual({changes.get_nowait(), changes.get_nowait()}, {("PA", None), ("TUBE", 1)})
+        self.assertTrue(changes.empty())
+
+    def test_clear_on_empty_store_is_a_no_op(self):
+        self.assertEqual(self.store.clear(), 0)
+        self.assertEqual(self.store.version, 0)
+
+    def test_put_after_clear_replaces_removal(self):
+        self.store.put("PA", None, "a")
+        self.store.clear()
+        seen = self.store.version
+        self.store.put("PA", None, "b")
+        changed = self.store.changed_since(0)
+        self.assertEqual(changed[("PA", None)].value, "b")
+        self.assertEqual(set(self.store.changed_since(seen)), {("PA", None)})
+
+
+if __name__ == "__main__":
+    unittest.main()
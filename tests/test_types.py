@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+test_types.py
+메시지 타입 필드 정보 (field_types) 검증 (loopback transport)
+"""
+
+import os
+os.environ.setdefault("AIEP_TRANSPORT", "loopback")
+
+import unittest
+
+from Communication.aiep_types import (FieldType, field_types, ST_M_MINE_PLAN_INFO, ST_M_MINE_PLAN_OWNSHIP_WAYPOINT,
+                                      CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)
+
+
+class FieldTypesTest(unittest.TestCase):
+
+    def test_primitive_widths_and_enums(self):
+        fields = field_types(ST_M_MINE_PLAN_INFO)
+        self.assertEqual(fields["sListID"], FieldType("i2"))
+        self.assertEqual(fields["usDroppingPlanNumber"], FieldType("u2"))
+        self.assertEqual(fields["ePlanState"], FieldType("i4", True))
+        self.assertEqual(fields["cAdditionalText"], FieldType("u1"))  # char 배열은 원소 타입
+
+    def test_struct_members_have_no_dtype(self):
+        self.assertIsNone(field_types(ST_M_MINE_PLAN_INFO)["stWaypoint"].dtype)
+        self.assertIsNone(field_types(CMSHCI_AIEP_M_MINE_EDITED_PLAN_LIST)["stMinePlanList"].dtype)
+
+    def test_fields_follow_declaration_order(self):
+        self.assertEqual(list(field_types(ST_M_MINE_PLAN_OWNSHIP_WAYPOINT)),
+                         ["dLatitude", "dLongitude", "fDepth", "fSpeed", "fHeading", "bLaunchPoint", "usListID"])
+
+
+if __name__ == "__main__":
+    unittest.main()